@@ -1,31 +1,133 @@
 import requests
 import feedparser
-from bs4 import BeautifulSoup
-import time
-import random
 import config
 import re
+import json
+import html
+import threading
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
 import cloudscraper
 from fake_useragent import UserAgent
-from curl_cffi import requests as cffi_requests
+import batch_scoring
+import html_parsing
+import http_client
+from http_cache import ValidatorCache
+from instrumentation import metrics
+from profiles import load_profiles
+from rate_limiter import HostRateLimiter
 
 class JobAggregator:
-    def __init__(self):
+    def __init__(self, archive=None, replay=None, record_scoring=False, profiles=None):
+        """archive: ResponseArchive that every fetched body is copied into.
+        replay: ReplayArchive to re-parse instead of fetching (no network I/O).
+        record_scoring: keep every scored posting for rescore().
+        profiles: candidates to score for (default: config.PROFILES, see profiles.py).
+        """
         self.jobs = []
-        # Browser-like configuration to avoid detection
-        self.scraper = cloudscraper.create_scraper(
-            browser={
-                'browser': 'chrome',
-                'platform': 'windows',
-                'desktop': True
-            }
-        )
+        self.scored_postings = [] if record_scoring else None
         self.ua = UserAgent()
+        # Per-thread job buffer and cloudscraper session (see _run_source, scraper)
+        self._local = threading.local()
+        # Jobs whose detail page still has to be scraped (see fetch_pending_details)
+        self.pending_details = []
+        # Set while iter_jobs() runs: jobs are also pushed here as they're found
+        self._stream = None
+        self._detail_pool = None
+        # Every posting is scored for each profile; a job is kept if any of
+        # them wants it (see score_job)
+        self.profiles = profiles or load_profiles()
+        self.min_score = min(profile.min_score for profile in self.profiles)
+        # Keyword lists compiled once per profile (see keyword_matcher.py)
+        self.matcher = self.profiles[0].matcher
+        # ETag/Last-Modified validators from earlier runs (see http_cache.py)
+        self.http_cache = ValidatorCache(profiles=self.profiles) if config.HTTP_CACHE_ENABLED else None
+        # Politeness delays are tracked per hostname (see rate_limiter.py)
+        self.rate_limiter = HostRateLimiter(config.HOST_RATE_LIMITS, config.DEFAULT_HOST_RATE_LIMIT)
 
-    def random_sleep(self):
-        """Sleeps for a random amount of time to mimic human behavior."""
-        sleep_time = random.uniform(2.5, 5.5)
-        time.sleep(sleep_time)
+        # Raw-response archive / offline replay (see response_archive.py)
+        self.archive = archive
+        self.replay = replay
+        if replay is not None:
+            # Every fetch is answered from disk: no validators, no politeness delays
+            http_client.set_replay(replay)
+            self.http_cache = None
+            self.rate_limiter = HostRateLimiter({}, {"rate": 1e9, "burst": 1000, "jitter": 0.0})
+        elif archive is not None:
+            http_client.set_archive(archive)
+
+    @property
+    def scraper(self):
+        """This thread's cloudscraper session (or the replay archive).
+
+        requests sessions are not thread-safe, so like http_client's curl
+        sessions every worker thread gets its own.
+        """
+        if self.replay is not None:
+            return self.replay
+        scraper = getattr(self._local, "scraper", None)
+        if scraper is None:
+            # Browser-like configuration to avoid detection
+            scraper = cloudscraper.create_scraper(
+                browser={
+                    'browser': 'chrome',
+                    'platform': 'windows',
+                    'desktop': True
+                }
+            )
+            # Every response is counted in the run report (see instrumentation.py)
+            scraper.hooks["response"].append(metrics.requests_hook)
+            if self.archive is not None:
+                scraper.hooks["response"].append(self.archive.requests_hook)
+            self._local.scraper = scraper
+        return scraper
+
+    def add_job(self, job, deep_scrape=False):
+        """Records a matching job for the source currently running on this thread.
+
+        deep_scrape=True queues the job for the detail-page stage, which fills in
+        salary and location once every listing page has been read.
+        """
+        buffer = getattr(self._local, "jobs", None)
+        if buffer is None:
+            buffer = self.jobs
+        # Boards (validator URLs) this source has read so far, so a job that
+        # couldn't be evaluated can make its board skip the 304 next run
+        board_urls = getattr(self._local, "board_urls", None)
+        if board_urls:
+            job["board_urls"] = list(board_urls)
+        # Which profiles the last score_job on this thread matched, and their scores
+        if len(self.profiles) > 1:
+            job["profile_scores"] = getattr(self._local, "profile_scores", None) or {}
+        buffer.append(job)
+        if self._stream is not None:
+            # Streaming: emit now, or once the detail page has been read
+            if deep_scrape:
+                self._detail_pool.submit(self._fill_and_emit, job)
+            else:
+                self._stream.put(job)
+        elif deep_scrape:
+            self.pending_details.append(job)
+
+    def log(self, message=""):
+        """Prints a line, or buffers it while a source runs (see _run_source).
+
+        Sources run concurrently, so each one's lines are held back and
+        printed when its results are merged, in source order.
+        """
+        buffer = getattr(self._local, "log", None)
+        if buffer is None:
+            print(message)
+        else:
+            buffer.append(message)
+
+    def get_api_headers(self):
+        return {
+            'User-Agent': self.ua.random,
+            'Accept': 'application/json, text/plain, */*',
+            'Accept-Language': 'en-US,en;q=0.5',
+        }
 
     def get_headers(self):
         return {
@@ -37,6 +139,32 @@ class JobAggregator:
             'Upgrade-Insecure-Requests': '1'
         }
 
+    def conditional_get(self, url, headers=None):
+        """GET through the pooled session, sending stored validators.
+
+        Callers should treat status 304 as "unchanged since last run" and skip
+        parsing. Validators from 200 responses are remembered for next time.
+        While archiving no validators are sent: a 304 has no body to archive,
+        and in CI there is no earlier run for replay to take it from.
+        """
+        headers = dict(headers if headers is not None else self.get_headers())
+        if self.http_cache is not None:
+            if self.archive is None:
+                headers.update(self.http_cache.request_headers(url))
+            board_urls = getattr(self._local, "board_urls", None)
+            if board_urls is not None:
+                board_urls.append(url)
+        response = http_client.get(url, headers=headers)
+        if self.http_cache is not None and response.status_code == 200:
+            self.http_cache.store(url, response)
+        return response
+
+    def html_to_text(self, html):
+        """Flattens an HTML fragment (feed/API descriptions) to plain text."""
+        if not html:
+            return ""
+        return html_parsing.make_soup(html).get_text(" ", strip=True)
+
     def extract_salary(self, text):
         """Attempts to extract salary information from text."""
         # Look for patterns like $50k, $100,000, 80-120k, etc.
@@ -47,28 +175,83 @@ class JobAggregator:
             return match.group(1)
         return "Not listed"
 
+    def work_mode(self, text):
+        """Guesses Hybrid / Remote / On-site from posting text ("Unknown" if unclear)."""
+        lowered = text.lower()
+        if "hybrid" in lowered:
+            return "Hybrid"
+        if "remote" in lowered:
+            return "Remote"
+        if "on-site" in lowered or "onsite" in lowered:
+            return "On-site"
+        return "Unknown"
+
+    def salary_from_ld(self, posting):
+        """Formats a JSON-LD baseSalary, or returns None if it isn't usable."""
+        base = posting.get("baseSalary")
+        if not isinstance(base, dict):
+            return None
+        value = base.get("value")
+        if isinstance(value, dict):
+            low = value.get("minValue") or value.get("value")
+            high = value.get("maxValue")
+            unit = (value.get("unitText") or "").lower()
+        else:
+            low, high, unit = value, None, ""
+        try:
+            amounts = [f"${float(v):,.0f}" for v in (low, high) if v]
+        except (TypeError, ValueError):
+            return None
+        if not amounts:
+            return None
+        return " - ".join(amounts) + (f" per {unit}" if unit else "")
+
+    def location_from_ld(self, posting):
+        """City/region from a JSON-LD jobLocation (first one if several)."""
+        places = posting.get("jobLocation")
+        if isinstance(places, list):
+            places = places[0] if places else None
+        if not isinstance(places, dict):
+            return None
+        address = places.get("address")
+        if not isinstance(address, dict):
+            return None
+        parts = [address.get("addressLocality"), address.get("addressRegion")]
+        return ", ".join(p for p in parts if isinstance(p, str) and p) or None
+
     def fetch_job_details(self, url):
         """Fetches the job detail page to extract Salary and Location."""
         try:
-            self.random_sleep()
-            response = self.scraper.get(url, headers=self.get_headers())
+            self.rate_limiter.wait(url)
+            response = self.scraper.get(url, headers=self.get_headers(), timeout=config.HTTP_TIMEOUT)
             if response.status_code != 200:
                 return "Check Listing", "Unknown"
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
+
+            # Fast path: most ATS pages embed a schema.org JobPosting, which
+            # only needs the JSON-LD <script> blocks parsed
+            posting = html_parsing.job_posting_ld(response.content)
+            if posting:
+                description = self.html_to_text(posting.get("description", ""))
+                salary = self.salary_from_ld(posting) or self.extract_salary(description)
+                if posting.get("jobLocationType") == "TELECOMMUTE":
+                    mode = "Remote"
+                else:
+                    mode = self.work_mode(description)
+                place = self.location_from_ld(posting)
+                if place:
+                    return salary, f"{place} ({mode})"
+                if mode != "Unknown":
+                    return salary, mode
+                # Not enough in the JSON-LD - fall through to the full page
+
+            soup = html_parsing.full_soup(response.content)
             text = soup.get_text(" ", strip=True)
             
             # Salary
             salary = self.extract_salary(text)
             
             # Location
-            location = "Unknown"
-            if "hybrid" in text.lower():
-                location = "Hybrid"
-            elif "remote" in text.lower():
-                location = "Remote"
-            elif "on-site" in text.lower() or "onsite" in text.lower():
-                location = "On-site"
+            location = self.work_mode(text)
                 
             # Try to find specific location metadata if possible (Greenhouse/Lever specific)
             # Greenhouse often has <div class="location">
@@ -81,43 +264,108 @@ class JobAggregator:
         except Exception:
             return "Check Listing", "Unknown"
 
-    def score_job(self, title, description):
-        """Calculates a score (0-100+) based on keyword matches."""
+    def fill_job_details(self, job):
+        """Deep-scrapes one queued job and updates its salary/location in place."""
+        with metrics.source("Detail pages"):
+            salary, detailed_loc = self.fetch_job_details(job["url"])
+        job["salary"] = salary
+        # Prefer detailed location if found
+        if detailed_loc != "Unknown":
+            job["location"] = detailed_loc
+
+    def _fill_and_emit(self, job):
+        try:
+            self.fill_job_details(job)
+        finally:
+            self._stream.put(job)
+
+    def fetch_pending_details(self):
+        """Detail-page stage: scrapes every queued job on a bounded worker pool.
+
+        Runs after all listings are collected. The per-host rate limiter still
+        spaces out requests to the same board, so the pool mainly overlaps
+        different hosts (and the download/parse work of each page).
+        """
+        pending, self.pending_details = self.pending_details, []
+        if not pending:
+            return
+        self.log(f"Deep-scraping {len(pending)} job pages for salary/location...")
+        with ThreadPoolExecutor(max_workers=config.DETAIL_FETCH_WORKERS) as pool:
+            list(pool.map(self.fill_job_details, pending))
+
+    def score_job(self, title, description, boost=0):
+        """Calculates a score (0-100+) based on keyword matches.
+
+        boost is the source's bonus, added to every result (disqualified jobs
+        get -1 + boost, as when fetchers added it themselves). With
+        record_scoring on, the inputs are kept in self.scored_postings so the
+        whole scrape can be re-scored in one batch (see batch_scoring.py).
+
+        With several profiles the posting is scored for each one, and the best
+        score among the profiles whose own min_score it reaches is returned
+        (-1 if none); add_job attaches the per-profile scores to the job.
+        """
+        if self.scored_postings is not None:
+            self.scored_postings.append({
+                "title": title, "text": description, "boost": boost, "source": metrics.current_source(),
+            })
+        if len(self.profiles) == 1:
+            score, location_status = self._keyword_score(title, description)
+            return score + boost, location_status
+
+        best = (-1, "N/A")
+        matched = {}
+        for profile in self.profiles:
+            score, location_status = self._keyword_score(title, description, profile.matcher, log=False)
+            score += boost
+            if score >= profile.min_score:
+                matched[profile.name] = score
+                if score > best[0]:
+                    best = (score, location_status)
+        self._local.profile_scores = matched
+        if not matched:
+            # One line per posting, not one per profile
+            for profile in self.profiles:
+                negative = profile.matcher.first_negative(title.lower())
+                if negative:
+                    self.log(f"  [SKIP] Negative Keyword '{negative}': {title}")
+                    break
+        return best
+
+    def _keyword_score(self, title, description, matcher=None, log=True):
+        matcher = matcher or self.matcher
         score = 0
+        title_lower = title.lower()
         text = (title + " " + description).lower()
         
         # Return a tuple: (score, location_status)
         location_status = "Remote"
 
         # Check Negative Keywords first (Immediate Disqualification)
-        for kw in config.NEGATIVE_KEYWORDS:
-            # Use regex for word boundaries to avoid "Intern" matching "International" or "Internal"
-            pattern = r'\b' + re.escape(kw.lower()) + r'\b'
-            if re.search(pattern, title.lower()): 
-                print(f"  [SKIP] Negative Keyword '{kw}': {title}")
-                return -1, "N/A"
+        # Word boundaries avoid "Intern" matching "International" or "Internal"
+        negative = matcher.first_negative(title_lower)
+        if negative:
+            if log:
+                self.log(f"  [SKIP] Negative Keyword '{negative}': {title}")
+            return -1, "N/A"
 
         # Tier 1 Scoring
-        tier1_match = False
-        for kw in config.TIER_1_KEYWORDS:
-            if kw.lower() in text:
-                score += 50 # High value match
-                tier1_match = True
-                # If it's in the title, bonus points
-                if kw.lower() in title.lower():
-                    score += 30
+        tier1_hits = matcher.tier1.find(text)
+        tier1_match = bool(tier1_hits)
+        score += 50 * matcher.tier1.count(tier1_hits) # High value match
+        if tier1_hits:
+            # If it's in the title, bonus points
+            score += 30 * matcher.tier1.count(matcher.tier1.find(title_lower))
 
         # Tier 2 Scoring
-        for kw in config.TIER_2_KEYWORDS:
-            if kw.lower() in text:
-                score += 15
+        score += 15 * matcher.tier2.count(matcher.tier2.find(text))
         
         # CRITICAL FILTER: The "Marketing Trap"
         # REVISED: In Entertainment/Music, "Marketing" is often PR-adjacent (Artist Marketing).
         # We removed the hard block. Instead, we rely on NEGATIVE_KEYWORDS to catch "Growth/Performance" marketing.
         # We also give a score boost to "Marketing" titles to help them pass the strict threshold
         # if they are not explicitly "Growth" or "Digital".
-        if "marketing" in title.lower():
+        if "marketing" in title_lower:
             score += 30 # Treat as a valid keyword, similar to Tier 1, but rely on negatives to filter bad ones.
 
         # STRICTER FILTERING:
@@ -129,12 +377,11 @@ class JobAggregator:
 
         # Location Scoring (Los Angeles / Hybrid)
         la_match = False
-        for loc in config.LOCATIONS:
-            if loc.lower() in text:
-                score += 40 # Big boost for LA based
-                la_match = True
-                location_status = f"📍 {loc} (Likely Hybrid)"
-                break
+        loc = matcher.locations.first(matcher.locations.find(text))
+        if loc:
+            score += 40 # Big boost for LA based
+            la_match = True
+            location_status = f"📍 {loc} (Likely Hybrid)"
         
         if "hybrid" in text:
             if la_match:
@@ -145,28 +392,40 @@ class JobAggregator:
                 # We need to be careful. If it says "Hybrid in New York", we don't want it.
                 # But simple text search might miss "Remote (Hybrid optional)".
                 # For now, we won't penalize, but we won't boost.
-                if "remote" not in title.lower():
+                if "remote" not in title_lower:
                      # If it's Hybrid and NOT LA, and NOT explicitly Remote in title, it might be bad.
                      pass
 
         return score, location_status
 
+    def rescore(self, matcher=None, weights=None):
+        """Re-scores every recorded posting in one vectorised batch.
+
+        Returns batch_scoring.BatchScores aligned with self.scored_postings;
+        use .passing(threshold) and .explain(i) to see what would match.
+        matcher defaults to the first profile's keyword lists.
+        """
+        if self.scored_postings is None:
+            raise ValueError("JobAggregator was created without record_scoring=True")
+        return batch_scoring.score_postings(self.scored_postings, matcher or self.matcher, weights)
+
     def fetch_prsa(self):
-        print("Fetching PRSA (Public Relations Society of America)...")
+        self.log("Fetching PRSA (Public Relations Society of America)...")
         try:
-            response = self.scraper.get(config.URLS["PRSA_Browse"], headers=self.get_headers())
+            response = self.scraper.get(config.URLS["PRSA_Browse"], headers=self.get_headers(), timeout=config.HTTP_TIMEOUT)
             if response.status_code != 200:
-                print(f"  [ERROR] PRSA returned status code: {response.status_code}")
+                self.log(f"  [ERROR] PRSA returned status code: {response.status_code}")
                 return
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Only the anchors are needed, so only the anchors are parsed
+            links = html_parsing.anchors(response.content)
             # Based on debug analysis, PRSA links are direct <a> tags in the browse list
             # We look for links that do NOT start with / (relative) but are job posts?
             # Actually, WebScribble usually puts job links in <h3> or similar.
             # Let's be broad: Any link with text > 10 chars that isn't a nav link.
             
             found_count = 0
-            for link in soup.find_all('a', href=True):
+            for link in links:
                 href = link['href']
                 title = link.get_text().strip()
                 
@@ -183,8 +442,8 @@ class JobAggregator:
                     full_url = f"https://jobs.prsa.org{href}" if href.startswith("/") else href
                     
                     score, loc_status = self.score_job(title, title)
-                    if score >= config.MIN_SCORE_THRESHOLD:
-                        self.jobs.append({
+                    if score >= self.min_score:
+                        self.add_job({
                             "title": title,
                             "company": "See Listing",
                             "url": full_url,
@@ -194,17 +453,17 @@ class JobAggregator:
                             "source": "PRSA Jobcenter"
                         })
                         found_count += 1
-            print(f"  - Found {found_count} matches from PRSA")
+            self.log(f"  - Found {found_count} matches from PRSA")
         except Exception as e:
-            print(f"Error fetching PRSA: {e}")
+            self.log(f"Error fetching PRSA: {e}")
 
     def fetch_themuse(self):
-        print("Fetching The Muse...")
+        self.log("Fetching The Muse...")
         try:
             # The Muse API returns JSON
-            response = self.scraper.get(config.URLS["TheMuse"], headers=self.get_headers())
+            response = self.scraper.get(config.URLS["TheMuse"], headers=self.get_headers(), timeout=config.HTTP_TIMEOUT)
             if response.status_code != 200:
-                print(f"  [ERROR] The Muse returned status code: {response.status_code}")
+                self.log(f"  [ERROR] The Muse returned status code: {response.status_code}")
                 return
 
             data = response.json()
@@ -219,45 +478,44 @@ class JobAggregator:
                 locations = [loc.get("name") for loc in job.get("locations", [])]
                 loc_str = ", ".join(locations)
                 
-                score, loc_status = self.score_job(title, description)
-                
                 # Boost score if it's explicitly in LA from the API data
-                if "Los Angeles" in loc_str:
-                    score += 20
+                la_listed = "Los Angeles" in loc_str
+                score, loc_status = self.score_job(title, description, boost=20 if la_listed else 0)
+                if la_listed:
                     loc_status = "📍 Los Angeles"
 
-                if score >= config.MIN_SCORE_THRESHOLD:
-                    self.jobs.append({
+                if score >= self.min_score:
+                    self.add_job({
                         "title": title,
                         "company": company,
                         "url": url,
                         "score": score,
                         "salary": self.extract_salary(description),
                         "location": loc_status,
+                        "description": self.html_to_text(description),
                         "source": "The Muse"
                     })
                     found_count += 1
-            print(f"  - Found {found_count} matches from The Muse")
+            self.log(f"  - Found {found_count} matches from The Muse")
         except Exception as e:
-            print(f"Error fetching The Muse: {e}")
+            self.log(f"Error fetching The Muse: {e}")
 
     def fetch_odwyers(self):
         if "ODwyers" not in config.URLS:
             return
             
-        print("Fetching O'Dwyer's PR Jobs...")
+        self.log("Fetching O'Dwyer's PR Jobs...")
         try:
-            response = self.scraper.get(config.URLS["ODwyers"], headers=self.get_headers())
+            response = self.scraper.get(config.URLS["ODwyers"], headers=self.get_headers(), timeout=config.HTTP_TIMEOUT)
             if response.status_code != 200:
-                print(f"  [ERROR] O'Dwyer's returned status code: {response.status_code}")
+                self.log(f"  [ERROR] O'Dwyer's returned status code: {response.status_code}")
                 return
 
-            soup = BeautifulSoup(response.content, 'html.parser')
             # O'Dwyer's is a simple table or list. 
             # Looking for <tr> with job details.
             # This is a guess at their structure, usually they have <a> tags with job titles.
             found_count = 0
-            for link in soup.find_all('a', href=True):
+            for link in html_parsing.anchors(response.content):
                 href = link['href']
                 title = link.get_text().strip()
                 
@@ -265,9 +523,9 @@ class JobAggregator:
                 # O'Dwyer's links often look like "job_view.php?job_id=..."
                 if "job_view" in href or "job_id" in href:
                     score, loc_status = self.score_job(title, title)
-                    if score >= config.MIN_SCORE_THRESHOLD:
+                    if score >= self.min_score:
                         full_url = f"https://www.odwyerpr.com/pr_jobs/{href}" if not href.startswith("http") else href
-                        self.jobs.append({
+                        self.add_job({
                             "title": title,
                             "company": "See Listing",
                             "url": full_url,
@@ -277,17 +535,16 @@ class JobAggregator:
                             "source": "O'Dwyer's PR"
                         })
                         found_count += 1
-            print(f"  - Found {found_count} matches from O'Dwyer's")
+            self.log(f"  - Found {found_count} matches from O'Dwyer's")
         except Exception as e:
-            print(f"Error fetching O'Dwyer's: {e}")
+            self.log(f"Error fetching O'Dwyer's: {e}")
 
     def fetch_indeed(self):
-        print("Fetching Indeed (Experimental with curl_cffi)...")
+        self.log("Fetching Indeed (Experimental with curl_cffi)...")
         try:
             # Use curl_cffi with chrome impersonation to bypass TLS fingerprinting
-            response = cffi_requests.get(
+            response = http_client.get(
                 config.URLS["Indeed"], 
-                impersonate="chrome",
                 headers={
                     'User-Agent': self.ua.random,
                     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -297,10 +554,10 @@ class JobAggregator:
             )
             
             if response.status_code != 200:
-                print(f"  [ERROR] Indeed returned status code: {response.status_code}")
+                self.log(f"  [ERROR] Indeed returned status code: {response.status_code}")
                 return
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = html_parsing.full_soup(response.content)
             found_count = 0
             
             # Indeed structure is complex and changes often.
@@ -334,14 +591,12 @@ class JobAggregator:
                     if location_elem:
                         location = location_elem.get_text().strip()
 
-                score, loc_status = self.score_job(title, title) # Description not available on list view
-                
                 # If location matches our target, boost score
-                if "Los Angeles" in location or "CA" in location:
-                    score += 10
+                boost = 10 if "Los Angeles" in location or "CA" in location else 0
+                score, loc_status = self.score_job(title, title, boost=boost) # Description not available on list view
                     
-                if score >= config.MIN_SCORE_THRESHOLD:
-                    self.jobs.append({
+                if score >= self.min_score:
+                    self.add_job({
                         "title": title,
                         "company": company,
                         "url": full_url,
@@ -352,23 +607,22 @@ class JobAggregator:
                     })
                     found_count += 1
             
-            print(f"  - Found {found_count} matches from Indeed")
+            self.log(f"  - Found {found_count} matches from Indeed")
             
         except Exception as e:
-            print(f"Error fetching Indeed: {e}")
+            self.log(f"Error fetching Indeed: {e}")
 
     def fetch_entertainment_careers(self):
-        print("Fetching EntertainmentCareers.net (Stealth Mode)...")
+        self.log("Fetching EntertainmentCareers.net (Stealth Mode)...")
         try:
             # Use cloudscraper to bypass Cloudflare/403
-            response = self.scraper.get(config.URLS["EntertainmentCareers"], headers=self.get_headers())
+            response = self.scraper.get(config.URLS["EntertainmentCareers"], headers=self.get_headers(), timeout=config.HTTP_TIMEOUT)
             if response.status_code != 200:
-                print(f"  [ERROR] EntertainmentCareers returned status code: {response.status_code}")
+                self.log(f"  [ERROR] EntertainmentCareers returned status code: {response.status_code}")
                 return
 
-            soup = BeautifulSoup(response.content, 'html.parser')
             found_count = 0
-            for link in soup.find_all('a', href=True):
+            for link in html_parsing.anchors(response.content):
                 href = link['href']
                 title = link.get_text().strip()
                 
@@ -377,14 +631,12 @@ class JobAggregator:
                 # We look for "/job/" in the path AND a numeric ID at the end (usually)
                 
                 if "/job/" in href and len(title) > 10:
-                    score, loc_status = self.score_job(title, title) 
-                    
                     # Boost for being on EC.net
-                    score += 10 
+                    score, loc_status = self.score_job(title, title, boost=10)
                     
-                    if score >= config.MIN_SCORE_THRESHOLD:
+                    if score >= self.min_score:
                         full_url = f"https://www.entertainmentcareers.net{href}" if href.startswith("/") else href
-                        self.jobs.append({
+                        self.add_job({
                             "title": title,
                             "company": "See Listing",
                             "url": full_url,
@@ -394,66 +646,136 @@ class JobAggregator:
                             "source": "EntertainmentCareers.net"
                         })
                         found_count += 1
-            print(f"  - Found {found_count} matches from EntertainmentCareers")
+            self.log(f"  - Found {found_count} matches from EntertainmentCareers")
         except Exception as e:
-            print(f"Skipping EntertainmentCareers: {e}")
+            self.log(f"Skipping EntertainmentCareers: {e}")
 
     def fetch_weworkremotely(self):
-        print("Fetching WeWorkRemotely...")
+        self.log("Fetching WeWorkRemotely...")
         # We only use the Management feed now as per config
         urls = [config.URLS["WeWorkRemotely_Management"]]
         for url in urls:
             try:
-                feed = feedparser.parse(url)
+                response = self.conditional_get(url)
+                if response.status_code == 304:
+                    self.log("  - WeWorkRemotely feed unchanged since last run (304), skipping")
+                    continue
+                feed = feedparser.parse(response.content)
                 for entry in feed.entries:
                     score, loc_status = self.score_job(entry.title, entry.description)
-                    if score >= config.MIN_SCORE_THRESHOLD:
-                        self.jobs.append({
+                    if score >= self.min_score:
+                        self.add_job({
                             "title": entry.title,
                             "company": entry.get("author", "Unknown"),
                             "url": entry.link,
                             "score": score,
                             "salary": self.extract_salary(entry.description),
                             "location": loc_status,
+                            "description": self.html_to_text(entry.description),
                             "source": "WeWorkRemotely"
                         })
             except Exception as e:
-                print(f"Error fetching WWR: {e}")
+                self.log(f"Error fetching WWR: {e}")
 
     def fetch_remoteok(self):
-        print("Fetching RemoteOK...")
+        self.log("Fetching RemoteOK...")
         try:
-            feed = feedparser.parse(config.URLS["RemoteOK"])
+            response = self.conditional_get(config.URLS["RemoteOK"])
+            if response.status_code == 304:
+                self.log("  - RemoteOK feed unchanged since last run (304), skipping")
+                return
+            feed = feedparser.parse(response.content)
             for entry in feed.entries:
                 score, loc_status = self.score_job(entry.title, entry.description)
-                if score >= config.MIN_SCORE_THRESHOLD:
-                    self.jobs.append({
+                if score >= self.min_score:
+                    self.add_job({
                         "title": entry.title,
                         "company": entry.get("author", "Unknown"),
                         "url": entry.link,
                         "score": score,
                         "salary": self.extract_salary(entry.description),
                         "location": loc_status,
+                        "description": self.html_to_text(entry.description),
                         "source": "RemoteOK"
                     })
         except Exception as e:
-            print(f"Error fetching RemoteOK: {e}")
+            self.log(f"Error fetching RemoteOK: {e}")
 
     def fetch_greenhouse(self, url, company_name):
-        print(f"Fetching {company_name} (Greenhouse)...")
-        self.random_sleep()
+        """Fetches a Greenhouse board through its JSON board API.
+
+        One request returns every posting with its location and full
+        description, so no detail pages are needed. Boards the API doesn't
+        know fall back to scraping the HTML board (fetch_greenhouse_html).
+        """
+        self.log(f"Fetching {company_name} (Greenhouse)...")
+        board_token = urlparse(url).path.strip("/").split("/")[0]
+        api_url = f"{config.GREENHOUSE_API_BASE}/{board_token}/jobs?content=true"
+        self.rate_limiter.wait(api_url)
         try:
-            # Use curl_cffi to avoid SSL errors and detection
-            response = cffi_requests.get(
-                url, 
-                impersonate="chrome",
-                headers=self.get_headers()
-            )
+            response = self.conditional_get(api_url, headers=self.get_api_headers())
+            if response.status_code == 304:
+                self.log(f"  - {company_name} unchanged since last run (304), skipping")
+                return
+            if response.status_code == 404:
+                self.log(f"  [INFO] {company_name} not on the Greenhouse board API, scraping HTML instead")
+                self.fetch_greenhouse_html(url, company_name)
+                return
+            if response.status_code != 200:
+                self.log(f"  [ERROR] {company_name} returned status code: {response.status_code}")
+                return
+
+            data = response.json()
+            found_count = 0
+
+            for job in data.get("jobs", []):
+                title = (job.get("title") or "").strip()
+                if not title:
+                    continue
+                location_text = (job.get("location") or {}).get("name") or "Unknown"
+                # Greenhouse returns the description as escaped HTML
+                description = self.html_to_text(html.unescape(job.get("content") or ""))
+
+                # Scored on the listing row (title + location) as the HTML board
+                # was; the description only travels with the job to Stage 2
+                full_text = f"{title} {location_text}"
+                # Boost for direct agency match
+                score, loc_status = self.score_job(title, full_text, boost=15)
+
+                if score >= self.min_score:
+                    mode = self.work_mode(f"{location_text} {description}")
+                    location = f"{location_text} ({mode})" if mode != "Unknown" else location_text
+                    self.add_job({
+                        "title": title,
+                        "company": company_name,
+                        "url": job.get("absolute_url") or f"{url.rstrip('/')}/jobs/{job.get('id')}",
+                        "score": score,
+                        "salary": self.extract_salary(description),
+                        "location": location,
+                        "description": description,
+                        "source": f"{company_name} (Direct)"
+                    })
+                    found_count += 1
+            self.log(f"  - Found {found_count} matches from {company_name}")
+
+        except Exception as e:
+            self.log(f"Error fetching {company_name}: {e}")
+
+    def fetch_greenhouse_html(self, url, company_name):
+        """Fallback for boards not served by the JSON API: scrape the board HTML."""
+        self.rate_limiter.wait(url)
+        try:
+            # Use curl_cffi (pooled session) to avoid SSL errors and detection
+            response = self.conditional_get(url)
+            if response.status_code == 304:
+                self.log(f"  - {company_name} unchanged since last run (304), skipping")
+                return
             if response.status_code != 200:
-                print(f"  [ERROR] {company_name} returned status code: {response.status_code}")
+                self.log(f"  [ERROR] {company_name} returned status code: {response.status_code}")
                 return
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # Full tree: the location guess below reads the link's parent element
+            soup = html_parsing.full_soup(response.content)
             found_count = 0
             
             # Greenhouse Structure Analysis (Updated):
@@ -494,58 +816,160 @@ class JobAggregator:
                     else:
                         full_text = title
 
-                    score, loc_status = self.score_job(title, full_text)
-                    
                     # Boost for direct agency match
-                    score += 15
+                    score, loc_status = self.score_job(title, full_text, boost=15)
                     
-                    if score >= config.MIN_SCORE_THRESHOLD:
+                    if score >= self.min_score:
                         # Handle full URLs correctly
                         if href.startswith("http"):
                             full_url = href
                         else:
                             full_url = f"https://boards.greenhouse.io{href}"
-                        
-                        # DEEP SCRAPE: Fetch details for Salary & Better Location
-                        salary, detailed_loc = self.fetch_job_details(full_url)
-                        
-                        # Prefer detailed location if found
-                        final_loc = detailed_loc if detailed_loc != "Unknown" else loc_status
 
-                        self.jobs.append({
+                        # DEEP SCRAPE: Salary & better location are filled in later
+                        # by fetch_pending_details
+                        self.add_job({
                             "title": title,
                             "company": company_name,
                             "url": full_url,
                             "score": score,
-                            "salary": salary,
-                            "location": final_loc,
+                            "salary": "Check Listing",
+                            "location": loc_status,
                             "source": f"{company_name} (Direct)"
-                        })
+                        }, deep_scrape=True)
                         found_count += 1
-            print(f"  - Found {found_count} matches from {company_name}")
+            self.log(f"  - Found {found_count} matches from {company_name}")
             
         except Exception as e:
-            print(f"Error fetching {company_name}: {e}")
+            self.log(f"Error fetching {company_name}: {e}")
+
+    def fetch_lever_postings(self, api_url):
+        """Pages through a Lever postings API. Returns (status, postings).
+
+        The first page is a conditional GET, so an unchanged board costs one
+        304. Later pages are plain GETs (a 304 there would hide new postings).
+        At most config.LEVER_MAX_PAGES pages are read; a later page that fails
+        is logged and the pages already read are kept.
+        """
+        page_size = config.LEVER_PAGE_SIZE
+        page_url = f"{api_url}?mode=json&skip=0&limit={page_size}"
+        self.rate_limiter.wait(page_url)
+        response = self.conditional_get(page_url, headers=self.get_api_headers())
+        if response.status_code != 200:
+            return response.status_code, []
+        postings = response.json()
+        page = postings
+        for page_number in range(1, config.LEVER_MAX_PAGES):
+            if len(page) < page_size:
+                break
+            page_url = f"{api_url}?mode=json&skip={page_number * page_size}&limit={page_size}"
+            self.rate_limiter.wait(page_url)
+            try:
+                response = http_client.get(page_url, headers=self.get_api_headers())
+                if response.status_code != 200:
+                    self.log(f"  [ERROR] Lever page skip={page_number * page_size} returned status code: {response.status_code}")
+                    break
+                page = response.json()
+            except Exception as e:
+                self.log(f"  [ERROR] Lever page skip={page_number * page_size} failed: {e}")
+                break
+            postings.extend(page)
+        return 200, postings
+
+    def lever_salary(self, posting, description):
+        """Formats Lever's structured salaryRange, falling back to the text."""
+        salary_range = posting.get("salaryRange")
+        if isinstance(salary_range, dict):
+            try:
+                low, high = float(salary_range.get("min")), float(salary_range.get("max"))
+            except (TypeError, ValueError):
+                low = high = None
+            if low and high:
+                interval = str(salary_range.get("interval") or "").replace("-", " ")
+                return f"${low:,.0f} - ${high:,.0f} {interval}".strip()
+        return self.extract_salary(f"{posting.get('salaryDescriptionPlain', '')} {description}")
 
     def fetch_lever(self, url, company_name):
-        print(f"Fetching {company_name} (Lever)...")
-        self.random_sleep()
+        """Fetches a Lever board through its JSON postings API.
+
+        Every posting comes back with its categories (location, team,
+        commitment) and description text, so no detail pages are needed.
+        Boards the API doesn't know fall back to the HTML page (fetch_lever_html).
+        """
+        self.log(f"Fetching {company_name} (Lever)...")
+        board = urlparse(url).path.strip("/").split("/")[0]
+        api_url = f"{config.LEVER_API_BASE}/{board}"
         try:
-            # Use curl_cffi to avoid SSL errors and detection
-            response = cffi_requests.get(
-                url, 
-                impersonate="chrome",
-                headers=self.get_headers()
-            )
+            status, postings = self.fetch_lever_postings(api_url)
+            if status == 304:
+                self.log(f"  - {company_name} unchanged since last run (304), skipping")
+                return
+            if status == 404:
+                self.log(f"  [INFO] {company_name} not on the Lever postings API, scraping HTML instead")
+                self.fetch_lever_html(url, company_name)
+                return
+            if status != 200:
+                self.log(f"  [ERROR] {company_name} returned status code: {status}")
+                return
+
+            found_count = 0
+            for posting in postings:
+                title = (posting.get("text") or "").strip()
+                if not title:
+                    continue
+                categories = posting.get("categories") or {}
+                location_text = categories.get("location") or "Unknown"
+
+                sections = [posting.get("descriptionPlain", "")]
+                for section in posting.get("lists") or []:
+                    sections.append(section.get("text", ""))
+                    sections.append(self.html_to_text(section.get("content", "")))
+                sections.append(posting.get("additionalPlain", ""))
+                description = " ".join(s.strip() for s in sections if s and s.strip())
+
+                # Scored on title + location as the HTML board was; the
+                # description only travels with the job to Stage 2
+                full_text = f"{title} {location_text}"
+                score, loc_status = self.score_job(title, full_text, boost=15) # Boost
+
+                if score >= self.min_score:
+                    workplace = (posting.get("workplaceType") or "").lower()
+                    mode = {"hybrid": "Hybrid", "remote": "Remote", "onsite": "On-site"}.get(workplace) \
+                        or self.work_mode(f"{location_text} {description}")
+                    location = f"{location_text} ({mode})" if mode != "Unknown" else location_text
+                    self.add_job({
+                        "title": title,
+                        "company": company_name,
+                        "url": posting.get("hostedUrl") or f"{url.rstrip('/')}/{posting.get('id')}",
+                        "score": score,
+                        "salary": self.lever_salary(posting, description),
+                        "location": location,
+                        "description": description,
+                        "source": f"{company_name} (Direct)"
+                    })
+                    found_count += 1
+            self.log(f"  - Found {found_count} matches from {company_name}")
+
+        except Exception as e:
+            self.log(f"Error fetching {company_name}: {e}")
+
+    def fetch_lever_html(self, url, company_name):
+        """Fallback for boards not served by the postings API: scrape the board HTML."""
+        self.rate_limiter.wait(url)
+        try:
+            # Use curl_cffi (pooled session) to avoid SSL errors and detection
+            response = self.conditional_get(url)
+            if response.status_code == 304:
+                self.log(f"  - {company_name} unchanged since last run (304), skipping")
+                return
             if response.status_code != 200:
-                print(f"  [ERROR] {company_name} returned status code: {response.status_code}")
+                self.log(f"  [ERROR] {company_name} returned status code: {response.status_code}")
                 return
 
-            soup = BeautifulSoup(response.content, 'html.parser')
             found_count = 0
             
-            # Lever usually lists jobs in a.posting-title
-            for link in soup.find_all('a', class_='posting-title'):
+            # Lever usually lists jobs in a.posting-title (title/location are inside the anchor)
+            for link in html_parsing.anchors(response.content, css_class='posting-title'):
                 href = link['href']
                 
                 # Title is in h5 usually
@@ -558,81 +982,151 @@ class JobAggregator:
                 
                 full_text = f"{title} {location_text}"
                 
-                score, loc_status = self.score_job(title, full_text)
-                score += 15 # Boost
+                score, loc_status = self.score_job(title, full_text, boost=15) # Boost
                 
-                if score >= config.MIN_SCORE_THRESHOLD:
-                    # DEEP SCRAPE: Fetch details for Salary & Better Location
-                    salary, detailed_loc = self.fetch_job_details(href)
-                    
-                    # Prefer detailed location if found
-                    final_loc = detailed_loc if detailed_loc != "Unknown" else loc_status
-
-                    self.jobs.append({
+                if score >= self.min_score:
+                    # DEEP SCRAPE: Salary & better location are filled in later
+                    # by fetch_pending_details
+                    self.add_job({
                         "title": title,
                         "company": company_name,
                         "url": href,
                         "score": score,
-                        "salary": salary,
-                        "location": final_loc,
+                        "salary": "Check Listing",
+                        "location": loc_status,
                         "source": f"{company_name} (Direct)"
-                    })
+                    }, deep_scrape=True)
                     found_count += 1
-            print(f"  - Found {found_count} matches from {company_name}")
+            self.log(f"  - Found {found_count} matches from {company_name}")
             
         except Exception as e:
-            print(f"Error fetching {company_name}: {e}")
+            self.log(f"Error fetching {company_name}: {e}")
+
+    def fetch_workday_page(self, api_url, offset, search_text=None, cookies=None):
+        """Fetches one page of a Workday jobs API. Returns the parsed JSON or None.
 
-    def fetch_workday(self, api_url, company_name, base_url):
-        """Fetches jobs from Workday-based career sites (Disney, Condé Nast, etc.)."""
-        print(f"Fetching {company_name} (Workday)...")
-        self.random_sleep()
+        A failed page (timeout, bad JSON) is logged and returns None, so the
+        pages already fetched for the company are kept.
+        """
+        self.rate_limiter.wait(api_url)
+        headers = {
+            'Accept': 'application/json, text/plain, */*',
+            'Content-Type': 'application/json',
+        }
+        # Note: Some Workday sites have issues with limit > 20
+        payload = {'appliedFacets': {}, 'limit': config.WORKDAY_PAGE_SIZE, 'offset': offset}
+        if search_text:
+            payload['searchText'] = search_text
         try:
-            import json as json_lib
-            
-            # Workday requires a session-based approach:
-            # 1. Visit the main careers page first to get cookies
-            # 2. Then make the API call with those cookies
-            session = cffi_requests.Session(impersonate="chrome")
-            
-            # Step 1: Get cookies from main page
-            session.get(base_url, timeout=15)
-            
-            # Step 2: Make API call
-            headers = {
-                'Accept': 'application/json, text/plain, */*',
-                'Content-Type': 'application/json',
-            }
-            # Note: Some Workday sites have issues with limit > 20
-            payload = json_lib.dumps({'limit': 20, 'offset': 0})
-            
-            response = session.post(
+            response = http_client.post(
                 api_url,
                 headers=headers,
-                data=payload,
-                timeout=15
+                data=json.dumps(payload),
+                cookies=cookies
             )
-            
             if response.status_code != 200:
-                print(f"  [ERROR] {company_name} returned status code: {response.status_code}")
-                return
+                self.log(f"  [ERROR] Workday page offset={offset} returned status code: {response.status_code}")
+                return None
+            return response.json()
+        except Exception as e:
+            self.log(f"  [ERROR] Workday page offset={offset} failed: {e}")
+            return None
+
+    def fetch_workday_postings(self, api_url, search_text=None, cookies=None):
+        """Fetches every page of a Workday search.
+
+        The first page tells us the total (later pages report 0), the rest are
+        fetched concurrently on the worker threads' pooled sessions.
+        """
+        first = self.fetch_workday_page(api_url, 0, search_text, cookies)
+        if first is None:
+            return None
+        postings = first.get("jobPostings", [])
+        total = first.get("total", len(postings))
+        page_size = config.WORKDAY_PAGE_SIZE
+        last_offset = min(total, page_size * config.WORKDAY_MAX_PAGES)
+        offsets = list(range(page_size, last_offset, page_size))
+        if offsets:
+            source = metrics.current_source()
+            log = getattr(self._local, "log", None)
+
+            def fetch_page(offset):
+                # Page workers log into the source's buffer (see _run_source)
+                self._local.log = log
+                try:
+                    with metrics.attribute_to(source):
+                        return self.fetch_workday_page(api_url, offset, search_text, cookies)
+                finally:
+                    self._local.log = None
+
+            with ThreadPoolExecutor(max_workers=config.WORKDAY_PAGE_WORKERS) as pool:
+                pages = list(pool.map(fetch_page, offsets))
+            # Pages are merged in offset order, whatever order they finished in
+            for page in pages:
+                if page:
+                    postings.extend(page.get("jobPostings", []))
+        return postings
+
+    def fetch_workday(self, api_url, company_name, base_url, search_text=None):
+        """Fetches jobs from Workday-based career sites (Disney, Condé Nast, etc.).
+
+        search_text may be a string or a list of strings; each one runs as a
+        separate server-side search and the results are merged. Without it the
+        whole catalogue is paged through (up to config.WORKDAY_MAX_PAGES).
+        """
+        self.log(f"Fetching {company_name} (Workday)...")
+        self.rate_limiter.wait(base_url or api_url)
+        try:
+            # Workday requires a session-based approach:
+            # 1. Visit the main careers page first to get cookies
+            # 2. Then make the API calls with those cookies
+            # The pooled session keeps the cookies and the open connection;
+            # page workers on other threads are handed the same cookies.
+            session = http_client.browser_session()
             
-            data = response.json()
+            # Step 1: Get cookies from main page
+            http_client.get(base_url)
+            cookies = session.cookies
+
+            # Step 2: Page through the API (once per search term)
+            if isinstance(search_text, str):
+                searches = [search_text]
+            else:
+                searches = search_text or [None]
+
+            postings = []
+            seen_paths = set()
+            for term in searches:
+                try:
+                    results = self.fetch_workday_postings(api_url, term, cookies)
+                except Exception as e:
+                    # One failed search must not lose the others' postings
+                    self.log(f"  [ERROR] {company_name} search {term!r} failed: {e}")
+                    continue
+                if results is None:
+                    self.log(f"  [ERROR] {company_name} search {term!r} failed")
+                    continue
+                for job in results:
+                    path = job.get("externalPath", "")
+                    if path in seen_paths:
+                        continue
+                    seen_paths.add(path)
+                    postings.append(job)
+
             found_count = 0
             
-            for job in data.get("jobPostings", []):
+            for job in postings:
                 title = job.get("title", "")
                 location_text = job.get("locationsText", "Unknown")
                 external_path = job.get("externalPath", "")
                 
                 full_text = f"{title} {location_text}"
-                score, loc_status = self.score_job(title, full_text)
-                score += 20  # Major entertainment company boost
+                score, loc_status = self.score_job(title, full_text, boost=20)  # Major entertainment company boost
                 
-                if score >= config.MIN_SCORE_THRESHOLD:
+                if score >= self.min_score:
                     full_url = f"{base_url}{external_path}"
                     
-                    self.jobs.append({
+                    self.add_job({
                         "title": title,
                         "company": company_name,
                         "url": full_url,
@@ -643,26 +1137,24 @@ class JobAggregator:
                     })
                     found_count += 1
                     
-            print(f"  - Found {found_count} matches from {company_name}")
+            self.log(f"  - Found {found_count} matches from {company_name} ({len(postings)} postings scanned)")
             
         except Exception as e:
-            print(f"Error fetching {company_name}: {e}")
+            self.log(f"Error fetching {company_name}: {e}")
 
     def fetch_netflix(self, api_url, company_name):
         """Fetches jobs from Netflix's custom career API."""
-        print(f"Fetching {company_name} (Custom API)...")
-        self.random_sleep()
+        self.log(f"Fetching {company_name} (Custom API)...")
+        self.rate_limiter.wait(api_url)
         try:
             # Netflix uses a GET request with limit param
-            response = cffi_requests.get(
-                f"{api_url}?limit=100",
-                impersonate="chrome",
-                headers=self.get_headers(),
-                timeout=15
-            )
+            response = self.conditional_get(f"{api_url}?limit=100")
             
+            if response.status_code == 304:
+                self.log(f"  - {company_name} unchanged since last run (304), skipping")
+                return
             if response.status_code != 200:
-                print(f"  [ERROR] {company_name} returned status code: {response.status_code}")
+                self.log(f"  [ERROR] {company_name} returned status code: {response.status_code}")
                 return
             
             data = response.json()
@@ -677,14 +1169,13 @@ class JobAggregator:
                 department = job.get("department", "")
                 full_text = f"{title} {location_text} {department}"
                 
-                score, loc_status = self.score_job(title, full_text)
-                score += 25  # Netflix is a prime target - big boost
+                score, loc_status = self.score_job(title, full_text, boost=25)  # Netflix is a prime target - big boost
                 
-                if score >= config.MIN_SCORE_THRESHOLD:
+                if score >= self.min_score:
                     # Netflix job URLs follow this pattern
                     full_url = f"https://jobs.netflix.com/jobs/{job_id}"
                     
-                    self.jobs.append({
+                    self.add_job({
                         "title": title,
                         "company": company_name,
                         "url": full_url,
@@ -695,29 +1186,27 @@ class JobAggregator:
                     })
                     found_count += 1
                     
-            print(f"  - Found {found_count} matches from {company_name}")
+            self.log(f"  - Found {found_count} matches from {company_name}")
             
         except Exception as e:
-            print(f"Error fetching {company_name}: {e}")
+            self.log(f"Error fetching {company_name}: {e}")
 
     def fetch_smartrecruiters(self, company_url, company_name):
         """Fetches jobs from SmartRecruiters (NBCUniversal, etc.)."""
-        print(f"Fetching {company_name} (SmartRecruiters)...")
-        self.random_sleep()
+        self.log(f"Fetching {company_name} (SmartRecruiters)...")
         try:
             # SmartRecruiters API endpoint
             company_id = company_url.split('/')[-1]
-            api_url = f"https://api.smartrecruiters.com/v1/companies/{company_id}/postings"
+            api_url = f"{config.SMARTRECRUITERS_API_BASE}/{company_id}/postings"
+            self.rate_limiter.wait(api_url)
             
-            response = cffi_requests.get(
-                api_url,
-                impersonate="chrome",
-                headers=self.get_headers(),
-                timeout=15
-            )
+            response = self.conditional_get(api_url)
             
+            if response.status_code == 304:
+                self.log(f"  - {company_name} unchanged since last run (304), skipping")
+                return
             if response.status_code != 200:
-                print(f"  [ERROR] {company_name} returned status code: {response.status_code}")
+                self.log(f"  [ERROR] {company_name} returned status code: {response.status_code}")
                 return
             
             data = response.json()
@@ -730,13 +1219,12 @@ class JobAggregator:
                 job_id = job.get("id", "")
                 
                 full_text = f"{title} {location_text}"
-                score, loc_status = self.score_job(title, full_text)
-                score += 25  # Major entertainment company boost
+                score, loc_status = self.score_job(title, full_text, boost=25)  # Major entertainment company boost
                 
-                if score >= config.MIN_SCORE_THRESHOLD:
+                if score >= self.min_score:
                     full_url = f"https://jobs.smartrecruiters.com/{company_id}/{job_id}"
                     
-                    self.jobs.append({
+                    self.add_job({
                         "title": title,
                         "company": company_name,
                         "url": full_url,
@@ -747,37 +1235,146 @@ class JobAggregator:
                     })
                     found_count += 1
                     
-            print(f"  - Found {found_count} matches from {company_name}")
+            self.log(f"  - Found {found_count} matches from {company_name}")
             
         except Exception as e:
-            print(f"Error fetching {company_name}: {e}")
+            self.log(f"Error fetching {company_name}: {e}")
 
-    def fetch_ats_sources(self):
-        """Iterates through configured ATS sources."""
+    def ats_tasks(self):
+        """Builds one fetch callable per configured ATS source."""
+        tasks = []
         for source in config.ATS_SOURCES:
+            count = len(tasks)
             if source["type"] == "greenhouse":
-                self.fetch_greenhouse(source["url"], source["name"])
+                tasks.append(lambda s=source: self.fetch_greenhouse(s["url"], s["name"]))
             elif source["type"] == "lever":
-                self.fetch_lever(source["url"], source["name"])
+                tasks.append(lambda s=source: self.fetch_lever(s["url"], s["name"]))
             elif source["type"] == "workday":
-                self.fetch_workday(source["url"], source["name"], source.get("base_url", ""))
+                tasks.append(lambda s=source: self.fetch_workday(s["url"], s["name"], s.get("base_url", ""), s.get("search_text")))
             elif source["type"] == "netflix":
-                self.fetch_netflix(source["url"], source["name"])
+                tasks.append(lambda s=source: self.fetch_netflix(s["url"], s["name"]))
             elif source["type"] == "smartrecruiters":
-                self.fetch_smartrecruiters(source["url"], source["name"])
-
-    def get_jobs(self):
-        self.fetch_prsa()
-        self.fetch_themuse()
-        # self.fetch_indeed() # Disabled: 403 Forbidden (Anti-bot)
-        self.fetch_entertainment_careers()
-        self.fetch_odwyers()
-        self.fetch_ats_sources() # Direct Agency Scraping (Greenhouse, Lever, Workday, Netflix)
-        self.fetch_weworkremotely()
-        # self.fetch_remotive() # Disabled: Too much tech noise
-        # self.fetch_working_nomads() # Disabled: Too much tech noise
-        self.fetch_remoteok()
-        
+                tasks.append(lambda s=source: self.fetch_smartrecruiters(s["url"], s["name"]))
+            if len(tasks) > count:
+                tasks[-1].source_name = source["name"]  # Label for the run report
+        return tasks
+
+    def fetch_ats_sources(self):
+        """Iterates through configured ATS sources."""
+        for task in self.ats_tasks():
+            task()
+
+    def source_tasks(self):
+        """All enabled sources, in the order their results are merged."""
+        return [
+            self.fetch_prsa,
+            self.fetch_themuse,
+            # self.fetch_indeed, # Disabled: 403 Forbidden (Anti-bot)
+            self.fetch_entertainment_careers,
+            self.fetch_odwyers,
+            *self.ats_tasks(), # Direct Agency Scraping (Greenhouse, Lever, Workday, Netflix)
+            self.fetch_weworkremotely,
+            # self.fetch_remotive, # Disabled: Too much tech noise
+            # self.fetch_working_nomads, # Disabled: Too much tech noise
+            self.fetch_remoteok,
+        ]
+
+    def _run_source(self, task):
+        """Runs one source and returns (jobs it found, lines it logged) (thread-safe)."""
+        name = getattr(task, "source_name", None) or task.__name__.replace("fetch_", "")
+        self._local.jobs = []
+        self._local.board_urls = []
+        self._local.log = []
+        try:
+            with metrics.source(name):
+                task()
+            metrics.source_stat(name, "jobs", len(self._local.jobs))
+            return self._local.jobs, self._local.log
+        finally:
+            self._local.jobs = None
+            self._local.board_urls = None
+            self._local.log = None
+
+    def _run_sources(self, tasks, workers):
+        """Runs the sources on a pool and merges jobs and log lines in source order."""
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # map() yields in submission order, so each source's lines are
+            # printed as soon as it and every source before it are done
+            for source_jobs, lines in pool.map(self._run_source, tasks):
+                for line in lines:
+                    print(line)
+                self.jobs.extend(source_jobs)
+
+    def get_jobs(self, concurrent=None):
+        """Fetches every source and returns matches sorted by score.
+
+        With concurrent=True (default: config.CONCURRENT_FETCH) sources run on a
+        thread pool. Each source collects into its own list and the lists are
+        merged in source order, so the result matches the serial run.
+        """
+        if concurrent is None:
+            concurrent = config.CONCURRENT_FETCH
+        tasks = self.source_tasks()
+
+        self._run_sources(tasks, config.MAX_FETCH_WORKERS if concurrent else 1)
+
+        self.fetch_pending_details()
+
+        self._finish_run()
+        return self.jobs
+
+    def iter_jobs(self, concurrent=None):
+        """Yields matching jobs as the sources find them.
+
+        Sources run in a background thread (on the same pool as get_jobs), so
+        the caller can dedupe and evaluate early jobs while slow boards are
+        still loading. Deep-scraped jobs are yielded once their detail page
+        has been read. Order is arrival order; self.jobs ends up sorted and in
+        the same state get_jobs() would leave it.
+        """
+        if concurrent is None:
+            concurrent = config.CONCURRENT_FETCH
+        tasks = self.source_tasks()
+        stream = queue.Queue()
+        done = object()
+
+        def produce():
+            try:
+                with ThreadPoolExecutor(max_workers=config.DETAIL_FETCH_WORKERS) as detail_pool:
+                    self._detail_pool = detail_pool
+                    self._run_sources(tasks, config.MAX_FETCH_WORKERS if concurrent else 1)
+            finally:
+                stream.put(done)
+
+        self._stream = stream
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        try:
+            while True:
+                job = stream.get()
+                if job is done:
+                    break
+                yield job
+        finally:
+            producer.join()
+            self._stream = None
+            self._detail_pool = None
+        self._finish_run()
+
+    def save_http_cache(self, unevaluated=()):
+        """Saves the validators once the run's jobs have been delivered.
+
+        unevaluated: jobs that weren't evaluated and will be retried. Their
+        boards forget their validators, so next run fetches them in full
+        instead of getting a 304 that would hide the job.
+        """
+        if self.http_cache is None:
+            return
+        for job in unevaluated:
+            for url in job.get("board_urls", []):
+                self.http_cache.forget(url)
+        self.http_cache.save()
+
+    def _finish_run(self):
         # Sort by score descending
         self.jobs.sort(key=lambda x: x['score'], reverse=True)
-        return self.jobs
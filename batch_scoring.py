@@ -0,0 +1,210 @@
+# batch_scoring.py
+"""
+Vectorised keyword scoring for many postings at once.
+
+Each keyword list is matched once per posting into a sparse hit matrix
+(postings x keywords). Every score is then a handful of NumPy/SciPy
+operations over those matrices, so re-scoring thousands of archived or
+replayed postings with different weights or thresholds takes milliseconds.
+Scores match JobAggregator.score_job exactly (including the source boost the
+fetchers add on top).
+
+    hits = KeywordHits.build(postings)          # postings: [{"title", "text", "boost"}]
+    result = score_hits(hits)                   # result.scores, .locations
+    result.explain(i)                           # why posting i got its score
+"""
+
+import numpy as np
+from scipy import sparse
+from keyword_matcher import DEFAULT_MATCHER
+
+# Points per hit, as in JobAggregator.score_job
+WEIGHTS = {
+    "tier1": 50,          # per Tier 1 keyword in title + description
+    "tier1_title": 30,    # extra per Tier 1 keyword in the title
+    "tier2": 15,          # per Tier 2 keyword
+    "marketing_title": 30,
+    "location": 40,       # LA-area location found
+    "hybrid_la": 20,      # "hybrid" together with an LA location
+}
+NO_TIER1_MIN_SCORE = 60   # Without a Tier 1 hit, anything below this is dropped
+
+
+def _hit_matrix(keyword_set, texts):
+    """Binary CSR matrix: row per text, column per (lowered, unique) keyword."""
+    columns = {kw: i for i, kw in enumerate(keyword_set.counts)}
+    indptr, indices = [0], []
+    for text in texts:
+        indices.extend(sorted(columns[kw] for kw in keyword_set.find(text)))
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.int32)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(texts), len(columns)), dtype=np.int32)
+
+
+def _negative_matrix(matcher, titles):
+    """Binary CSR matrix of negative keywords (word-bounded) found in each title."""
+    indptr, indices = [0], []
+    for title in titles:
+        if matcher.negative_pattern is not None and matcher.negative_pattern.search(title):
+            indices.extend(i for i, pattern in enumerate(matcher.negative_patterns) if pattern.search(title))
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.int32)
+    shape = (len(titles), len(matcher.negative_keywords))
+    return sparse.csr_matrix((data, indices, indptr), shape=shape, dtype=np.int32)
+
+
+class KeywordHits:
+    """Sparse keyword-hit matrices for a list of postings (built once, scored many times)."""
+
+    def __init__(self, matcher, negative, tier1, tier1_title, tier2, locations,
+                 marketing_title, hybrid, boosts):
+        self.matcher = matcher
+        self.negative = negative
+        self.tier1 = tier1
+        self.tier1_title = tier1_title
+        self.tier2 = tier2
+        self.locations = locations
+        self.marketing_title = marketing_title
+        self.hybrid = hybrid
+        self.boosts = boosts
+
+    @classmethod
+    def build(cls, postings, matcher=None):
+        """postings: dicts with "title", "text" (what score_job got as description) and optional "boost"."""
+        matcher = matcher or DEFAULT_MATCHER
+        titles = [p.get("title", "").lower() for p in postings]
+        texts = [(p.get("title", "") + " " + p.get("text", "")).lower() for p in postings]
+        return cls(
+            matcher,
+            negative=_negative_matrix(matcher, titles),
+            tier1=_hit_matrix(matcher.tier1, texts),
+            tier1_title=_hit_matrix(matcher.tier1, titles),
+            tier2=_hit_matrix(matcher.tier2, texts),
+            locations=_hit_matrix(matcher.locations, texts),
+            marketing_title=np.array(["marketing" in t for t in titles], dtype=bool),
+            hybrid=np.array(["hybrid" in t for t in texts], dtype=bool),
+            boosts=np.array([p.get("boost", 0) for p in postings], dtype=np.int64),
+        )
+
+    def __len__(self):
+        return len(self.boosts)
+
+
+def _weights(keyword_set):
+    """Column weights: how many list entries each unique keyword stands for."""
+    return np.array(list(keyword_set.counts.values()), dtype=np.int64)
+
+
+def _first_in_list(matrix, keyword_set):
+    """Column of the hit that comes first in the keyword list, per row (-1 if none)."""
+    if matrix.shape[1] == 0:
+        return np.full(matrix.shape[0], -1, dtype=np.int64)
+    ranks = np.array([keyword_set.first_index[kw] for kw in keyword_set.counts], dtype=np.int64)
+    big = len(keyword_set.keywords) + 1
+    # Highest (big - rank) among a row's hits = lowest list rank
+    best = np.asarray(matrix.multiply(big - ranks).max(axis=1).todense()).ravel()
+    order = np.argsort(ranks)
+    rank_to_column = np.full(big, -1, dtype=np.int64)
+    rank_to_column[ranks[order]] = order
+    return np.where(best > 0, rank_to_column[np.clip(big - best, 0, big - 1)], -1)
+
+
+class BatchScores:
+    """Scores, location labels and explanations for every posting in a KeywordHits."""
+
+    def __init__(self, hits, scores, disqualified, location_columns, weights):
+        self.hits = hits
+        self.scores = scores
+        self.disqualified = disqualified
+        self.location_columns = location_columns
+        self.weights = weights
+        self._location_names = list(hits.matcher.locations.counts)
+
+    @property
+    def locations(self):
+        """location_status strings, as score_job returns them."""
+        return [self.location_status(i) for i in range(len(self.scores))]
+
+    def location_status(self, i):
+        if self.disqualified[i]:
+            return "N/A"
+        column = self.location_columns[i]
+        if column < 0:
+            return "Remote"
+        keyword_set = self.hits.matcher.locations
+        status = f"📍 {keyword_set.keywords[keyword_set.first_index[self._location_names[column]]]} (Likely Hybrid)"
+        if self.hits.hybrid[i]:
+            status += " - Hybrid"
+        return status
+
+    def passing(self, min_score):
+        """Indexes of postings at or above min_score, best first."""
+        selected = np.flatnonzero(self.scores >= min_score)
+        return selected[np.argsort(-self.scores[selected], kind="stable")]
+
+    def explain(self, i):
+        """Which keywords fired for posting i and what each part contributed."""
+        hits, matcher, w = self.hits, self.hits.matcher, self.weights
+
+        def matched(matrix, keyword_set):
+            names = list(keyword_set.counts)
+            return [names[c] for c in matrix.indices[matrix.indptr[i]:matrix.indptr[i + 1]]]
+
+        negatives = [matcher.negative_keywords[c] for c in hits.negative.indices[hits.negative.indptr[i]:hits.negative.indptr[i + 1]]]
+        tier1 = matched(hits.tier1, matcher.tier1)
+        tier1_title = matched(hits.tier1_title, matcher.tier1) if tier1 else []
+        tier2 = matched(hits.tier2, matcher.tier2)
+        explanation = {
+            "score": int(self.scores[i]),
+            "boost": int(hits.boosts[i]),
+            "negative": negatives[0] if negatives else None,
+            "tier1": tier1,
+            "tier1_title": tier1_title,
+            "tier2": tier2,
+            "marketing_title": bool(hits.marketing_title[i]),
+            "location": self.location_status(i),
+            "hybrid": bool(hits.hybrid[i]),
+            "points": {
+                "tier1": w["tier1"] * matcher.tier1.count(tier1),
+                "tier1_title": w["tier1_title"] * matcher.tier1.count(tier1_title),
+                "tier2": w["tier2"] * matcher.tier2.count(tier2),
+                "marketing_title": w["marketing_title"] * bool(hits.marketing_title[i]),
+                "location": w["location"] * bool(self.location_columns[i] >= 0),
+                "hybrid_la": w["hybrid_la"] * bool(self.location_columns[i] >= 0 and hits.hybrid[i]),
+            },
+        }
+        if negatives:
+            explanation["disqualified"] = f"negative keyword '{negatives[0]}' in title"
+        elif self.disqualified[i]:
+            explanation["disqualified"] = f"no Tier 1 keyword and keyword score below {NO_TIER1_MIN_SCORE}"
+        return explanation
+
+
+def score_hits(hits, weights=None):
+    """Scores every posting. Disqualified postings get -1 (+ boost), like score_job + fetcher."""
+    w = dict(WEIGHTS, **(weights or {}))
+    matcher = hits.matcher
+    tier1 = hits.tier1 @ _weights(matcher.tier1)
+    tier1_title = hits.tier1_title @ _weights(matcher.tier1)
+    tier2 = hits.tier2 @ _weights(matcher.tier2)
+
+    score = (
+        w["tier1"] * tier1
+        + w["tier1_title"] * np.where(tier1 > 0, tier1_title, 0)
+        + w["tier2"] * tier2
+        + w["marketing_title"] * hits.marketing_title
+    )
+    negative = np.asarray(hits.negative.getnnz(axis=1)) > 0
+    disqualified = negative | ((tier1 == 0) & (score < NO_TIER1_MIN_SCORE))
+
+    location_columns = _first_in_list(hits.locations, matcher.locations)
+    la = location_columns >= 0
+    score = score + w["location"] * la + w["hybrid_la"] * (la & hits.hybrid)
+
+    scores = np.where(disqualified, -1, score) + hits.boosts
+    return BatchScores(hits, scores, disqualified, location_columns, w)
+
+
+def score_postings(postings, matcher=None, weights=None):
+    """One-shot helper: build the hit matrices and score them."""
+    return score_hits(KeywordHits.build(postings, matcher), weights)
@@ -0,0 +1,551 @@
+# benchmark.py
+"""
+Offline benchmark for the job pipeline.
+
+Serves synthetic board responses (Greenhouse JSON + HTML fallback with detail
+pages, Lever, Workday, Netflix, SmartRecruiters, The Muse, PRSA,
+EntertainmentCareers and RSS feeds) from a local HTTP server, points config
+at it, stubs Gemini and Telegram, and times:
+
+    score      JobAggregator.score_job over N postings
+    seen       data_manager.filter_new_jobs over N jobs (half already seen)
+    get_jobs   JobAggregator.get_jobs against boards holding N postings
+    main       main.main() end to end against the same boards
+
+Usage:
+    python benchmark.py                          # sizes 10 100 1000 10000
+    python benchmark.py --sizes 10 100000 --stages score seen
+    python benchmark.py --fixtures recorded/     # serve recorded responses
+    python benchmark.py --json results.json
+
+With --fixtures, a request for /greenhouse-api/a24/jobs is answered with
+recorded/greenhouse-api/a24/jobs (if that file exists) instead of synthetic
+data, so real captured responses can be mixed in.
+
+Everything runs in a temporary directory, so the real seen-store and caches
+are never touched. Nothing leaves the machine.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from xml.sax.saxutils import escape
+
+import config
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+STAGES = ["score", "seen", "get_jobs", "main"]
+
+RELEVANT_TITLES = [
+    "Senior Publicist", "Communications Manager", "Director of Public Relations",
+    "Media Relations Lead", "Entertainment Publicity Coordinator", "PR Account Director",
+    "Corporate Communications Specialist", "Talent Publicist",
+]
+OTHER_TITLES = [
+    "Software Engineer", "Data Analyst", "Account Executive", "Product Designer",
+    "Marketing Intern", "Finance Manager", "Customer Support Specialist", "Recruiter",
+]
+LOCATIONS = ["Los Angeles, CA", "Remote", "New York, NY", "Burbank, CA", "London, UK", "Hybrid - Los Angeles"]
+FILLER = (
+    "team partner launch campaign press strategy stakeholders brand audience content "
+    "growth global studio streaming talent media creative plan execution cross functional "
+    "reporting budget agency events messaging social coverage leadership roadmap"
+).split()
+KEYWORD_PHRASES = ["public relations", "publicity", "press releases", "media relations", "communications"]
+
+# Share of the postings each synthetic source holds
+SOURCE_WEIGHTS = {
+    "greenhouse": 0.30, "lever": 0.15, "workday": 0.15, "netflix": 0.08,
+    "smartrecruiters": 0.07, "muse": 0.08, "rss": 0.07, "prsa": 0.05, "ec": 0.05,
+}
+GREENHOUSE_HTML_POSTINGS = 20   # Legacy HTML board; each match costs a detail-page fetch
+
+
+# ---------------------------------------------------------------------------
+# Synthetic postings
+# ---------------------------------------------------------------------------
+
+def make_postings(count, seed=0):
+    """Deterministic job postings: roughly a third look like PR/comms roles."""
+    rng = random.Random(seed)
+    postings = []
+    for i in range(count):
+        relevant = rng.random() < 0.35
+        title = rng.choice(RELEVANT_TITLES if relevant else OTHER_TITLES)
+        words = [rng.choice(FILLER) for _ in range(rng.randint(80, 200))]
+        if relevant:
+            for phrase in rng.sample(KEYWORD_PHRASES, 2):
+                words.insert(rng.randrange(len(words)), phrase)
+        postings.append({
+            "id": i,
+            "title": f"{title} - Team {i}",
+            "location": rng.choice(LOCATIONS),
+            "department": "Communications" if relevant else "Operations",
+            "description": " ".join(words).capitalize() + ". Salary: $90,000 - $120,000.",
+        })
+    return postings
+
+
+def split_postings(postings):
+    """Assigns postings to sources according to SOURCE_WEIGHTS."""
+    shares = {}
+    start = 0
+    names = list(SOURCE_WEIGHTS)
+    for n, name in enumerate(names):
+        end = len(postings) if n == len(names) - 1 else start + int(round(SOURCE_WEIGHTS[name] * len(postings)))
+        shares[name] = postings[start:end]
+        start = end
+    return shares
+
+
+# ---------------------------------------------------------------------------
+# Local stand-in server
+# ---------------------------------------------------------------------------
+
+class BoardServer:
+    """Serves every source's API/HTML from one ThreadingHTTPServer."""
+
+    def __init__(self, postings, fixtures=None):
+        self.shares = split_postings(postings)
+        self.html_board = make_postings(GREENHOUSE_HTML_POSTINGS, seed=1)
+        self.fixtures = fixtures
+        self.telegram_messages = 0
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.httpd.daemon_threads = True
+        self.base = f"http://127.0.0.1:{self.httpd.server_port}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like the real boards
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                self.respond(*server.route("GET", self.path, None))
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                self.respond(*server.route("POST", self.path, body))
+
+            def respond(self, status, content_type, body):
+                if isinstance(body, str):
+                    body = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def _fixture(self, path):
+        if not self.fixtures:
+            return None
+        file_path = os.path.join(self.fixtures, path.lstrip("/"))
+        if not os.path.isfile(file_path):
+            return None
+        with open(file_path, "rb") as f:
+            body = f.read()
+        if path.endswith(".rss") or body.lstrip().startswith(b"<?xml"):
+            content_type = "application/rss+xml"
+        elif body.lstrip()[:1] in (b"{", b"["):
+            content_type = "application/json"
+        else:
+            content_type = "text/html"
+        return 200, content_type, body
+
+    def route(self, method, raw_path, body):
+        parsed = urlparse(raw_path)
+        path, query = parsed.path, parse_qs(parsed.query)
+        recorded = self._fixture(path)
+        if recorded:
+            return recorded
+        parts = path.strip("/").split("/")
+        head = parts[0] if parts else ""
+
+        if head == "greenhouse-api":
+            # /greenhouse-api/<board>/jobs ; the "legacy" board is HTML-only
+            if parts[1] == "legacy":
+                return 404, "application/json", '{"status":404}'
+            return 200, "application/json", self.greenhouse_json(parts[1])
+        if head == "legacy":
+            # HTML board /legacy and its detail pages /legacy/jobs/<id>
+            if len(parts) >= 3:
+                return 200, "text/html", self.detail_page(int(parts[2]))
+            return 200, "text/html", self.greenhouse_html()
+        if head == "lever-api":
+            skip = int(query.get("skip", ["0"])[0])
+            limit = int(query.get("limit", [str(config.LEVER_PAGE_SIZE)])[0])
+            return 200, "application/json", self.lever_json(parts[1], skip, limit)
+        if head == "workday":
+            if method == "POST":
+                payload = json.loads(body or b"{}")
+                return 200, "application/json", self.workday_json(payload.get("offset", 0), payload.get("limit", 20))
+            return 200, "text/html", "<html><body>Careers</body></html>"
+        if head == "netflix":
+            return 200, "application/json", self.netflix_json()
+        if head == "smartrecruiters-api":
+            return 200, "application/json", self.smartrecruiters_json(parts[1])
+        if head == "muse":
+            return 200, "application/json", self.muse_json()
+        if head in ("wwr.rss", "remoteok.rss"):
+            return 200, "application/rss+xml", self.rss(head)
+        if head == "prsa":
+            return 200, "text/html", self.anchor_page("/job/{id}.html", self.shares["prsa"])
+        if head == "ec":
+            return 200, "text/html", self.anchor_page("/studio/{id}/job/{id}/", self.shares["ec"])
+        if head == "telegram":
+            with self.lock:
+                self.telegram_messages += 1
+            return 200, "application/json", '{"ok":true,"result":{}}'
+        return 404, "text/plain", "not found"
+
+    # --- response builders -------------------------------------------------
+
+    def greenhouse_json(self, board):
+        jobs = [
+            {
+                "id": p["id"],
+                "title": p["title"],
+                "absolute_url": f"{self.base}/{board}/jobs/{p['id']}",
+                "location": {"name": p["location"]},
+                "departments": [{"name": p["department"]}],
+                "content": escape(f"<p>{p['description']}</p>"),
+            }
+            for p in self.shares["greenhouse"]
+        ]
+        return json.dumps({"jobs": jobs, "meta": {"total": len(jobs)}})
+
+    def greenhouse_html(self):
+        rows = "".join(
+            f'<div class="opening"><a href="{self.base}/legacy/jobs/{p["id"]}">{escape(p["title"])}</a>'
+            f'<span class="location">{escape(p["location"])}</span></div>'
+            for p in self.html_board
+        )
+        return f"<html><body><div class='job-posts'>{rows}</div></body></html>"
+
+    def detail_page(self, posting_id):
+        posting = self.html_board[posting_id % len(self.html_board)]
+        ld = {
+            "@context": "https://schema.org", "@type": "JobPosting",
+            "title": posting["title"], "description": posting["description"],
+            "jobLocation": {"@type": "Place", "address": {"addressLocality": "Los Angeles", "addressRegion": "CA"}},
+            "baseSalary": {"@type": "MonetaryAmount", "currency": "USD",
+                           "value": {"minValue": 90000, "maxValue": 120000, "unitText": "YEAR"}},
+        }
+        return (
+            f"<html><head><script type='application/ld+json'>{json.dumps(ld)}</script></head>"
+            f"<body><h1>{escape(posting['title'])}</h1><p>{escape(posting['description'])}</p></body></html>"
+        )
+
+    def lever_json(self, board, skip, limit):
+        return json.dumps([
+            {
+                "id": f"lever-{p['id']}",
+                "text": p["title"],
+                "hostedUrl": f"{self.base}/{board}/{p['id']}",
+                "categories": {"location": p["location"], "department": p["department"], "commitment": "Full-time"},
+                "descriptionPlain": p["description"],
+                "lists": [{"text": "Requirements", "content": "<li>5+ years of experience</li>"}],
+                "additionalPlain": "",
+                "workplaceType": "hybrid" if "Hybrid" in p["location"] else "onsite",
+            }
+            for p in self.shares["lever"][skip:skip + limit]
+        ])
+
+    def workday_json(self, offset, limit):
+        postings = self.shares["workday"]
+        return json.dumps({
+            # Like the real API, only the first page carries the total
+            "total": len(postings) if offset == 0 else 0,
+            "jobPostings": [
+                {"title": p["title"], "locationsText": p["location"], "externalPath": f"/job/{p['id']}"}
+                for p in postings[offset:offset + limit]
+            ],
+        })
+
+    def netflix_json(self):
+        return json.dumps({"positions": [
+            {"id": p["id"], "name": p["title"], "location": p["location"], "department": p["department"]}
+            for p in self.shares["netflix"]
+        ]})
+
+    def smartrecruiters_json(self, company):
+        return json.dumps({"content": [
+            {"id": str(p["id"]), "name": p["title"], "location": {"city": p["location"].split(",")[0]}}
+            for p in self.shares["smartrecruiters"]
+        ]})
+
+    def muse_json(self):
+        return json.dumps({"results": [
+            {
+                "name": p["title"],
+                "contents": f"<p>{p['description']}</p>",
+                "company": {"name": f"Muse Company {p['id'] % 50}"},
+                "refs": {"landing_page": f"{self.base}/muse/jobs/{p['id']}"},
+                "locations": [{"name": p["location"]}],
+            }
+            for p in self.shares["muse"]
+        ]})
+
+    def rss(self, feed):
+        half = len(self.shares["rss"]) // 2
+        postings = self.shares["rss"][:half] if feed == "wwr.rss" else self.shares["rss"][half:]
+        items = "".join(
+            f"<item><title>{escape(p['title'])}</title><link>{self.base}/{feed}/{p['id']}</link>"
+            f"<author>Feed Company {p['id'] % 30}</author>"
+            f"<description>{escape(p['description'])}</description></item>"
+            for p in postings
+        )
+        return f'<?xml version="1.0"?><rss version="2.0"><channel><title>{feed}</title>{items}</channel></rss>'
+
+    def anchor_page(self, pattern, postings):
+        links = "".join(
+            f'<li><a href="{pattern.format(id=p["id"])}">{escape(p["title"])}</a></li>' for p in postings
+        )
+        return f"<html><body><nav><a href='/about'>About</a></nav><ul>{links}</ul></body></html>"
+
+
+def point_config_at(base):
+    """Redirects every source in config to the local server and removes politeness delays."""
+    config.URLS = {
+        "PRSA_Browse": f"{base}/prsa/",
+        "TheMuse": f"{base}/muse",
+        "EntertainmentCareers": f"{base}/ec",
+        "WeWorkRemotely_Management": f"{base}/wwr.rss",
+        "RemoteOK": f"{base}/remoteok.rss",
+    }
+    # Greenhouse/Lever take the board name from the first path segment
+    config.ATS_SOURCES = [
+        {"name": "Bench Greenhouse", "url": f"{base}/bench-gh", "type": "greenhouse"},
+        {"name": "Bench Legacy", "url": f"{base}/legacy", "type": "greenhouse"},
+        {"name": "Bench Lever", "url": f"{base}/bench-lever", "type": "lever"},
+        {"name": "Bench Workday", "url": f"{base}/workday/bench/jobs", "type": "workday",
+         "base_url": f"{base}/workday/bench/careers"},
+        {"name": "Bench Netflix", "url": f"{base}/netflix/api", "type": "netflix"},
+        {"name": "Bench SmartRecruiters", "url": f"{base}/smartrecruiters/Bench", "type": "smartrecruiters"},
+    ]
+    config.GREENHOUSE_API_BASE = f"{base}/greenhouse-api"
+    config.LEVER_API_BASE = f"{base}/lever-api"
+    config.SMARTRECRUITERS_API_BASE = f"{base}/smartrecruiters-api"
+    config.TELEGRAM_API_BASE = f"{base}/telegram"
+
+    no_delay = {"rate": 1e6, "burst": 1000, "jitter": 0.0}
+    config.DEFAULT_HOST_RATE_LIMIT = no_delay
+    config.HOST_RATE_LIMITS = {}
+    config.GEMINI_RATE_LIMIT = {"rate": 1e6, "min_rate": 1e6, "max_rate": 1e6}
+    config.TELEGRAM_CHAT_RATE = 1e6
+    config.TELEGRAM_GLOBAL_RATE = 1e6
+    # Let the large sizes page through everything instead of hitting the cap
+    config.WORKDAY_MAX_PAGES = 10 ** 6
+    # Measure full fetch + parse every time, with no state carried between runs
+    config.HTTP_CACHE_ENABLED = False
+    config.AI_CACHE_ENABLED = False
+
+
+# ---------------------------------------------------------------------------
+# Gemini stub
+# ---------------------------------------------------------------------------
+
+class _StubResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class StubModel:
+    """Stands in for genai.GenerativeModel: answers in the format the prompts ask for."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+
+    def generate_content(self, prompt, generation_config=None):
+        if self.latency:
+            time.sleep(self.latency)
+        ids = [int(n) for n in re.findall(r"^### JOB ID: (\d+)$", prompt, re.MULTILINE)]
+
+        def result(job_id=None):
+            # Deterministic spread of scores so some jobs pass the 7+ filter
+            score = 5 + zlib.crc32(f"{job_id}:{len(prompt)}".encode("utf-8")) % 5
+            entry = {
+                "score": score,
+                "recommendation": "SEND" if score >= 8 else "MAYBE",
+                "reasoning": "Synthetic evaluation from the benchmark stub.",
+                "highlights": ["PR experience"],
+                "requirements": ["5+ years"],
+            }
+            if job_id is not None:
+                entry["id"] = job_id
+            return entry
+
+        if ids:
+            return _StubResponse(json.dumps([result(job_id) for job_id in ids]))
+        return _StubResponse(json.dumps(result()))
+
+
+def stub_gemini(latency):
+    """Patches GeminiJobFilter so every instance uses the stub model."""
+    import gemini_filter
+
+    original_init = gemini_filter.GeminiJobFilter.__init__
+
+    def init(self, api_key=None, *args, **kwargs):
+        original_init(self, api_key or "benchmark", *args, **kwargs)
+        self.model = StubModel(latency)
+
+    gemini_filter.GeminiJobFilter.__init__ = init
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+@contextlib.contextmanager
+def quiet(verbose):
+    """Swallows the pipeline's progress output unless --verbose."""
+    if verbose:
+        yield
+        return
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def fresh_state(workdir):
+    """Resets per-run state: seen-store, run metrics, working directory files."""
+    import data_manager
+    import instrumentation
+    for name in os.listdir(workdir):
+        path = os.path.join(workdir, name)
+        if os.path.isdir(path):
+            shutil.rmtree(path)  # archive/ from the main stage
+        else:
+            os.remove(path)
+    data_manager._stores.clear()
+    instrumentation.metrics.reset()
+
+
+def bench_score(size, verbose):
+    from aggregator import JobAggregator
+    postings = make_postings(size)
+    aggregator = JobAggregator()
+    with quiet(verbose):
+        start = time.perf_counter()
+        for p in postings:
+            aggregator.score_job(p["title"], p["description"])
+        return time.perf_counter() - start
+
+
+def bench_seen(size, verbose):
+    import data_manager
+    jobs = [{"url": f"https://example.com/jobs/{i}?utm_source=bench"} for i in range(size)]
+    data_manager.get_store().add([job["url"] for job in jobs[::2]])
+    with quiet(verbose):
+        start = time.perf_counter()
+        data_manager.filter_new_jobs(jobs)
+        return time.perf_counter() - start
+
+
+def bench_get_jobs(size, verbose, fixtures):
+    from aggregator import JobAggregator
+    with BoardServer(make_postings(size), fixtures) as server:
+        point_config_at(server.base)
+        with quiet(verbose):
+            start = time.perf_counter()
+            JobAggregator().get_jobs()
+            return time.perf_counter() - start
+
+
+def bench_main(size, verbose, fixtures):
+    import main
+    with BoardServer(make_postings(size), fixtures) as server:
+        point_config_at(server.base)
+        with quiet(verbose):
+            start = time.perf_counter()
+            main.main()
+            return time.perf_counter() - start
+
+
+def run(sizes, stages, fixtures=None, gemini_latency=0.0, verbose=False):
+    """Runs each stage at each size in a scratch directory. Returns {stage: {size: seconds}}."""
+    fixtures = os.path.abspath(fixtures) if fixtures else None
+    original_cwd = os.getcwd()
+    saved_config = {name: getattr(config, name) for name in dir(config) if name.isupper()}
+    saved_env = {name: os.environ.get(name) for name in ("GEMINI_API_KEY", "TELEGRAM_TOKEN", "TELEGRAM_CHAT_ID")}
+    os.environ.update({"GEMINI_API_KEY": "benchmark", "TELEGRAM_TOKEN": "benchmark", "TELEGRAM_CHAT_ID": "1"})
+    stub_gemini(gemini_latency)
+
+    results = {stage: {} for stage in stages}
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            for size in sizes:
+                for stage in stages:
+                    fresh_state(workdir)
+                    if stage == "score":
+                        seconds = bench_score(size, verbose)
+                    elif stage == "seen":
+                        seconds = bench_seen(size, verbose)
+                    elif stage == "get_jobs":
+                        seconds = bench_get_jobs(size, verbose, fixtures)
+                    else:
+                        seconds = bench_main(size, verbose, fixtures)
+                    results[stage][size] = seconds
+                    print(f"  {stage:<9} {size:>7} postings  {seconds:9.3f}s  "
+                          f"({size / seconds if seconds else 0:,.0f} postings/s)")
+        finally:
+            os.chdir(original_cwd)
+            for name, value in saved_config.items():
+                setattr(config, name, value)
+            for name, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark for the job pipeline.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="posting counts to test")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--fixtures", help="directory of recorded responses, laid out by URL path")
+    parser.add_argument("--gemini-latency", type=float, default=0.0, help="simulated seconds per Gemini call")
+    parser.add_argument("--json", help="also write results to this file")
+    parser.add_argument("--verbose", action="store_true", help="show the pipeline's own output")
+    args = parser.parse_args()
+
+    print(f"Benchmarking {', '.join(args.stages)} at sizes {args.sizes}")
+    results = run(args.sizes, args.stages, args.fixtures, args.gemini_latency, args.verbose)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=1)
+        print(f"Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+# condense.py
+"""
+Token-budgeted job description condensing before Gemini.
+Postings spend much of their length on EEO statements, benefits and company
+history, and a plain cut at 3000 characters often drops the requirements.
+The condenser splits a description into sentences, drops boilerplate (curated
+phrase lists, so a posting condenses the same way whatever else is in the
+run), sorts what is left into sections and keeps the most useful sections
+first until config.CONDENSE_TOKEN_BUDGET is spent (section labels included):
+
+    location, compensation, requirements, responsibilities, other, about
+
+Token counts are estimated at config.CONDENSE_CHARS_PER_TOKEN characters per
+token; no API call is needed.
+"""
+
+import re
+import config
+import html_parsing
+
+# Order in which sections are kept, and their labels in the prompt
+SECTION_ORDER = ["location", "compensation", "requirements", "responsibilities", "other", "about"]
+SECTION_LABELS = {
+    "location": "Location",
+    "compensation": "Compensation",
+    "requirements": "Requirements",
+    "responsibilities": "Responsibilities",
+    "other": "Details",
+    "about": "About the company",
+}
+
+# Headings that start a section. "benefits" and "eeo" sections are dropped.
+HEADINGS = {
+    "responsibilities": [
+        "responsibilities", "key responsibilities", "what you'll do", "what you will do",
+        "what you’ll do", "the role", "your role", "about the role", "in this role",
+        "duties", "key duties", "day to day", "day-to-day", "your impact", "the opportunity",
+    ],
+    "requirements": [
+        "requirements", "qualifications", "minimum qualifications", "preferred qualifications",
+        "basic qualifications", "what you'll bring", "what you bring", "what you’ll bring",
+        "about you", "who you are", "what we're looking for", "what we’re looking for",
+        "you have", "you might be a fit if", "skills", "experience", "must have", "nice to have",
+    ],
+    "compensation": ["compensation", "salary", "pay range", "base pay", "salary range", "pay transparency"],
+    "location": ["location", "work location", "where you'll work", "work arrangement"],
+    "benefits": ["benefits", "perks", "what we offer", "we offer", "our benefits", "perks and benefits"],
+    "about": ["about us", "about the company", "who we are", "our mission", "our story", "company overview"],
+    "eeo": ["equal opportunity", "equal employment opportunity", "eeo statement", "diversity and inclusion"],
+}
+
+# Sentences containing any of these (as whole words: "pto" must not hit
+# "crypto") are dropped wherever they appear: EEO and legal wording only
+BOILERPLATE_PHRASES = [
+    "equal opportunity employer", "equal employment opportunity", "without regard to",
+    "regardless of race", "race, color", "sexual orientation", "gender identity",
+    "protected veteran", "veteran status", "disability status", "reasonable accommodation",
+    "e-verify", "fair chance", "arrest and conviction", "criminal history",
+    "privacy notice", "privacy policy", "applicant privacy", "at-will",
+    "recruiting agencies", "unsolicited resumes", "all qualified applicants",
+]
+
+# Benefits and call-to-action wording. Dropped outside requirements and
+# responsibilities only: "Manage our wellness brand's press" is part of the job
+CONTEXTUAL_BOILERPLATE_PHRASES = [
+    "accommodations", "background check", "we are committed to diversity",
+    "we celebrate diversity", "inclusive workplace",
+    "401(k)", "401k", "paid time off", "pto", "health insurance", "dental", "vision insurance",
+    "parental leave", "wellness", "commuter", "employee assistance", "life insurance",
+    "click apply", "apply now", "apply today", "to learn more about", "follow us on",
+]
+# Sections whose sentences are only checked against BOILERPLATE_PHRASES
+JOB_SECTIONS = ("requirements", "responsibilities")
+
+# Sentence-level signals, used when a sentence sits outside a matching section
+COMPENSATION_RE = re.compile(r"\$\s?\d|\b(?:salary|compensation|pay range|per hour|annual base|usd)\b", re.I)
+LOCATION_RE = re.compile(r"\b(?:hybrid|remote|on-?site|in[- ]office|based in|relocat\w*|days? (?:a|per) week in)\b", re.I)
+
+SENTENCE_RE = re.compile(r"(?<=[.!?;])\s+(?=[A-Z0-9\"'(•\-])|\s*[•·▪●]\s*|\n+")
+
+
+def _heading_pattern():
+    phrases = sorted({phrase for section in HEADINGS.values() for phrase in section}, key=len, reverse=True)
+    return re.compile(r"(?:" + "|".join(re.escape(phrase) for phrase in phrases) + r")\b", re.I)
+
+
+HEADING_RE = _heading_pattern()
+HEADING_SECTIONS = {phrase: section for section, phrases in HEADINGS.items() for phrase in phrases}
+# A heading run into the next sentence by a flattened description ("... our slate. What You'll Do Lead ...").
+# Any casing after the capital letter ("What you'll do", "WHAT YOU'LL DO")
+INLINE_HEADING_RE = re.compile(
+    r"(?<=[.!?:])\s+(?=(?:" + "|".join(
+        re.escape(phrase[0].upper()) + "(?i:" + re.escape(phrase[1:]) + ")"
+        for phrase in sorted(HEADING_SECTIONS, key=len, reverse=True)
+    ) + r")\b)"
+)
+
+
+def _phrase_pattern(phrases):
+    return re.compile(r"(?<!\w)(?:" + "|".join(re.escape(phrase) for phrase in phrases) + r")(?!\w)", re.I)
+
+
+BOILERPLATE_RE = _phrase_pattern(BOILERPLATE_PHRASES)
+CONTEXTUAL_BOILERPLATE_RE = _phrase_pattern(CONTEXTUAL_BOILERPLATE_PHRASES)
+
+
+def settings_key():
+    """Everything that changes what condense() returns, for gemini_filter.prompt_version."""
+    return repr([
+        config.CONDENSE_TOKEN_BUDGET, config.CONDENSE_CHARS_PER_TOKEN,
+        SECTION_ORDER, SECTION_LABELS, HEADINGS, BOILERPLATE_PHRASES, CONTEXTUAL_BOILERPLATE_PHRASES,
+        COMPENSATION_RE.pattern, LOCATION_RE.pattern,
+    ])
+
+
+def estimate_tokens(text):
+    return (len(text) + config.CONDENSE_CHARS_PER_TOKEN - 1) // config.CONDENSE_CHARS_PER_TOKEN
+
+
+def to_text(description):
+    """Plain text with line breaks kept (descriptions may still be HTML)."""
+    if "<" in description and ">" in description:
+        return html_parsing.make_soup(description).get_text("\n", strip=True)
+    return description
+
+
+def split_sentences(text):
+    text = INLINE_HEADING_RE.sub("\n", text)
+    return [part.strip(" \t-–—*") for part in SENTENCE_RE.split(text) if part and part.strip(" \t-–—*")]
+
+
+def heading(sentence):
+    """(section, rest of the sentence) if the sentence starts with a known heading, else None."""
+    match = HEADING_RE.match(sentence)
+    if not match:
+        return None
+    rest = sentence[match.end():].lstrip(" :-–—")
+    phrase = match.group().lower()
+    # "Experience with ..." and "The role is ..." are content, not headings
+    if rest and rest[0].islower() and not sentence[match.end():].lstrip().startswith(":"):
+        return None
+    return HEADING_SECTIONS.get(phrase, HEADING_SECTIONS.get(phrase.replace("’", "'"))), rest
+
+
+class Condenser:
+    """Condenses descriptions to a token budget. Stateless apart from the budget."""
+
+    def __init__(self, budget=None):
+        self.budget = config.CONDENSE_TOKEN_BUDGET if budget is None else budget
+
+    def is_boilerplate(self, sentence, section=None):
+        if BOILERPLATE_RE.search(sentence):
+            return True
+        return section not in JOB_SECTIONS and bool(CONTEXTUAL_BOILERPLATE_RE.search(sentence))
+
+    def sections(self, description):
+        """{section: [sentences]} with boilerplate, benefits and EEO text removed."""
+        return self._sections(description)[0]
+
+    def _sections(self, description):
+        """(sections, number of sentences dropped)."""
+        sections = {}
+        dropped = 0
+        current = "other"
+        for sentence in split_sentences(to_text(description)):
+            found = heading(sentence)
+            if found:
+                current, sentence = found
+                if not sentence:
+                    continue
+            if current in ("benefits", "eeo") or self.is_boilerplate(sentence, current):
+                dropped += 1
+                continue
+            section = current
+            # Pay and work-arrangement lines are worth keeping wherever they are
+            # ("Manage a remote team" stays a responsibility)
+            if section not in ("compensation", "location") and COMPENSATION_RE.search(sentence):
+                section = "compensation"
+            elif section in ("other", "about", "requirements") and LOCATION_RE.search(sentence) \
+                    and len(sentence) < 200:
+                section = "location"
+            sections.setdefault(section, []).append(sentence)
+        return sections, dropped
+
+    def condense(self, description, budget=None):
+        """The description cut down to about `budget` tokens, most useful sections first."""
+        description = description or ""
+        budget = self.budget if budget is None else budget
+        text = " ".join(to_text(description).split())
+        sections, dropped = self._sections(description)
+        if not dropped and estimate_tokens(text) <= budget:
+            return text  # Short and clean already
+
+        chosen = {}
+        remaining = budget
+        for section in SECTION_ORDER:
+            # A section's first sentence also pays for its "Label: " line start
+            label_cost = estimate_tokens(f"\n{SECTION_LABELS[section]}: ")
+            for sentence in sections.get(section, []):
+                cost = estimate_tokens(sentence + " ") + (0 if section in chosen else label_cost)
+                if cost <= remaining:
+                    chosen.setdefault(section, []).append(sentence)
+                    remaining -= cost
+        if not chosen:
+            # Nothing recognisable survived: fall back to a plain cut
+            return text[:budget * config.CONDENSE_CHARS_PER_TOKEN]
+        if list(chosen) == ["other"]:
+            return " ".join(chosen["other"])  # No sections found: no labels either
+        return "\n".join(
+            f"{SECTION_LABELS[section]}: " + " ".join(chosen[section])
+            for section in SECTION_ORDER if section in chosen
+        )
@@ -169,7 +169,12 @@ URLS = {
 # DIRECT AGENCY / STUDIO BOARDS (ATS)
 # -----------------------------------------------------------------------------
 # These are the "Hidden Gems". We go directly to the source.
-# We support 'greenhouse', 'lever', 'workday', and 'netflix' board types.
+# We support 'greenhouse', 'lever', 'workday', 'netflix' and 'smartrecruiters' board types.
+# Greenhouse and Lever boards are read through their public JSON APIs
+# (GREENHOUSE_API_BASE / LEVER_API_BASE below); the board name is taken from
+# the board URL.
+# Workday sources may add "search_text" (a string or list of strings) to search
+# server-side instead of paging through the whole catalogue.
 # OPTIMIZED FOR: Entertainment, Media, Music, Streaming, Gaming
 ATS_SOURCES = [
     # MAJOR ENTERTAINMENT / STUDIOS
@@ -177,7 +182,9 @@ ATS_SOURCES = [
     
     # STREAMING / DIGITAL MEDIA
     {"name": "Netflix", "url": "https://explore.jobs.netflix.net/api/apply/v2/jobs", "type": "netflix"},
-    {"name": "Disney", "url": "https://disney.wd5.myworkdayjobs.com/wday/cxs/disney/disneycareer/jobs", "type": "workday", "base_url": "https://disney.wd5.myworkdayjobs.com/en-US/disneycareer"},
+    # Disney's catalogue runs to thousands of postings, so we let Workday search it server-side
+    {"name": "Disney", "url": "https://disney.wd5.myworkdayjobs.com/wday/cxs/disney/disneycareer/jobs", "type": "workday", "base_url": "https://disney.wd5.myworkdayjobs.com/en-US/disneycareer",
+     "search_text": ["publicity", "communications", "public relations", "media relations", "publicist"]},
     {"name": "Roku", "url": "https://boards.greenhouse.io/roku", "type": "greenhouse"},
     {"name": "Vimeo", "url": "https://boards.greenhouse.io/vimeo", "type": "greenhouse"},
     {"name": "Twitch", "url": "https://boards.greenhouse.io/twitch", "type": "greenhouse"},
@@ -215,3 +222,149 @@ WORKING_NOMADS_RSS = "https://www.workingnomads.com/jobs.rss?category=marketing"
 # SYSTEM SETTINGS
 # -----------------------------------------------------------------------------
 MIN_SCORE_THRESHOLD = 40  # Lowered from 60 to catch description-matches
+
+# Fetch sources in parallel. Requests to the same host still wait on each
+# other (see HOST_RATE_LIMITS below); different hosts do not.
+CONCURRENT_FETCH = True
+MAX_FETCH_WORKERS = 8
+# Worker pool for the detail-page stage (salary/location deep scrape)
+DETAIL_FETCH_WORKERS = 6
+
+# Per-host politeness limits (token bucket per hostname, see rate_limiter.py).
+# rate = requests per second, burst = requests allowed back-to-back,
+# jitter = extra random seconds added whenever a request has to wait.
+# Keys match the hostname or any subdomain of it.
+DEFAULT_HOST_RATE_LIMIT = {"rate": 0.4, "burst": 1, "jitter": 3.0}
+HOST_RATE_LIMITS = {
+    "greenhouse.io": {"rate": 0.4, "burst": 1, "jitter": 3.0},
+    "lever.co": {"rate": 0.4, "burst": 1, "jitter": 3.0},
+    # Workday pages are small JSON calls fetched in parallel, so allow short bursts
+    "myworkdayjobs.com": {"rate": 1.0, "burst": 3, "jitter": 0.5},
+    "jobs.netflix.net": {"rate": 0.4, "burst": 1, "jitter": 3.0},
+    "smartrecruiters.com": {"rate": 0.4, "burst": 1, "jitter": 3.0},
+}
+
+# Shared HTTP client (see http_client.py)
+HTTP_TIMEOUT = 15    # seconds, applied to every outgoing request
+HTTP_POOL_SIZE = 10  # keep-alive connections kept per host
+
+# Workday pagination (see JobAggregator.fetch_workday)
+WORKDAY_PAGE_SIZE = 20     # Some Workday sites reject limit > 20
+WORKDAY_MAX_PAGES = 50     # Safety cap per search (1000 postings)
+WORKDAY_PAGE_WORKERS = 4   # Pages fetched in parallel per company
+
+# Gemini (Stage 2): jobs evaluated per API call. The candidate profile and
+# instructions are sent once per batch. 1 = one call per job.
+GEMINI_BATCH_SIZE = 8
+# Batches evaluated in parallel, and the adaptive pacing shared by all of them
+# (requests/sec: starts at "rate", grows on success, halves on 429/quota errors)
+GEMINI_CONCURRENCY = 4
+GEMINI_RATE_LIMIT = {"rate": 1.0, "min_rate": 0.1, "max_rate": 4.0}
+# Schema-constrained JSON output (response_schema) instead of free text
+GEMINI_STRUCTURED_OUTPUT = True
+# Transient errors (429, 500, 503, timeouts) are retried with exponential
+# backoff plus jitter; anything else fails the call at once
+GEMINI_MAX_RETRIES = 3
+GEMINI_BACKOFF_BASE = 1.0    # seconds; doubled on every retry
+GEMINI_BACKOFF_MAX = 30.0    # cap on one wait (before jitter)
+
+# Gemini evaluation cache (see eval_cache.py). Keyed by job content + prompt
+# version, so reposted or cross-listed jobs skip the API call.
+AI_CACHE_ENABLED = True
+AI_CACHE_FILE = "ai_eval_cache.json"
+AI_CACHE_TTL_DAYS = 30
+AI_CACHE_MAX_ENTRIES = 5000
+
+# Seen-job tracking (see seen_store.py). The append-only log replaced
+# seen_jobs.json, which is imported once if the log does not exist yet.
+SEEN_STORE_FILE = "seen_jobs.log"
+LEGACY_SEEN_FILE = "seen_jobs.json"
+SEEN_TOUCH_INTERVAL_DAYS = 7   # Refresh last-seen at most this often per URL
+SEEN_MAX_AGE_DAYS = 180        # Forget URLs not seen on any board for this long
+
+# Conditional GET cache (see http_cache.py): boards and feeds that answer
+# 304 Not Modified are skipped without parsing or scoring.
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_FILE = "http_cache.json"
+HTTP_CACHE_MAX_AGE_DAYS = 30
+
+# ATS JSON APIs
+GREENHOUSE_API_BASE = "https://boards-api.greenhouse.io/v1/boards"
+LEVER_API_BASE = "https://api.lever.co/v0/postings"
+LEVER_PAGE_SIZE = 100
+LEVER_MAX_PAGES = 20       # Safety cap per board (2000 postings)
+SMARTRECRUITERS_API_BASE = "https://api.smartrecruiters.com/v1/companies"
+
+# Telegram delivery (see telegram_poster.py). TELEGRAM_CHAT_ID may list several
+# comma-separated chats; each gets the same posts, sent concurrently.
+TELEGRAM_API_BASE = "https://api.telegram.org"
+TELEGRAM_DIGEST_MODE = False        # True: pack several jobs into each message
+TELEGRAM_MAX_MESSAGE_CHARS = 4096   # Telegram's limit for one message
+TELEGRAM_CHAT_RATE = 1.0            # messages/sec to any one chat
+TELEGRAM_GLOBAL_RATE = 25.0         # messages/sec for the whole bot (Telegram allows ~30)
+TELEGRAM_MAX_RETRIES = 4            # on 429 / 5xx / network errors
+TELEGRAM_BACKOFF_BASE = 1.0         # seconds; doubled on every retry, plus jitter
+TELEGRAM_FANOUT_WORKERS = 4
+
+# Run report (see instrumentation.py): stage/source timings, request and
+# cache counters and API latency percentiles, written next to the seen-store.
+RUN_REPORT_FILE = "run_report.json"
+
+# Raw-response archive (see response_archive.py / replay.py): every board and
+# feed body is stored gzipped under ARCHIVE_DIR/<run id>/ so keyword and
+# threshold changes can be re-scored offline. Only the newest runs are kept.
+# Archived runs fetch every board in full (no conditional GETs), so each run's
+# archive replays on its own.
+ARCHIVE_ENABLED = True
+ARCHIVE_DIR = "archive"
+ARCHIVE_KEEP_RUNS = 7
+
+# Local relevance pre-filter before Gemini (see relevance.py). Jobs are ranked
+# by BM25 similarity to the candidate profile and to titles Gemini liked
+# before; only the top slice is evaluated. Jobs below the minimum score are
+# marked seen; ones that only missed the top-k cut stay unseen and are ranked
+# again next run. Off by default: ranking needs the whole candidate set,
+# so Gemini would wait for the slowest board instead of streaming.
+RELEVANCE_PREFILTER_ENABLED = False
+RELEVANCE_TOP_K = 50             # At most this many jobs per run go to Gemini (0 = no cap)
+RELEVANCE_MIN_SCORE = 0.01       # Drop jobs below this similarity
+RELEVANCE_NEGATIVE_WEIGHT = 0.5  # How much similarity to rejected titles counts against a job
+RELEVANCE_POSITIVE_SCORE = 7     # Past Gemini scores at/above this are "liked" examples
+RELEVANCE_NEGATIVE_SCORE = 3     # ... and at/below this "rejected" examples
+
+# -----------------------------------------------------------------------------
+# CANDIDATE PROFILES (see profiles.py)
+# -----------------------------------------------------------------------------
+# One run fetches every source once and scores the postings for each profile
+# below; seen-tracking, Gemini evaluation and Telegram delivery then run per
+# profile. Omitted keys fall back to the settings above:
+#   tier1 / tier2 / negative / locations   TIER_1_KEYWORDS, ..., LOCATIONS
+#   min_score                              MIN_SCORE_THRESHOLD (keyword score)
+#   ai_min_score                           7 (Gemini score needed to post)
+#   profile / profile_file                 gemini_filter.CANDIDATE_PROFILE
+#   criteria                               Gemini evaluation checklist
+#   telegram_chat                          chat id(s), comma-separated; else the
+#   telegram_chat_env                      environment variable named here
+#                                          (default TELEGRAM_CHAT_ID; pass new ones
+#                                          in the workflow's env)
+#   seen_file                              seen_jobs.<name>.log
+PROFILES = [
+    {"name": "tiffany", "seen_file": SEEN_STORE_FILE},
+    # {
+    #     "name": "jordan",
+    #     "profile_file": "profiles/jordan.md",
+    #     "tier1": ["Brand Manager", "Head of Brand", "Brand Director"],
+    #     "tier2": ["Consumer Brand", "Brand Strategy", "Entertainment"],
+    #     "locations": ["New York", "Brooklyn"],
+    #     "min_score": 50,
+    #     "telegram_chat_env": "TELEGRAM_CHAT_ID_JORDAN",
+    # },
+]
+
+# Description condensing before Gemini (see condense.py). Boilerplate (EEO,
+# benefits, company history) is dropped and location, pay, requirements and responsibilities
+# are kept, in that order, up to the budget. Changing these invalidates cached
+# evaluations (see gemini_filter.prompt_version).
+CONDENSE_ENABLED = True
+CONDENSE_TOKEN_BUDGET = 450        # Description tokens per job sent to Gemini
+CONDENSE_CHARS_PER_TOKEN = 4       # Estimate used for the budget (no tokenizer call)
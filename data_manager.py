@@ -1,43 +1,56 @@
-import json
 import os
+import threading
+import config
+from dedupe import canonical_url
+from seen_store import SeenStore
 
-DATA_FILE = "seen_jobs.json"
+# Legacy flat JSON list; imported once into the seen-store (see seen_store.py)
+DATA_FILE = config.LEGACY_SEEN_FILE
 
-def load_seen_jobs():
+# One seen-store per file (each candidate profile has its own, see profiles.py)
+_stores = {}
+_stores_lock = threading.Lock()
+
+def get_store(path=None):
+    """Returns the process-wide seen-store for path (default: config.SEEN_STORE_FILE), loading it on first use."""
+    path = path or config.SEEN_STORE_FILE
+    with _stores_lock:
+        if path not in _stores:
+            # Only the default store imports the legacy seen_jobs.json
+            legacy_path = None if path == config.SEEN_STORE_FILE else ""
+            _stores[path] = SeenStore(path, legacy_path)
+        return _stores[path]
+
+def load_seen_jobs(path=None):
     """Loads the list of previously processed job URLs."""
-    if not os.path.exists(DATA_FILE):
-        return []
-    try:
-        with open(DATA_FILE, 'r') as f:
-            return json.load(f)
-    except json.JSONDecodeError:
-        return []
-
-def save_seen_jobs(job_urls):
-    """Saves the list of processed job URLs to avoid duplicates."""
-    # We only keep the last 1000 to prevent the file from growing infinitely, 
-    # though for this use case, infinite is probably fine for a long time.
-    # Let's keep it simple.
-    
-    # Load existing to merge (in case we want to append, but usually we pass the full updated list)
-    # Actually, better strategy: Read current, add new, save back.
-    
-    current_seen = set(load_seen_jobs())
-    current_seen.update(job_urls)
-    
-    abs_path = os.path.abspath(DATA_FILE)
-    print(f"Saving seen jobs to: {abs_path}")
+    return get_store(path).urls()
+
+def save_seen_jobs(job_urls, path=None):
+    """Records processed job URLs to avoid duplicates, then prunes stale ones."""
+    store = get_store(path)
+    # Also store the canonical form so a tracking-param variant counts as seen
+    store.add(list(job_urls) + [canonical_url(url) for url in job_urls])
+    pruned = store.prune()
     
-    with open(DATA_FILE, 'w') as f:
-        json.dump(list(current_seen), f)
+    abs_path = os.path.abspath(store.path)
+    print(f"Saving seen jobs to: {abs_path} ({len(store)} tracked, {pruned} pruned)")
 
-def filter_new_jobs(jobs):
+def filter_new_jobs(jobs, path=None):
     """Accepts a list of job dictionaries and returns only the ones not seen before."""
-    seen_urls = set(load_seen_jobs())
-    new_jobs = []
-    
+    return list(filter_new_stream(jobs, path))
+
+def filter_new_stream(jobs, path=None):
+    """Yields the jobs not seen before, from any iterable of jobs (e.g. a live scrape)."""
+    store = get_store(path)
+    still_listed = []
+
     for job in jobs:
-        if job['url'] not in seen_urls:
-            new_jobs.append(job)
-            
-    return new_jobs
+        canonical = canonical_url(job['url'])
+        if job['url'] in store or canonical in store:
+            still_listed.extend([job['url'], canonical])
+        else:
+            yield job
+
+    # Jobs still on the boards keep their last-seen date fresh, so pruning
+    # only forgets postings that have actually gone away
+    store.touch(still_listed)
@@ -0,0 +1,303 @@
+# dedupe.py
+"""
+Cross-source duplicate detection.
+The same role often shows up on an aggregator (The Muse, RemoteOK, PRSA) and
+on the company's own ATS board. Before Stage 2 we canonicalise URLs, cluster
+postings that share a normalised title + company (confirmed with a MinHash
+estimate of description similarity or a matching location), and keep only
+the richest record per cluster so each role is evaluated and posted once.
+Two postings on the same board with different URLs are never merged: that is
+how boards list one role in several cities.
+"""
+
+import hashlib
+import random
+import re
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = {
+    "gh_src", "lever-source", "lever-origin", "source", "src", "ref", "referrer",
+    "trk", "fbclid", "gclid", "mc_cid", "mc_eid", "_hsenc", "_hsmi", "iis", "iisn",
+}
+
+# Different hostnames serving the same postings
+HOST_ALIASES = {
+    "job-boards.greenhouse.io": "boards.greenhouse.io",
+    "jobs.netflix.net": "jobs.netflix.com",
+    "explore.jobs.netflix.net": "jobs.netflix.com",
+}
+
+# Company placeholders used by aggregators that don't expose the employer
+UNKNOWN_COMPANIES = {"", "unknown", "see listing"}
+
+# Location values that don't name a place
+UNKNOWN_LOCATIONS = {
+    "", "unknown", "n a", "remote", "anywhere", "various", "multiple locations",
+    "us", "usa", "united states", "worldwide",
+}
+
+COMPANY_SUFFIXES = re.compile(r"\b(inc|llc|ltd|corp|corporation|co|company|group|plc)\b")
+
+SHINGLE_SIZE = 3         # words per shingle
+NUM_PERMUTATIONS = 64    # MinHash signature length
+MIN_SHINGLES = 8         # below this a description is too short to compare
+SIMILARITY_THRESHOLD = 0.6
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1337)  # Fixed seed: signatures are comparable across runs
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+
+def canonical_url(url):
+    """Normalises a job URL: host aliases, no tracking params/fragment/trailing slash."""
+    if not url:
+        return ""
+    parsed = urlparse(url.strip())
+    host = parsed.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    host = HOST_ALIASES.get(host, host)
+    query = [
+        (key, value) for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+    ]
+    path = parsed.path.rstrip("/") or "/"
+    return urlunparse(("https", host, path, "", urlencode(sorted(query)), ""))
+
+
+def normalize_title(title):
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", (title or "").lower()).split())
+
+
+def normalize_company(company):
+    """Returns a comparable company key, or None when the source didn't say."""
+    name = (company or "").strip().lower()
+    if name in UNKNOWN_COMPANIES:
+        return None
+    name = COMPANY_SUFFIXES.sub(" ", re.sub(r"[^a-z0-9]+", " ", name))
+    return " ".join(name.split()) or None
+
+
+def location_places(location):
+    """City names in a location string ("Burbank, CA; New York, NY"), or None if it names none."""
+    places = set()
+    for part in re.split(r"[;|\n]| or ", (location or "").lower()):
+        city = " ".join(re.sub(r"[^a-z0-9]+", " ", part.split(",")[0]).split())
+        city = re.sub(r"^(?:remote|hybrid|on ?site)\b\s*", "", city).strip()
+        if city not in UNKNOWN_LOCATIONS:
+            places.add(city)
+    return places or None
+
+
+def locations_agree(job_a, job_b):
+    """True/False if both jobs name a place and they share/don't share one, else None."""
+    places_a = location_places(job_a.get("location"))
+    places_b = location_places(job_b.get("location"))
+    if places_a is None or places_b is None:
+        return None
+    # "New York" and "New York City" are one place
+    return any((a + " ").startswith(b + " ") or (b + " ").startswith(a + " ")
+               for a in places_a for b in places_b)
+
+
+def minhash(text):
+    """MinHash signature of the word shingles in text, or None if too short."""
+    words = re.sub(r"[^a-z0-9]+", " ", (text or "").lower()).split()
+    shingles = {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)}
+    if len(shingles) < MIN_SHINGLES:
+        return None
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big")
+        for s in shingles
+    ]
+    return [min((a * h + b) % _MERSENNE_PRIME for h in hashes) for a, b in _PERMUTATIONS]
+
+
+def similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / len(sig_a)
+
+
+def richness(job):
+    """How much useful detail a record carries; the richest one represents its cluster."""
+    score = len(job.get("description") or "")
+    if normalize_company(job.get("company")):
+        score += 500
+    if job.get("salary") not in (None, "", "Check Listing", "Not listed"):
+        score += 300
+    if str(job.get("source", "")).endswith("(Direct)"):
+        score += 200
+    if job.get("location") not in (None, "", "Unknown", "Remote", "N/A"):
+        score += 100
+    return score
+
+
+class _UnionFind:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            # Lower index becomes the root so cluster order follows input order
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+def _same_posting(job_a, job_b, sig_a, sig_b):
+    """Decides whether two jobs with the same normalised title are one posting."""
+    url_a = canonical_url(job_a.get("url"))
+    url_b = canonical_url(job_b.get("url"))
+    if url_a and url_a == url_b:
+        return True
+    # One board listing a title twice means two postings (usually two cities
+    # sharing a description), never a copy
+    source_a, source_b = job_a.get("source"), job_b.get("source")
+    if (source_a and source_a == source_b) or (url_a and url_b and urlparse(url_a).netloc == urlparse(url_b).netloc):
+        return False
+    company_a = normalize_company(job_a.get("company"))
+    company_b = normalize_company(job_b.get("company"))
+    if company_a and company_b and company_a != company_b:
+        return False
+    places = locations_agree(job_a, job_b)
+    if places is False:
+        return False
+    if sig_a is not None and sig_b is not None:
+        return similarity(sig_a, sig_b) >= SIMILARITY_THRESHOLD
+    # Without two descriptions to compare, only trust an explicit company and
+    # location match
+    return bool(company_a and company_b) and places is True
+
+
+def cluster_jobs(jobs):
+    """Groups duplicate postings. Returns lists of indexes into jobs, in input order."""
+    uf = _UnionFind(len(jobs))
+
+    by_url = {}
+    for i, job in enumerate(jobs):
+        key = canonical_url(job.get("url"))
+        if key in by_url:
+            uf.union(by_url[key], i)
+        else:
+            by_url[key] = i
+
+    by_title = {}
+    for i, job in enumerate(jobs):
+        by_title.setdefault(normalize_title(job.get("title")), []).append(i)
+
+    signatures = {}
+    for title, members in by_title.items():
+        if not title or len(members) < 2:
+            continue
+        for i in members:
+            if i not in signatures:
+                signatures[i] = minhash(jobs[i].get("description"))
+        for pos, i in enumerate(members):
+            for j in members[pos + 1:]:
+                if uf.find(i) != uf.find(j) and _same_posting(jobs[i], jobs[j], signatures[i], signatures[j]):
+                    uf.union(i, j)
+
+    clusters = {}
+    for i in range(len(jobs)):
+        clusters.setdefault(uf.find(i), []).append(i)
+    return [clusters[root] for root in sorted(clusters)]
+
+
+def dedupe_jobs(jobs):
+    """Keeps the richest record of each duplicate cluster.
+
+    The kept job gets `duplicate_urls` / `duplicate_sources` listing the copies
+    it stands for, so callers can mark every URL as seen.
+    """
+    unique = []
+    for members in cluster_jobs(jobs):
+        best = max(members, key=lambda i: (richness(jobs[i]), -i))
+        job = jobs[best]
+        others = [jobs[i] for i in members if i != best]
+        if others:
+            job["duplicate_urls"] = [other["url"] for other in others]
+            job["duplicate_sources"] = [other.get("source", "") for other in others]
+            # Keep the strongest keyword score seen for this role
+            job["score"] = max(jobs[i].get("score", 0) for i in members)
+        unique.append(job)
+    return unique
+
+
+class StreamingDeduper:
+    """Incremental version of dedupe_jobs for the streaming pipeline.
+
+    Jobs from direct ATS boards are passed on as soon as they arrive; a later
+    copy of the same role is attached to the record already passed on. Jobs
+    from aggregators are the ones most likely to be a thinner copy of a
+    direct posting, so they are held back until the stream ends and then
+    merged into a matching direct record or deduped among themselves.
+
+    `unique` holds every job passed on, with `duplicate_urls` filled in once
+    the stream is exhausted.
+    """
+
+    def __init__(self):
+        self.unique = []
+        self.held = []
+        self.by_url = {}       # canonical url -> kept job
+        self.by_title = {}     # normalised title -> [(kept job, signature)]
+
+    def _match(self, job):
+        kept = self.by_url.get(canonical_url(job.get("url")))
+        if kept is not None:
+            return kept
+        candidates = self.by_title.get(normalize_title(job.get("title")))
+        if not candidates:
+            return None
+        signature = minhash(job.get("description"))
+        for other, other_signature in candidates:
+            if _same_posting(other, job, other_signature, signature):
+                return other
+        return None
+
+    def _keep(self, job):
+        self.unique.append(job)
+        self.by_url.setdefault(canonical_url(job.get("url")), job)
+        title = normalize_title(job.get("title"))
+        if title:
+            self.by_title.setdefault(title, []).append((job, minhash(job.get("description"))))
+
+    @staticmethod
+    def _attach(kept, job):
+        kept.setdefault("duplicate_urls", []).append(job["url"])
+        kept.setdefault("duplicate_sources", []).append(job.get("source", ""))
+        kept["score"] = max(kept.get("score", 0), job.get("score", 0))
+
+    def stream(self, jobs):
+        """Yields the unique jobs of an iterable of jobs."""
+        for job in jobs:
+            if not str(job.get("source", "")).endswith("(Direct)"):
+                self.held.append(job)
+                continue
+            kept = self._match(job)
+            if kept is not None:
+                self._attach(kept, job)
+                continue
+            self._keep(job)
+            yield job
+
+        held, self.held = self.held, []
+        remaining = []
+        for job in held:
+            kept = self._match(job)
+            if kept is not None:
+                self._attach(kept, job)
+            else:
+                remaining.append(job)
+        for job in dedupe_jobs(remaining):
+            self._keep(job)
+            yield job
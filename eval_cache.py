@@ -0,0 +1,101 @@
+# eval_cache.py
+"""
+Persistent cache of Gemini evaluations.
+Results are keyed by a hash of the job's normalised title, company and
+description plus the prompt version, so a posting that shows up again (or
+under a different URL/source) reuses its earlier score instead of a new API call.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import config
+from instrumentation import metrics
+
+
+def normalize_text(text):
+    """Lowercases and collapses whitespace so cosmetic differences hash the same."""
+    return re.sub(r"\s+", " ", str(text or "")).strip().lower()
+
+
+def job_key(job, version):
+    """Content hash for a job dict under a given prompt/profile version."""
+    parts = [
+        normalize_text(job.get("title", "")),
+        normalize_text(job.get("company", "")),
+        normalize_text(job.get("description", job.get("title", ""))),
+        version,
+    ]
+    return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+class EvaluationCache:
+    """JSON file of {key: {"cached_at", "title", "company", "version", "result"}} with TTL and size cap.
+
+    One cache is shared by every profile's filter (the prompt version keeps
+    their results apart), so writes are locked.
+    """
+
+    def __init__(self, path=None, ttl_days=None, max_entries=None):
+        self.path = path or config.AI_CACHE_FILE
+        ttl_days = config.AI_CACHE_TTL_DAYS if ttl_days is None else ttl_days
+        self.ttl = ttl_days * 86400
+        self.max_entries = config.AI_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self.entries = self._load()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    def _expired(self, entry, now):
+        return now - entry.get("cached_at", 0) > self.ttl
+
+    def get(self, job, version):
+        """Returns a copy of the cached result for this job, or None."""
+        entry = self.entries.get(job_key(job, version))
+        if entry is None or self._expired(entry, time.time()):
+            self.misses += 1
+            metrics.count("ai_cache.misses")
+            return None
+        self.hits += 1
+        metrics.count("ai_cache.hits")
+        return dict(entry["result"])
+
+    def put(self, job, version, result):
+        entry = {
+            "cached_at": int(time.time()),
+            "title": job.get("title", ""),
+            "company": job.get("company", ""),
+            "version": version,
+            "result": result,
+        }
+        with self.lock:
+            self.entries[job_key(job, version)] = entry
+
+    def save(self):
+        """Drops expired entries, evicts the oldest beyond max_entries and writes the file."""
+        now = time.time()
+        with self.lock:
+            live = {k: v for k, v in self.entries.items() if not self._expired(v, now)}
+            if len(live) > self.max_entries:
+                newest = sorted(live, key=lambda k: live[k].get("cached_at", 0), reverse=True)
+                live = {k: live[k] for k in newest[:self.max_entries]}
+            self.entries = live
+
+            # Sorted keys keep day-to-day diffs of the committed file small
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(live, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
@@ -5,8 +5,20 @@ Uses Google's Gemini API to intelligently evaluate job fit for the candidate.
 """
 
 import os
+import json
+from collections import deque
 import google.generativeai as genai
+from concurrent.futures import ThreadPoolExecutor
+from google.api_core import exceptions as google_exceptions
+import hashlib
+import random
 import time
+import config
+import condense
+from condense import Condenser, estimate_tokens
+from eval_cache import EvaluationCache
+from rate_limiter import AdaptiveRateLimiter
+from instrumentation import metrics
 
 # Candidate Profile - Comprehensive background for Gemini to reference
 CANDIDATE_PROFILE = """
@@ -59,8 +71,239 @@ relationships. Recognized as "Rising Star in PR" by Business Insider and "15 Und
 - Team leadership and coordination
 """
 
+# Prompt sections shared by single-job and batched evaluation
+EVALUATION_CRITERIA = """Consider:
+1. Does the role match her experience level (8+ years, Manager/Director level)?
+2. Is it in her target industries (entertainment, media, music, streaming)?
+3. Does it align with her core skills (PR, publicity, communications, media relations)?
+4. Is the location compatible (LA area or remote)?
+5. Are there any red flags (too junior, wrong field, technical role)?"""
+
+# For profiles that bring their own text but no "criteria" (see profiles.py)
+GENERIC_CRITERIA = """Consider:
+1. Does the role match the candidate's experience level and seniority?
+2. Is it in the industries the candidate is targeting?
+3. Does it align with the candidate's core skills?
+4. Is the location compatible with what the candidate is looking for?
+5. Are there any red flags (too junior, wrong field, anything the candidate is NOT looking for)?"""
+
+RESULT_FIELDS = """    "score": <1-10 integer>,
+    "recommendation": "<SEND|MAYBE|SKIP>",
+    "reasoning": "<2-3 sentence explanation of why this is/isn't a good match>",
+    "highlights": ["<matching point 1>", "<matching point 2>"],
+    "requirements": ["<key requirement 1>", "<key requirement 2>", "<key requirement 3>"]"""
+
+SCORING_GUIDE = """SCORING GUIDE:
+- 9-10: Perfect match - exactly her target role/industry
+- 7-8: Strong match - relevant role, good fit
+- 5-6: Possible match - adjacent role, worth considering
+- 3-4: Weak match - tangentially related
+- 1-2: Poor match - wrong level, industry, or function
+
+RECOMMENDATION GUIDE:
+- SEND: Score 7+ (automatically send to candidate)
+- MAYBE: Score 5-6 (send with caveat)
+- SKIP: Score 4 or below (don't bother candidate)"""
+
+RECOMMENDATIONS = ("SEND", "MAYBE", "SKIP")
+
+# JSON schemas for Gemini's structured output (response_schema): the model is
+# constrained to return exactly these shapes instead of free text
+RESULT_PROPERTIES = {
+    "score": {"type": "integer"},
+    "recommendation": {"type": "string", "enum": list(RECOMMENDATIONS)},
+    "reasoning": {"type": "string"},
+    "highlights": {"type": "array", "items": {"type": "string"}},
+    "requirements": {"type": "array", "items": {"type": "string"}},
+}
+RESULT_SCHEMA = {
+    "type": "object",
+    "properties": RESULT_PROPERTIES,
+    "required": list(RESULT_PROPERTIES),
+}
+BATCH_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": dict({"id": {"type": "integer"}}, **RESULT_PROPERTIES),
+        "required": ["id"] + list(RESULT_PROPERTIES),
+    },
+}
+
+# Worth retrying: rate limits, overload, timeouts and dropped connections.
+# Anything else (bad key, invalid request, blocked prompt) fails at once.
+THROTTLE_ERRORS = (google_exceptions.ResourceExhausted, google_exceptions.TooManyRequests)
+TRANSIENT_ERRORS = THROTTLE_ERRORS + (
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.InternalServerError,
+    google_exceptions.DeadlineExceeded,
+    ConnectionError,
+    TimeoutError,
+)
+# Failures that say nothing about the posting: the job is tried again next run
+# (see failed_result). A bad key or missing permission is fixed in the setup.
+RETRY_LATER_ERRORS = TRANSIENT_ERRORS + (
+    google_exceptions.Unauthenticated,
+    google_exceptions.PermissionDenied,
+)
+
+MODEL_NAME = 'gemini-2.0-flash'
+
+# Plain cut used when condensing is off (config.CONDENSE_ENABLED)
+MAX_DESCRIPTION_CHARS = 3000
+
+
+def description_settings():
+    """How descriptions are shortened for prompts (condense settings or the plain cut)."""
+    if config.CONDENSE_ENABLED:
+        return "condense:" + condense.settings_key()
+    return f"cut:{MAX_DESCRIPTION_CHARS}"
+
+
+def prompt_version(profile_text, criteria):
+    """Changes whenever the profile, the instructions, the model or the way
+    descriptions are condensed change, which invalidates every cached
+    evaluation (see eval_cache.py)."""
+    return hashlib.sha256(
+        "\n".join([MODEL_NAME, profile_text, criteria, RESULT_FIELDS, SCORING_GUIDE,
+                   description_settings()]).encode("utf-8")
+    ).hexdigest()[:16]
+
+
+PROMPT_VERSION = prompt_version(CANDIDATE_PROFILE, EVALUATION_CRITERIA)
+
+
+def format_job_posting(job_title, company, job_description, location):
+    """Renders one job posting block for a prompt (the description as given)."""
+    return f"""**Title:** {job_title}
+**Company:** {company}
+**Location:** {location}
+**Description:** 
+{job_description}"""
+
+
+def parse_json_response(response_text):
+    """Parses a model response as JSON, tolerating Markdown code fences."""
+    response_text = response_text.strip()
+    
+    # Clean up response if it has markdown code blocks
+    if response_text.startswith("```"):
+        response_text = response_text.split("```")[1]
+        if response_text.startswith("json"):
+            response_text = response_text[4:]
+        response_text = response_text.strip()
+    
+    return json.loads(response_text)
+
+
+def response_text(response):
+    """The text of a Gemini response. Raises ValueError if there is none (e.g. a blocked prompt)."""
+    try:
+        text = response.text
+    except (ValueError, AttributeError) as e:
+        raise ValueError(f"response has no text: {e}")
+    if not text or not text.strip():
+        raise ValueError("response is empty")
+    return text
+
+
+def _string_list(value):
+    if not isinstance(value, list):
+        return []
+    return [str(item).strip() for item in value if isinstance(item, (str, int, float)) and str(item).strip()]
+
+
+class Evaluation:
+    """One validated evaluation: what RESULT_SCHEMA describes, as checked Python values."""
+
+    def __init__(self, score, recommendation, reasoning, highlights, requirements):
+        self.score = score
+        self.recommendation = recommendation
+        self.reasoning = reasoning
+        self.highlights = highlights
+        self.requirements = requirements
+
+    @classmethod
+    def from_dict(cls, data):
+        """Validates a parsed model result. Raises ValueError if it has no usable score."""
+        if not isinstance(data, dict):
+            raise ValueError(f"evaluation is not an object: {data!r:.60}")
+        score = data.get("score")
+        if isinstance(score, str) and score.strip().isdigit():
+            score = int(score)
+        if isinstance(score, float) and score.is_integer():
+            score = int(score)
+        if isinstance(score, bool) or not isinstance(score, int):
+            raise ValueError(f"evaluation has no usable score: {data!r:.60}")
+        score = max(1, min(10, score))
+
+        recommendation = str(data.get("recommendation", "")).strip().upper()
+        if recommendation not in RECOMMENDATIONS:
+            # Follow the scoring guide rather than guessing
+            recommendation = "SEND" if score >= 7 else "MAYBE" if score >= 5 else "SKIP"
+        reasoning = data.get("reasoning")
+        return cls(
+            score=score,
+            recommendation=recommendation,
+            reasoning=reasoning.strip() if isinstance(reasoning, str) and reasoning.strip() else "No reasoning provided",
+            highlights=_string_list(data.get("highlights")),
+            requirements=_string_list(data.get("requirements")),
+        )
+
+    def to_dict(self):
+        """The result dict stored on jobs and in the evaluation cache."""
+        return {
+            "score": self.score,
+            "recommendation": self.recommendation,
+            "reasoning": self.reasoning,
+            "highlights": self.highlights,
+            "requirements": self.requirements,
+        }
+
+
+def normalize_result(result):
+    """Validates and normalizes one evaluation dict. Raises ValueError if unusable."""
+    return Evaluation.from_dict(result).to_dict()
+
+
+def failed_result(reason, error=None):
+    """Placeholder for a job Gemini could not evaluate.
+
+    "failed" keeps it out of the evaluation cache. Only RETRY_LATER_ERRORS
+    (transient errors once the retries ran out, quota, credentials) set
+    "retry", which makes main.py leave the job out of the seen-store so the
+    next run tries again; blocked prompts, bad requests and unusable
+    responses would fail the same way every run, so those jobs are marked seen.
+    """
+    return {
+        "score": 5,
+        "recommendation": "MAYBE",
+        "reasoning": reason,
+        "highlights": [],
+        "requirements": [],
+        "failed": True,
+        "retry": isinstance(error, RETRY_LATER_ERRORS),
+    }
+
+
 class GeminiJobFilter:
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, cache=None, profile=None, limiter=None):
+        """profile: profiles.Profile to evaluate for (default: CANDIDATE_PROFILE).
+        cache / limiter: shared between the filters of several profiles.
+        """
+        # Which candidate the prompts describe; each gets its own cache version
+        self.profile_name = profile.name if profile is not None else None
+        self.profile_text = CANDIDATE_PROFILE
+        self.criteria = EVALUATION_CRITERIA
+        if profile is not None and profile.text is not None:
+            self.profile_text = profile.text
+            self.criteria = profile.criteria or GENERIC_CRITERIA
+        elif profile is not None and profile.criteria:
+            self.criteria = profile.criteria
+        self.prompt_version = prompt_version(self.profile_text, self.criteria)
+        # Boilerplate-free, token-budgeted descriptions (see condense.py)
+        self.condenser = Condenser() if config.CONDENSE_ENABLED else None
+
         if api_key is None:
             api_key = os.environ.get("GEMINI_API_KEY")
         if not api_key:
@@ -69,9 +312,83 @@ class GeminiJobFilter:
             return
             
         genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.0-flash')
+        self.model = genai.GenerativeModel(MODEL_NAME)
         self.enabled = True
-        self.rate_limit_delay = 1.0  # Seconds between API calls to avoid rate limits
+        # Earlier evaluations, reused when the same posting comes back
+        if cache is None and config.AI_CACHE_ENABLED:
+            cache = EvaluationCache()
+        self.cache = cache
+        # Shared by all worker threads: speeds up on success, backs off on 429s
+        self.limiter = limiter or AdaptiveRateLimiter(
+            config.GEMINI_RATE_LIMIT["rate"],
+            config.GEMINI_RATE_LIMIT["min_rate"],
+            config.GEMINI_RATE_LIMIT["max_rate"],
+        )
+        # Schema-constrained JSON output (see RESULT_SCHEMA / BATCH_SCHEMA)
+        self.single_config = self.batch_config = None
+        if config.GEMINI_STRUCTURED_OUTPUT:
+            self.single_config = genai.GenerationConfig(
+                response_mime_type="application/json", response_schema=RESULT_SCHEMA)
+            self.batch_config = genai.GenerationConfig(
+                response_mime_type="application/json", response_schema=BATCH_SCHEMA)
+
+    def describe(self, job_description: str) -> str:
+        """The description as it goes into a prompt: condensed, or cut at MAX_DESCRIPTION_CHARS."""
+        cut = (job_description or "")[:MAX_DESCRIPTION_CHARS]
+        if self.condenser is None:
+            return cut
+        condensed = self.condenser.condense(job_description)
+        # Description tokens per prompt before (plain cut) and after condensing
+        metrics.count("condense.tokens_in", estimate_tokens(cut))
+        metrics.count("condense.tokens_out", estimate_tokens(condensed))
+        return condensed
+
+    def _generate(self, prompt: str, generation_config=None):
+        """Calls Gemini through the adaptive limiter.
+
+        Transient errors (TRANSIENT_ERRORS) are retried up to
+        config.GEMINI_MAX_RETRIES times with exponential backoff plus jitter;
+        rate limits also slow the shared limiter. Other errors raise at once.
+        """
+        kwargs = {"generation_config": generation_config} if generation_config is not None else {}
+        attempt = 0
+        while True:
+            self.limiter.wait()
+            metrics.count("gemini.calls")
+            start = time.monotonic()
+            try:
+                response = self.model.generate_content(prompt, **kwargs)
+            except TRANSIENT_ERRORS as e:
+                if isinstance(e, THROTTLE_ERRORS):
+                    metrics.count("gemini.throttled")
+                    self.limiter.throttled()
+                else:
+                    metrics.count("gemini.transient_errors")
+                attempt += 1
+                if attempt > config.GEMINI_MAX_RETRIES:
+                    metrics.count("gemini.errors")
+                    raise
+                delay = min(config.GEMINI_BACKOFF_MAX, config.GEMINI_BACKOFF_BASE * 2 ** (attempt - 1))
+                delay += random.uniform(0, config.GEMINI_BACKOFF_BASE)
+                metrics.count("gemini.retries")
+                print(f"  [GEMINI] {e.__class__.__name__}, retry {attempt}/{config.GEMINI_MAX_RETRIES} "
+                      f"in {delay:.1f}s ({self.limiter.rate:.2f} req/s)")
+                time.sleep(delay)
+                continue
+            except Exception:
+                metrics.count("gemini.errors")
+                raise
+            metrics.observe("gemini.latency", time.monotonic() - start)
+            self.limiter.success()
+            return response
+
+    def _parse(self, response):
+        """Parsed JSON of a response; counts and re-raises parse failures as ValueError."""
+        try:
+            return parse_json_response(response_text(response))
+        except ValueError as e:  # json.JSONDecodeError is a ValueError
+            metrics.count("gemini.parse_failures")
+            raise ValueError(f"unparseable response: {e}")
         
     def evaluate_job(self, job_title: str, company: str, job_description: str, location: str = "") -> dict:
         """
@@ -97,86 +414,143 @@ class GeminiJobFilter:
         prompt = f"""You are a recruiting assistant evaluating job fit for a specific candidate.
 
 ## CANDIDATE PROFILE:
-{CANDIDATE_PROFILE}
+{self.profile_text}
 
 ## JOB POSTING TO EVALUATE:
-**Title:** {job_title}
-**Company:** {company}
-**Location:** {location}
-**Description:** 
-{job_description[:3000]}  
+{format_job_posting(job_title, company, self.describe(job_description), location)}  
 
 ## YOUR TASK:
 Evaluate how well this job matches the candidate's background, skills, and career goals.
 
-Consider:
-1. Does the role match her experience level (8+ years, Manager/Director level)?
-2. Is it in her target industries (entertainment, media, music, streaming)?
-3. Does it align with her core skills (PR, publicity, communications, media relations)?
-4. Is the location compatible (LA area or remote)?
-5. Are there any red flags (too junior, wrong field, technical role)?
+{self.criteria}
 
 ## RESPONSE FORMAT (JSON only, no markdown):
 {{
-    "score": <1-10 integer>,
-    "recommendation": "<SEND|MAYBE|SKIP>",
-    "reasoning": "<2-3 sentence explanation of why this is/isn't a good match>",
-    "highlights": ["<matching point 1>", "<matching point 2>"],
-    "requirements": ["<key requirement 1>", "<key requirement 2>", "<key requirement 3>"]
+{RESULT_FIELDS}
 }}
 
 Note: "requirements" should list 2-4 key job requirements/qualifications from the posting.
 
-SCORING GUIDE:
-- 9-10: Perfect match - exactly her target role/industry
-- 7-8: Strong match - relevant role, good fit
-- 5-6: Possible match - adjacent role, worth considering
-- 3-4: Weak match - tangentially related
-- 1-2: Poor match - wrong level, industry, or function
-
-RECOMMENDATION GUIDE:
-- SEND: Score 7+ (automatically send to candidate)
-- MAYBE: Score 5-6 (send with caveat)
-- SKIP: Score 4 or below (don't bother candidate)
+{SCORING_GUIDE}
 
 Respond with ONLY the JSON object, no other text."""
 
         try:
-            time.sleep(self.rate_limit_delay)  # Rate limiting
-            response = self.model.generate_content(prompt)
-            
-            # Parse the response
-            response_text = response.text.strip()
-            
-            # Clean up response if it has markdown code blocks
-            if response_text.startswith("```"):
-                response_text = response_text.split("```")[1]
-                if response_text.startswith("json"):
-                    response_text = response_text[4:]
-                response_text = response_text.strip()
-            
-            import json
-            result = json.loads(response_text)
-            
-            # Validate and normalize
-            result["score"] = max(1, min(10, int(result.get("score", 5))))
-            result["recommendation"] = result.get("recommendation", "MAYBE").upper()
-            result["reasoning"] = result.get("reasoning", "No reasoning provided")
-            result["highlights"] = result.get("highlights", [])
-            result["requirements"] = result.get("requirements", [])
-            
-            return result
-            
+            response = self._generate(prompt, self.single_config)
+            data = self._parse(response)
+            try:
+                return Evaluation.from_dict(data).to_dict()
+            except ValueError:
+                metrics.count("gemini.invalid_results")
+                raise
         except Exception as e:
             print(f"  [GEMINI ERROR] {e}")
-            # On error, be permissive - let the job through for manual review
-            return {
-                "score": 5,
-                "recommendation": "MAYBE",
-                "reasoning": f"AI evaluation failed: {str(e)[:50]}",
-                "highlights": [],
-                "requirements": []
-            }
+            metrics.count("gemini.failed_jobs")
+            return failed_result(f"AI evaluation failed: {str(e)[:50]}", e)
+
+    def evaluate_batch(self, jobs: list) -> list:
+        """
+        Evaluates several jobs with a single Gemini call.
+        
+        The candidate profile and instructions are sent once; the model returns a
+        JSON array of evaluations keyed by job id. Entries that are missing or
+        malformed are re-evaluated one at a time with evaluate_job. If the call
+        itself fails after retries (RETRY_LATER_ERRORS) every job gets a
+        failed_result; any other failure falls back to one call per job.
+        
+        Args:
+            jobs: List of job dicts with keys: title, company, description, location
+            
+        Returns:
+            List of result dicts (same shape as evaluate_job), in input order
+        """
+        if len(jobs) == 1 or not self.enabled:
+            return [self._evaluate_single(job) for job in jobs]
+
+        postings = "\n\n".join(
+            f"### JOB ID: {job_id}\n" + format_job_posting(
+                job.get("title", "Unknown"),
+                job.get("company", "Unknown"),
+                self.describe(job.get("description", job.get("title", ""))),
+                job.get("location", "Unknown"),
+            )
+            for job_id, job in enumerate(jobs, start=1)
+        )
+
+        prompt = f"""You are a recruiting assistant evaluating job fit for a specific candidate.
+
+## CANDIDATE PROFILE:
+{self.profile_text}
+
+## JOB POSTINGS TO EVALUATE ({len(jobs)} total):
+{postings}
+
+## YOUR TASK:
+Evaluate EACH job posting independently: how well does it match the candidate's
+background, skills, and career goals?
+
+{self.criteria}
+
+## RESPONSE FORMAT (JSON only, no markdown):
+A JSON array with exactly one object per job, in any order:
+[
+  {{
+    "id": <JOB ID as an integer>,
+{RESULT_FIELDS}
+  }}
+]
+
+Note: "requirements" should list 2-4 key job requirements/qualifications from that posting.
+
+{SCORING_GUIDE}
+
+Respond with ONLY the JSON array, no other text."""
+
+        results = {}
+        try:
+            response = self._generate(prompt, self.batch_config)
+        except RETRY_LATER_ERRORS as e:
+            # Retries are used up: calling again per job would only repeat the failure
+            print(f"  [GEMINI ERROR] Batch of {len(jobs)} failed: {e}")
+            metrics.count("gemini.failed_jobs", len(jobs))
+            return [failed_result(f"AI evaluation failed: {str(e)[:50]}", e) for _ in jobs]
+        except Exception as e:
+            # Permanent (e.g. one posting got the prompt blocked): the jobs are
+            # evaluated one at a time below, so only the culprit fails
+            print(f"  [GEMINI ERROR] Batch of {len(jobs)}: {e}")
+            response = None
+        if response is not None:
+            try:
+                entries = self._parse(response)
+                if not isinstance(entries, list):
+                    metrics.count("gemini.parse_failures")
+                    raise ValueError("batch response is not a JSON array")
+                for entry in entries:
+                    try:
+                        job_id = int(entry["id"])
+                        if 1 <= job_id <= len(jobs) and job_id not in results:
+                            results[job_id] = Evaluation.from_dict(entry).to_dict()
+                    except (KeyError, TypeError, ValueError):
+                        metrics.count("gemini.invalid_results")
+                        continue  # Malformed entry - that job falls back below
+            except ValueError as e:
+                print(f"  [GEMINI ERROR] Batch of {len(jobs)}: {e}")
+
+        missing = len(jobs) - len(results)
+        if missing:
+            print(f"  [GEMINI] {missing}/{len(jobs)} batch entries missing or malformed - retrying individually")
+        return [
+            results.get(job_id) or self._evaluate_single(job)
+            for job_id, job in enumerate(jobs, start=1)
+        ]
+
+    def _evaluate_single(self, job: dict) -> dict:
+        return self.evaluate_job(
+            job.get("title", "Unknown"),
+            job.get("company", "Unknown"),
+            job.get("description", job.get("title", "")),
+            job.get("location", "Unknown"),
+        )
     
     def batch_evaluate(self, jobs: list) -> list:
         """
@@ -224,7 +598,7 @@ Respond with ONLY the JSON object, no other text."""
         print(f"\n✅ AI Filter Results: {len(filtered_jobs)}/{len(jobs)} jobs passed")
         return filtered_jobs
 
-    def filter_jobs(self, jobs: list, min_score: int = 7) -> list:
+    def filter_jobs(self, jobs: list, min_score: int = 7, batch_size: int = None) -> list:
         """
         Main entry point for filtering jobs. Evaluates all jobs and returns
         only those meeting the minimum score threshold.
@@ -232,6 +606,7 @@ Respond with ONLY the JSON object, no other text."""
         Args:
             jobs: List of job dicts with keys: title, company, url, description, location
             min_score: Minimum AI score (1-10) required to pass filter (default: 7)
+            batch_size: Jobs per Gemini call (default: config.GEMINI_BATCH_SIZE, 1 = one call per job)
             
         Returns:
             List of jobs that passed the filter with AI metadata attached
@@ -245,41 +620,127 @@ Respond with ONLY the JSON object, no other text."""
             return []
         
         print(f"\n🤖 Gemini AI Evaluation: Analyzing {len(jobs)} jobs (min_score: {min_score})...")
+        return self.filter_stream(jobs, min_score, batch_size, total=len(jobs))
+
+    def filter_stream(self, jobs, min_score: int = 7, batch_size: int = None, total: int = None) -> list:
+        """
+        Same as filter_jobs, but takes any iterable - e.g. a generator fed by a
+        scrape that is still running. A batch is sent to Gemini as soon as it
+        fills, so evaluation overlaps with fetching; the last partial batch is
+        sent when the iterable is exhausted.
         
-        filtered_jobs = []
-        
-        for i, job in enumerate(jobs):
-            title = job.get("title", "Unknown")
-            company = job.get("company", "Unknown")
-            description = job.get("description", job.get("title", ""))
-            location = job.get("location", "Unknown")
-            
-            print(f"  [{i+1}/{len(jobs)}] {title} @ {company}...", end=" ")
-            
-            result = self.evaluate_job(title, company, description, location)
-            
-            # Attach AI evaluation metadata to job
-            job["ai_score"] = result["score"]
-            job["ai_recommendation"] = result["recommendation"]
-            job["ai_reasoning"] = result["reasoning"]
-            job["ai_highlights"] = result["highlights"]
-            job["ai_requirements"] = result["requirements"]
+        Args:
+            jobs: Iterable of job dicts
+            min_score: Minimum AI score (1-10) required to pass filter
+            batch_size: Jobs per Gemini call (default: config.GEMINI_BATCH_SIZE)
+            total: Number of jobs, if known (only used for progress output)
             
-            # Check against minimum score threshold
-            if result["score"] >= min_score:
-                print(f"✓ {result['score']}/10")
-                filtered_jobs.append(job)
-            else:
-                print(f"✗ {result['score']}/10 - {result['reasoning'][:50]}...")
+        Returns:
+            List of jobs that passed the filter with AI metadata attached
+        """
+        if not self.enabled:
+            print("  [INFO] Gemini filter disabled - passing all jobs through")
+            return list(jobs)
+
+        if batch_size is None:
+            batch_size = config.GEMINI_BATCH_SIZE
+        batch_size = max(1, batch_size)
+        if total is None:
+            print(f"\n🤖 Gemini AI Evaluation: scoring jobs as they arrive (min_score: {min_score})...")
+
+        filtered_jobs = []
+        entries = deque()   # Jobs not printed yet, in arrival order
+        batch = []
+        evaluated = 0
+        cached = 0
+
+        def submit(pool):
+            future = pool.submit(self.evaluate_batch, [entry["job"] for entry in batch])
+            for position, entry in enumerate(batch):
+                entry["future"], entry["position"] = future, position
+            batch.clear()
+
+        def drain(block):
+            # Results are printed in job order: stop at the first one that isn't ready
+            nonlocal evaluated
+            while entries:
+                entry = entries[0]
+                result = entry["result"]
+                if result is None:
+                    future = entry.get("future")
+                    if future is None or (not block and not future.done()):
+                        return
+                    result = future.result()[entry["position"]]
+                    if self.cache is not None and not result.get("failed"):
+                        self.cache.put(entry["job"], self.prompt_version, result)
+                entries.popleft()
+                self._record_result(entry["job"], result, evaluated, total, min_score, filtered_jobs)
+                evaluated += 1
+
+        # Batches run concurrently; cached evaluations skip the API entirely
+        with ThreadPoolExecutor(max_workers=config.GEMINI_CONCURRENCY) as pool:
+            for job in jobs:
+                result = self.cache.get(job, self.prompt_version) if self.cache is not None else None
+                entry = {"job": job, "result": result}
+                entries.append(entry)
+                if result is None:
+                    batch.append(entry)
+                    if len(batch) >= batch_size:
+                        submit(pool)
+                else:
+                    cached += 1
+                drain(block=False)
+            if batch:
+                submit(pool)
+            drain(block=True)
+
+        if self.cache is not None:
+            self.cache.save()
+        metrics.count("gemini.jobs_evaluated", evaluated)
+        metrics.count("gemini.jobs_passed", len(filtered_jobs))
         
         # Summary
-        print(f"\n📊 AI Filter Summary:")
-        print(f"   • Total evaluated: {len(jobs)}")
+        label = f" ({self.profile_name})" if self.profile_name else ""
+        print(f"\n📊 AI Filter Summary{label}:")
+        print(f"   • Total evaluated: {evaluated}")
+        if cached:
+            print(f"   • From cache (no API call): {cached}")
         print(f"   • Passed (score ≥ {min_score}): {len(filtered_jobs)}")
-        print(f"   • Rejected: {len(jobs) - len(filtered_jobs)}")
+        print(f"   • Rejected: {evaluated - len(filtered_jobs)}")
         
         return filtered_jobs
 
+    def _record_result(self, job, result, i, total, min_score, filtered_jobs):
+        """Attaches one result to its job, prints progress and collects passes."""
+        title = job.get("title", "Unknown")
+        company = job.get("company", "Unknown")
+        
+        progress = f"{i+1}/{total}" if total else f"{i+1}"
+        print(f"  [{progress}] {title} @ {company}...", end=" ")
+        
+        # Attach AI evaluation metadata to job
+        job["ai_score"] = result["score"]
+        job["ai_recommendation"] = result["recommendation"]
+        job["ai_reasoning"] = result["reasoning"]
+        job["ai_highlights"] = result["highlights"]
+        job["ai_requirements"] = result["requirements"]
+        if result.get("failed"):
+            if result.get("retry"):
+                # Transient failure: main.py keeps it out of the seen-store
+                job["ai_failed"] = True
+                print(f"✗ not evaluated, retry next run - {result['reasoning'][:50]}")
+            else:
+                # Permanent failure: seen like a rejected job, never retried
+                print(f"✗ not evaluated - {result['reasoning'][:50]}")
+            return
+        
+        # Check against minimum score threshold
+        if result["score"] >= min_score:
+            print(f"✓ {result['score']}/10")
+            filtered_jobs.append(job)
+        else:
+            print(f"✗ {result['score']}/10 - {result['reasoning'][:50]}...")
+
 
 # For testing
 if __name__ == "__main__":
@@ -0,0 +1,74 @@
+# html_parsing.py
+"""
+HTML parsing helpers for the scrapers.
+Uses the C-backed lxml parser when it is installed and a SoupStrainer so only
+the elements a source actually reads (anchors, JSON-LD blocks) are turned into
+a tree. Anything that can't be handled that way falls back to a full
+html.parser parse, the way the scrapers always worked.
+"""
+
+import json
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401  (only checking that the parser backend exists)
+    PARSER = "lxml"
+except ImportError:
+    PARSER = "html.parser"
+
+
+def make_soup(markup, parse_only=None):
+    """Parses markup with the fastest available parser."""
+    return BeautifulSoup(markup, PARSER, parse_only=parse_only)
+
+
+def full_soup(markup):
+    """Complete tree, for pages that need more than a strained parse."""
+    return make_soup(markup)
+
+
+def anchors(markup, css_class=None):
+    """Returns the <a href> tags of a page (optionally only those with css_class).
+
+    Only anchors and their contents are parsed, so link.parent is not the
+    element from the real page. Sources that look around the link should use
+    full_soup instead.
+    """
+    attrs = {"href": True}
+    if css_class:
+        attrs["class"] = css_class
+    links = make_soup(markup, SoupStrainer("a", attrs=attrs)).find_all("a", attrs=attrs)
+    if not links:
+        # Odd markup can defeat the strained parse - retry the way we used to
+        links = BeautifulSoup(markup, 'html.parser').find_all("a", attrs=attrs)
+    return links
+
+
+def json_ld(markup):
+    """Returns every JSON-LD object on a page (lists and @graph flattened)."""
+    strainer = SoupStrainer("script", attrs={"type": "application/ld+json"})
+    objects = []
+    for script in make_soup(markup, strainer).find_all("script"):
+        try:
+            data = json.loads(script.string or "")
+        except (json.JSONDecodeError, TypeError):
+            continue
+        stack = data if isinstance(data, list) else [data]
+        while stack:
+            item = stack.pop(0)
+            if isinstance(item, list):
+                stack.extend(item)
+            elif isinstance(item, dict):
+                objects.append(item)
+                if isinstance(item.get("@graph"), list):
+                    stack.extend(item["@graph"])
+    return objects
+
+
+def job_posting_ld(markup):
+    """The schema.org JobPosting object embedded in a page, or None."""
+    for item in json_ld(markup):
+        types = item.get("@type")
+        if types == "JobPosting" or (isinstance(types, list) and "JobPosting" in types):
+            return item
+    return None
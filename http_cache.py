@@ -0,0 +1,94 @@
+# http_cache.py
+"""
+Persistent ETag / Last-Modified validators for conditional GETs.
+Boards and feeds that haven't changed since the last run answer 304 Not
+Modified, and the fetcher can skip parsing and scoring entirely.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+import config
+from profiles import load_profiles
+
+
+def scoring_fingerprint(profiles=None):
+    """Hash of the settings that decide which postings we keep.
+
+    A 304 only means "same page as last time"; if any profile's keywords or
+    threshold (or the set of profiles) changed since then, the old page must
+    be re-scored, so validators stored under a different fingerprint are not
+    sent. profiles defaults to config.PROFILES.
+    """
+    profiles = profiles or load_profiles()
+    if len(profiles) == 1:
+        settings = profiles[0].scoring_settings()
+    else:
+        settings = [[profile.name] + profile.scoring_settings() for profile in profiles]
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+class ValidatorCache:
+    """JSON file of {url: {"etag", "last_modified", "fingerprint", "saved_at"}}."""
+
+    def __init__(self, path=None, profiles=None):
+        """profiles: the profiles this run scores for (default: config.PROFILES)."""
+        self.path = path or config.HTTP_CACHE_FILE
+        self.fingerprint = scoring_fingerprint(profiles)
+        self.entries = self._load()
+        self.lock = threading.Lock()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (json.JSONDecodeError, OSError):
+            return {}
+
+    def request_headers(self, url):
+        """If-None-Match / If-Modified-Since headers for a URL (empty if unknown)."""
+        with self.lock:
+            entry = self.entries.get(url)
+        if not entry or entry.get("fingerprint") != self.fingerprint:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url, response):
+        """Remembers the validators from a 200 response (if the server sent any)."""
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self.lock:
+            if not etag and not last_modified:
+                self.entries.pop(url, None)
+                return
+            self.entries[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "fingerprint": self.fingerprint,
+                "saved_at": int(time.time()),
+            }
+
+    def forget(self, url):
+        """Drops a URL's validators, so the next run fetches it in full."""
+        with self.lock:
+            self.entries.pop(url, None)
+
+    def save(self):
+        """Writes the file, dropping validators older than HTTP_CACHE_MAX_AGE_DAYS."""
+        cutoff = time.time() - config.HTTP_CACHE_MAX_AGE_DAYS * 86400
+        with self.lock:
+            self.entries = {url: e for url, e in self.entries.items() if e.get("saved_at", 0) >= cutoff}
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(self.entries, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
@@ -0,0 +1,89 @@
+# http_client.py
+"""
+Shared HTTP client layer.
+Keeps long-lived sessions so repeat requests to the same host reuse pooled
+keep-alive connections (and their TLS sessions) instead of reconnecting.
+"""
+
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from curl_cffi import requests as cffi_requests
+import config
+from instrumentation import metrics
+
+_local = threading.local()
+_api_session = None
+_api_session_lock = threading.Lock()
+# Board/feed responses are copied to the archive, or served from one when
+# replaying (see response_archive.py). Telegram's api_session is never archived.
+_archive = None
+_replay = None
+
+
+def set_archive(archive):
+    """Records every get/post response into a ResponseArchive (None to stop)."""
+    global _archive
+    _archive = archive
+
+
+def set_replay(replay):
+    """Serves get/post from a ReplayArchive instead of the network (None to stop)."""
+    global _replay
+    _replay = replay
+
+
+def browser_session():
+    """Returns this thread's Chrome-impersonating curl_cffi session.
+
+    curl handles are not thread-safe, so every worker thread gets its own
+    session and reuses it (cookies, connection cache, TLS sessions) for every
+    request it makes.
+    """
+    session = getattr(_local, "browser_session", None)
+    if session is None:
+        session = cffi_requests.Session(impersonate="chrome")
+        _local.browser_session = session
+    return session
+
+
+def get(url, **kwargs):
+    """GET through the pooled browser session (used for ATS boards)."""
+    if _replay is not None:
+        return _replay.get(url, **kwargs)
+    kwargs.setdefault("timeout", config.HTTP_TIMEOUT)
+    response = browser_session().get(url, **kwargs)
+    metrics.record_response(response)
+    if _archive is not None:
+        _archive.record("GET", url, None, response)
+    return response
+
+
+def post(url, **kwargs):
+    """POST through the pooled browser session (used for Workday's API)."""
+    if _replay is not None:
+        return _replay.post(url, **kwargs)
+    kwargs.setdefault("timeout", config.HTTP_TIMEOUT)
+    response = browser_session().post(url, **kwargs)
+    metrics.record_response(response)
+    if _archive is not None:
+        _archive.record("POST", url, kwargs.get("data"), response)
+    return response
+
+
+def api_session():
+    """Returns the process-wide requests.Session for plain API calls (Telegram).
+
+    urllib3 connection pools are thread-safe, so one session is shared by all
+    threads with a pool sized for our worker count.
+    """
+    global _api_session
+    with _api_session_lock:
+        if _api_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=config.HTTP_POOL_SIZE, pool_maxsize=config.HTTP_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.hooks["response"].append(metrics.requests_hook)
+            _api_session = session
+        return _api_session
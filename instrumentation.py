@@ -0,0 +1,167 @@
+# instrumentation.py
+"""
+Lightweight run metrics.
+Stages and sources are timed, HTTP requests/bytes, cache hits and API
+latencies are counted, and main.py writes everything to a JSON run report
+(config.RUN_REPORT_FILE) that is committed with the seen-store, so slow
+sources and regressions show up in the diff between runs.
+
+Usage:
+    from instrumentation import metrics
+    with metrics.timer("telegram"): ...
+    with metrics.source("Netflix"): ...   # per-source time, requests and bytes
+    metrics.count("gemini.calls")
+    metrics.observe("gemini.latency", seconds)
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+import config
+
+
+# Ratios added to the report: name -> (numerator counter, denominator counter)
+RATES = {
+    "gemini.retry_rate": ("gemini.retries", "gemini.calls"),
+    "gemini.parse_failure_rate": ("gemini.parse_failures", "gemini.calls"),
+    "gemini.failed_job_rate": ("gemini.failed_jobs", "gemini.jobs_evaluated"),
+    "telegram.retry_rate": ("telegram.retries", "telegram.sent"),
+}
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (None if empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered))) - 1))
+    return ordered[rank]
+
+
+class RunMetrics:
+    """Thread-safe timers, counters and latency samples for one run."""
+
+    def __init__(self):
+        self.started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self.started = time.monotonic()
+        self.timers = {}     # name -> seconds
+        self.counters = {}   # name -> number
+        self.samples = {}    # name -> [values]
+        self.sources = {}    # source name -> {"seconds", "requests", "bytes", "jobs", ...}
+        self.lock = threading.Lock()
+        self._local = threading.local()
+
+    def reset(self):
+        """Starts a fresh run (used by benchmark.py between measurements)."""
+        self.__init__()
+
+    @contextmanager
+    def timer(self, name):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.monotonic() - start)
+
+    def add_time(self, name, seconds):
+        with self.lock:
+            self.timers[name] = self.timers.get(name, 0.0) + seconds
+
+    def count(self, name, value=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+        source = self.current_source()
+        if source is not None:
+            self.source_stat(source, name, value)
+
+    def observe(self, name, value):
+        with self.lock:
+            self.samples.setdefault(name, []).append(value)
+
+    def source_stat(self, source, name, value):
+        with self.lock:
+            stats = self.sources.setdefault(source, {})
+            stats[name] = stats.get(name, 0) + value
+
+    def current_source(self):
+        return getattr(self._local, "source", None)
+
+    @contextmanager
+    def attribute_to(self, name):
+        """Attributes counters on this thread to a source (e.g. in a helper pool)."""
+        previous = self.current_source()
+        self._local.source = name
+        try:
+            yield
+        finally:
+            self._local.source = previous
+
+    @contextmanager
+    def source(self, name):
+        """Attributes counters on this thread to a source and times it."""
+        start = time.monotonic()
+        try:
+            with self.attribute_to(name):
+                yield
+        finally:
+            self.source_stat(name, "seconds", time.monotonic() - start)
+
+    def record_response(self, response):
+        """Counts one HTTP response (works for requests and curl_cffi responses)."""
+        self.count("http.requests")
+        self.count("http.bytes", len(response.content or b""))
+        if response.status_code == 304:
+            self.count("http.not_modified")
+        elif response.status_code >= 400:
+            self.count("http.errors")
+
+    def requests_hook(self, response, *args, **kwargs):
+        """requests/cloudscraper response hook: session.hooks["response"].append(...)."""
+        self.record_response(response)
+        return response
+
+    def report(self):
+        with self.lock:
+            latency = {
+                name: {
+                    "count": len(values),
+                    "p50": round(percentile(values, 50), 3),
+                    "p90": round(percentile(values, 90), 3),
+                    "p99": round(percentile(values, 99), 3),
+                    "max": round(max(values), 3),
+                }
+                for name, values in self.samples.items() if values
+            }
+            rates = {
+                name: round(self.counters.get(numerator, 0) / self.counters[denominator], 4)
+                for name, (numerator, denominator) in sorted(RATES.items())
+                if self.counters.get(denominator)
+            }
+            return {
+                "started_at": self.started_at,
+                "total_seconds": round(time.monotonic() - self.started, 3),
+                "stages": {name: round(seconds, 3) for name, seconds in sorted(self.timers.items())},
+                "sources": {
+                    name: {key: round(value, 3) for key, value in sorted(stats.items())}
+                    for name, stats in sorted(self.sources.items())
+                },
+                "counters": {name: round(value, 3) for name, value in sorted(self.counters.items())},
+                "rates": rates,
+                "latency": latency,
+            }
+
+    def save(self, path=None):
+        """Writes the run report as JSON. Returns the path written."""
+        path = path or config.RUN_REPORT_FILE
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.report(), f, indent=1)
+        os.replace(tmp_path, path)
+        return path
+
+
+# Process-wide metrics for the current run
+metrics = RunMetrics()
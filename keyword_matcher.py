@@ -0,0 +1,132 @@
+# keyword_matcher.py
+"""
+Precompiled keyword matching for JobAggregator.score_job.
+Each keyword list is compiled once into a single regex, so scoring a job is
+one pass over its text per list instead of one `in`/`re.search` per keyword.
+"""
+
+import re
+import config
+
+
+def _trie_regex(words):
+    """Builds a regex matching any of `words`, factored into a prefix trie.
+
+    Sharing prefixes ("public relations" / "publicist" / "publicity") keeps the
+    regex engine from retrying every keyword at every position.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node):
+        ends_here = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Optional tail is greedy, so the longest keyword wins
+        return "(?:" + body + ")?" if ends_here else body
+
+    return build(trie)
+
+
+class KeywordSet:
+    """Case-insensitive substring matcher for one keyword list.
+
+    Matches the same keywords as `kw.lower() in text` would, including
+    overlapping ones ("Public Relations" inside "Director of Public Relations").
+    """
+
+    def __init__(self, keywords):
+        self.keywords = [kw for kw in keywords if kw]
+        lowered = [kw.lower() for kw in self.keywords]
+
+        # How many list entries each lowered keyword stands for (duplicates count twice)
+        self.counts = {}
+        # First list position of each lowered keyword, for "first match wins" lookups
+        self.first_index = {}
+        for index, kw in enumerate(lowered):
+            self.counts[kw] = self.counts.get(kw, 0) + 1
+            self.first_index.setdefault(kw, index)
+
+        unique = sorted(self.counts, key=len, reverse=True)
+        # find() restarts the search one character after every match, so it sees
+        # every start position that has a match. The trie-shaped regex is greedy
+        # and reports the longest keyword there; any other keyword starting at
+        # the same position is a prefix of it, which `prefixes` adds back.
+        self.pattern = None
+        if unique:
+            self.pattern = re.compile(_trie_regex(unique))
+        self.prefixes = {
+            kw: [other for other in unique if other != kw and kw.startswith(other)]
+            for kw in unique
+        }
+
+    def find(self, text):
+        """Returns the set of lowered keywords present in already-lowered text."""
+        found = set()
+        if self.pattern is None:
+            return found
+        search = self.pattern.search
+        match = search(text)
+        while match:
+            kw = match.group()
+            if kw not in found:
+                found.add(kw)
+                found.update(self.prefixes[kw])
+            match = search(text, match.start() + 1)
+        return found
+
+    def count(self, found):
+        """Number of list entries matched (what a loop over the list would count)."""
+        return sum(self.counts[kw] for kw in found)
+
+    def first(self, found):
+        """The matched keyword that appears earliest in the list (original casing)."""
+        if not found:
+            return None
+        index = min(self.first_index[kw] for kw in found)
+        return self.keywords[index]
+
+
+class KeywordMatcher:
+    """All keyword lists used for scoring, compiled once."""
+
+    def __init__(self, tier1, tier2, negative, locations):
+        self.tier1 = KeywordSet(tier1)
+        self.tier2 = KeywordSet(tier2)
+        self.locations = KeywordSet(locations)
+
+        # Negatives use word boundaries to avoid "Intern" matching "International"
+        self.negative_keywords = [kw for kw in negative if kw]
+        self.negative_patterns = [
+            re.compile(r'\b' + re.escape(kw.lower()) + r'\b') for kw in self.negative_keywords
+        ]
+        self.negative_pattern = None
+        if self.negative_keywords:
+            self.negative_pattern = re.compile(
+                r'\b(?:' + "|".join(re.escape(kw.lower()) for kw in self.negative_keywords) + r')\b'
+            )
+
+    def first_negative(self, text):
+        """Returns the first negative keyword (list order) found in lowered text, or None."""
+        if self.negative_pattern is None or not self.negative_pattern.search(text):
+            return None
+        # Rare path: find which keyword it was, in list order, for the log line
+        for kw, pattern in zip(self.negative_keywords, self.negative_patterns):
+            if pattern.search(text):
+                return kw
+        return None
+
+
+# Built once at import time from config.py
+DEFAULT_MATCHER = KeywordMatcher(
+    config.TIER_1_KEYWORDS,
+    config.TIER_2_KEYWORDS,
+    config.NEGATIVE_KEYWORDS,
+    config.LOCATIONS,
+)
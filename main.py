@@ -1,58 +1,94 @@
 from aggregator import JobAggregator
 import data_manager
+import dedupe
+import relevance
 import telegram_poster
 from gemini_filter import GeminiJobFilter
+from eval_cache import EvaluationCache
+from instrumentation import metrics
+from profiles import load_profiles, for_profile
+from response_archive import ResponseArchive
+import config
 import os
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-def main():
-    print("=" * 60)
-    print(" SNIPER JOB BOT - AI-Powered Job Hunting")
-    print("=" * 60)
-    
-    # Check for Gemini API key
-    gemini_api_key = os.environ.get("GEMINI_API_KEY")
-    use_gemini = bool(gemini_api_key)
-    
-    if use_gemini:
-        print("[OK] Gemini API key found - AI filtering enabled")
+def write_report():
+    """Writes timings and counters for this run (see instrumentation.py)."""
+    path = metrics.save()
+    print(f"Run report written to: {os.path.abspath(path)}")
+
+def split_stream(jobs, count):
+    """Copies one job stream into `count` streams.
+
+    Returns (feed, streams): calling feed() reads `jobs` and hands every job
+    to each stream; each stream is meant to be consumed on its own thread.
+    """
+    queues = [queue.Queue() for _ in range(count)]
+    done = object()
+
+    def feed():
+        try:
+            for job in jobs:
+                for q in queues:
+                    q.put(job)
+        finally:
+            for q in queues:
+                q.put(done)
+
+    def drain(q):
+        while True:
+            job = q.get()
+            if job is done:
+                return
+            yield job
+
+    return feed, [drain(q) for q in queues]
+
+def unevaluated(job):
+    """True for jobs Gemini failed on or the relevance pre-filter held back (top-k overflow)."""
+    return bool(job.get('ai_failed') or job.get('prefilter_dropped'))
+
+def evaluate_profile(profile, jobs, gemini_filter=None):
+    """Seen-filter, cross-source merge and (with Gemini) Stage 2 for one profile.
+
+    Returns (new_jobs, filtered_jobs): every unique new job, and the ones that
+    passed Gemini (all of them when gemini_filter is None).
+    """
+    deduper = dedupe.StreamingDeduper()
+    # Only the jobs this profile's keywords matched, as its own copies
+    jobs = (job for job in (for_profile(job, profile) for job in jobs) if job is not None)
+    # Seen-filter first, then collapse the same role posted on several boards
+    candidates = deduper.stream(data_manager.filter_new_stream(jobs, profile.seen_file))
+
+    if gemini_filter is None:
+        filtered_jobs = list(candidates)
     else:
-        print("[WARNING] No GEMINI_API_KEY - falling back to keyword-only filtering")
-    
-    # =========================================================================
-    # STAGE 1: Wide-Net Job Collection (Python keyword filtering)
-    # =========================================================================
-    print("\n" + "-" * 60)
-    print("STAGE 1: Aggregating Jobs (Keyword-Based Wide Net)")
-    print("-" * 60)
-    
-    aggregator = JobAggregator()
-    all_jobs = aggregator.get_jobs()
-    print(f"\n[OK] Stage 1 complete: {len(all_jobs)} potential matches from all sources")
+        if config.RELEVANCE_PREFILTER_ENABLED:
+            # Ranking needs the whole candidate set, so Gemini starts once
+            # scraping is done; only the most relevant jobs are sent
+            candidates = relevance.prefilter(candidates, gemini_filter=gemini_filter)
+        filtered_jobs = gemini_filter.filter_stream(candidates, min_score=profile.ai_min_score)
+    return deduper.unique, filtered_jobs
 
-    # =========================================================================
-    # DEDUPE - Filter out jobs we've already seen/sent
-    # =========================================================================
-    new_jobs = data_manager.filter_new_jobs(all_jobs)
-    print(f"\n[OK] After deduplication: {len(new_jobs)} NEW jobs to evaluate")
+def deliver_profile(profile, new_jobs, filtered_jobs, use_gemini):
+    """Prints the profile's results, posts its top jobs and records them as seen."""
+    merged = sum(len(job.get('duplicate_urls', [])) for job in new_jobs)
+    metrics.count("jobs.new", len(new_jobs) + merged)
+    metrics.count("jobs.unique", len(new_jobs))
+    metrics.count(f"profiles.{profile.name}.jobs_unique", len(new_jobs))
+
+    print(f"[OK] After deduplication: {len(new_jobs) + merged} NEW jobs")
+    print(f"[OK] After cross-source merge: {len(new_jobs)} unique NEW jobs to evaluate")
     
     if not new_jobs:
-        print("\n[INFO] No new jobs found. Exiting.")
-        data_manager.save_seen_jobs([])  # Touch the file
+        print("\n[INFO] No new jobs found.")
+        data_manager.save_seen_jobs([], profile.seen_file)  # Touch the file
         return
 
-    # =========================================================================
-    # STAGE 2: Gemini AI Filtering (Smart Relevance Scoring)
-    # =========================================================================
-    if use_gemini and new_jobs:
-        print("\n" + "-" * 60)
-        print("STAGE 2: Gemini AI Relevance Filtering")
-        print("-" * 60)
-        
-        gemini_filter = GeminiJobFilter(gemini_api_key)
-        filtered_jobs = gemini_filter.filter_jobs(new_jobs, min_score=7)
-        
-        print(f"\n[OK] Stage 2 complete: {len(filtered_jobs)} jobs scored 7+ by Gemini")
+    if use_gemini:
+        print(f"\n[OK] Stage 2 complete: {len(filtered_jobs)} jobs scored {profile.ai_min_score}+ by Gemini")
         
         # Sort by Gemini score (highest first)
         filtered_jobs.sort(key=lambda x: x.get('ai_score', 0), reverse=True)
@@ -72,22 +108,114 @@ def main():
         
         # Only send TOP 5 most relevant jobs
         top_jobs = jobs_to_post[:5]
+        metrics.count(f"profiles.{profile.name}.jobs_posted", len(top_jobs))
         
         print(f"\nTop 5 Jobs to Post:")
         for i, job in enumerate(top_jobs):
             score = job.get('ai_score', job.get('score', 0))
             print(f"  {i+1}. [{score}/10] {job['title']} @ {job['company']}")
         
-        telegram_poster.post_to_telegram(top_jobs)
+        with metrics.timer("telegram"):
+            telegram_poster.post_to_telegram(top_jobs, chat_ids=profile.chat_ids())
     else:
         print("\n[INFO] No jobs passed the AI relevance filter. Nothing to post.")
 
     # =========================================================================
     # SAVE SEEN JOBS
     # =========================================================================
-    # Save ALL new job URLs (both posted and not posted) to avoid reprocessing
-    new_urls = [job['url'] for job in new_jobs]
-    data_manager.save_seen_jobs(new_urls)
+    # Save ALL new job URLs (both posted and not posted, plus merged duplicates)
+    # to avoid reprocessing - except jobs that were never evaluated (Gemini
+    # failed transiently, or the relevance pre-filter held them back), which come back
+    # next run
+    retry_later = sum(1 for job in new_jobs if job.get('ai_failed'))
+    if retry_later:
+        print(f"[INFO] {retry_later} jobs could not be evaluated - they will be retried next run")
+    held_back = sum(1 for job in new_jobs if job.get('prefilter_dropped'))
+    if held_back:
+        print(f"[INFO] {held_back} jobs held back by the relevance pre-filter - they will be ranked again next run")
+    new_urls = [
+        url for job in new_jobs if not unevaluated(job)
+        for url in [job['url']] + job.get('duplicate_urls', [])
+    ]
+    with metrics.timer("save_seen"):
+        data_manager.save_seen_jobs(new_urls, profile.seen_file)
+
+def main():
+    print("=" * 60)
+    print(" SNIPER JOB BOT - AI-Powered Job Hunting")
+    print("=" * 60)
+    
+    # Check for Gemini API key
+    gemini_api_key = os.environ.get("GEMINI_API_KEY")
+    use_gemini = bool(gemini_api_key)
+    
+    if use_gemini:
+        print("[OK] Gemini API key found - AI filtering enabled")
+    else:
+        print("[WARNING] No GEMINI_API_KEY - falling back to keyword-only filtering")
+    
+    # =========================================================================
+    # STAGE 1 + 2: Streaming pipeline
+    # Jobs flow from the scrapers through the seen-filter and cross-source
+    # merge straight into Gemini, so AI evaluation starts while slower boards
+    # are still loading. Only the top-5 selection waits for everything (and the
+    # relevance pre-filter, when enabled, since it ranks the whole set).
+    # =========================================================================
+    print("\n" + "-" * 60)
+    print("STAGE 1: Aggregating Jobs (Keyword-Based Wide Net)")
+    if use_gemini and config.RELEVANCE_PREFILTER_ENABLED:
+        print("STAGE 2: Relevance pre-filter + Gemini AI Relevance Filtering")
+    elif use_gemini:
+        print("STAGE 2: Gemini AI Relevance Filtering (as jobs arrive)")
+    print("-" * 60)
+    
+    # Raw responses are kept so keyword changes can be replayed offline (replay.py)
+    archive = ResponseArchive() if config.ARCHIVE_ENABLED else None
+    # Every source is fetched once; postings are scored for each profile
+    profiles = load_profiles()
+    aggregator = JobAggregator(archive=archive, profiles=profiles)
+    if len(profiles) > 1:
+        print(f"[INFO] {len(profiles)} profiles: {', '.join(profile.name for profile in profiles)}")
+
+    filters = [None] * len(profiles)
+    if use_gemini:
+        # One evaluation cache and one API rate limit for all profiles
+        cache = EvaluationCache() if config.AI_CACHE_ENABLED else None
+        filters = []
+        for profile in profiles:
+            limiter = filters[0].limiter if filters else None
+            filters.append(GeminiJobFilter(gemini_api_key, cache, profile, limiter))
+
+    with metrics.timer("pipeline"):
+        if len(profiles) == 1:
+            results = [evaluate_profile(profiles[0], aggregator.iter_jobs(), filters[0])]
+        else:
+            # Each profile consumes its own copy of the live scrape on its own thread
+            feed, streams = split_stream(aggregator.iter_jobs(), len(profiles))
+            with ThreadPoolExecutor(max_workers=len(profiles)) as pool:
+                futures = [
+                    pool.submit(evaluate_profile, profile, stream, gemini_filter)
+                    for profile, stream, gemini_filter in zip(profiles, streams, filters)
+                ]
+                feed()
+                results = [future.result() for future in futures]
+    if archive is not None:
+        archive.prune()
+        print(f"\n[OK] Archived {archive.count} responses to {archive.path}")
+    metrics.count("jobs.matched", len(aggregator.jobs))
+
+    print(f"\n[OK] Stage 1 complete: {len(aggregator.jobs)} potential matches from all sources")
+
+    for profile, (new_jobs, filtered_jobs) in zip(profiles, results):
+        if len(profiles) > 1:
+            print("\n" + "=" * 60)
+            print(f" PROFILE: {profile.name}")
+            print("=" * 60)
+        deliver_profile(profile, new_jobs, filtered_jobs, use_gemini)
+    # Validators are saved only now, and boards with a job that will be
+    # retried are left out: a 304 next run would hide that job for good
+    aggregator.save_http_cache(job for new_jobs, _ in results for job in new_jobs if unevaluated(job))
+    write_report()
     
     print("\n" + "=" * 60)
     print("[OK] Sniper Job Bot Finished")
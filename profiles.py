@@ -0,0 +1,108 @@
+# profiles.py
+"""
+Candidate profiles: who a run is finding jobs for.
+
+Each entry of config.PROFILES describes one candidate as data: keyword tiers,
+locations, the profile text Gemini reads, score thresholds, the Telegram
+chat(s) to post to and the seen-store file. Every source is fetched once per
+run; each posting is keyword-scored for every profile (see
+JobAggregator.score_job) and then seen-tracking, Gemini evaluation and
+delivery run per profile (see main.py), so adding a candidate does not add
+any scraping.
+"""
+
+import os
+import re
+import config
+from keyword_matcher import DEFAULT_MATCHER, KeywordMatcher
+
+NAME_RE = re.compile(r"^[a-z0-9_-]+$")
+
+
+def parse_chat_ids(value):
+    """Telegram chat ids from a comma-separated string ("123, -456")."""
+    return [chat_id.strip() for chat_id in str(value or "").split(",") if chat_id.strip()]
+
+
+class Profile:
+    """One candidate. Built from a config.PROFILES entry by from_dict()."""
+
+    def __init__(self, name, text=None, criteria=None, tier1=None, tier2=None, negative=None,
+                 locations=None, min_score=None, ai_min_score=7, telegram_chat=None,
+                 telegram_chat_env="TELEGRAM_CHAT_ID", seen_file=None):
+        self.name = name
+        # None = gemini_filter.CANDIDATE_PROFILE / EVALUATION_CRITERIA
+        self.text = text
+        self.criteria = criteria
+        self.tier1 = list(config.TIER_1_KEYWORDS if tier1 is None else tier1)
+        self.tier2 = list(config.TIER_2_KEYWORDS if tier2 is None else tier2)
+        self.negative = list(config.NEGATIVE_KEYWORDS if negative is None else negative)
+        self.locations = list(config.LOCATIONS if locations is None else locations)
+        self.min_score = config.MIN_SCORE_THRESHOLD if min_score is None else min_score
+        self.ai_min_score = ai_min_score
+        self.telegram_chat = telegram_chat
+        self.telegram_chat_env = telegram_chat_env
+        self.seen_file = seen_file or f"seen_jobs.{name}.log"
+
+        # The default keyword lists are already compiled (see keyword_matcher.py)
+        if self.scoring_settings()[:4] == [config.TIER_1_KEYWORDS, config.TIER_2_KEYWORDS,
+                                           config.NEGATIVE_KEYWORDS, config.LOCATIONS]:
+            self.matcher = DEFAULT_MATCHER
+        else:
+            self.matcher = KeywordMatcher(self.tier1, self.tier2, self.negative, self.locations)
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data)
+        name = str(data.pop("name", "")).strip().lower()
+        if not NAME_RE.match(name):
+            raise ValueError(f"Profile name {name!r} must be lowercase letters, digits, '-' or '_'")
+        profile_file = data.pop("profile_file", None)
+        text = data.pop("profile", None)
+        if profile_file:
+            with open(profile_file, encoding="utf-8") as f:
+                text = f.read()
+        try:
+            return cls(name, text=text, **data)
+        except TypeError as e:
+            raise ValueError(f"Profile {name!r}: {e}")
+
+    def scoring_settings(self):
+        """What decides which postings this profile keeps (for http_cache's fingerprint)."""
+        return [self.tier1, self.tier2, self.negative, self.locations, self.min_score]
+
+    def chat_ids(self):
+        """Telegram chats for this profile: telegram_chat, else the telegram_chat_env variable."""
+        value = self.telegram_chat
+        if value is None and self.telegram_chat_env:
+            value = os.environ.get(self.telegram_chat_env)
+        return parse_chat_ids(value)
+
+    def __repr__(self):
+        return f"Profile({self.name!r})"
+
+
+def load_profiles(entries=None):
+    """Profiles from config.PROFILES (or entries). Raises ValueError on a bad or duplicate entry."""
+    entries = config.PROFILES if entries is None else entries
+    profiles = [Profile.from_dict(entry) for entry in entries]
+    if not profiles:
+        raise ValueError("config.PROFILES is empty")
+    names = [profile.name for profile in profiles]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate profile names: {', '.join(duplicates)}")
+    seen_files = [profile.seen_file for profile in profiles]
+    if len(set(seen_files)) != len(seen_files):
+        raise ValueError("Each profile needs its own seen_file")
+    return profiles
+
+
+def for_profile(job, profile):
+    """The profile's own copy of a scraped job (score and AI results are per profile), or None."""
+    scores = job.get("profile_scores")
+    if scores is None:
+        return job  # Scored before profiles existed (or by a single-profile caller)
+    if profile.name not in scores:
+        return None
+    return dict(job, score=scores[profile.name])
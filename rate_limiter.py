@@ -0,0 +1,122 @@
+# rate_limiter.py
+"""
+Rate limiting helpers.
+HostRateLimiter is the per-host politeness scheduler for scraping: each
+hostname gets its own token bucket, so requests only wait on earlier requests
+to the same host. AdaptiveRateLimiter paces a single API (Gemini) and backs
+off when the API starts returning rate-limit errors.
+"""
+
+import random
+import threading
+import time
+from urllib.parse import urlparse
+from instrumentation import metrics
+
+
+class TokenBucket:
+    """Thread-safe token bucket. Callers reserve a token and sleep outside the lock."""
+
+    def __init__(self, rate, burst=1, jitter=0.0):
+        self.rate = float(rate)      # tokens per second
+        self.burst = max(1, int(burst))
+        self.jitter = float(jitter)  # extra random seconds added to every wait
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Takes one token and returns how long the caller must wait before using it."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            # Token debt: the caller is queued behind everyone already waiting
+            return -self.tokens / self.rate + random.uniform(0, self.jitter)
+
+
+class HostRateLimiter:
+    """Keeps one TokenBucket per hostname.
+
+    `limits` maps a hostname (or a parent domain such as "myworkdayjobs.com")
+    to {"rate": requests/sec, "burst": n, "jitter": seconds}. Hosts without an
+    entry use `default`.
+    """
+
+    def __init__(self, limits=None, default=None):
+        self.limits = limits or {}
+        self.default = default or {"rate": 0.25, "burst": 1, "jitter": 0.0}
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def limit_for(self, host):
+        """Returns the configured limit for a host, matching parent domains too."""
+        best = None
+        for domain, limit in self.limits.items():
+            if host == domain or host.endswith("." + domain):
+                # Prefer the most specific domain
+                if best is None or len(domain) > len(best[0]):
+                    best = (domain, limit)
+        return dict(self.default, **best[1]) if best else self.default
+
+    def bucket_for(self, url):
+        host = urlparse(url).netloc.lower() or url
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                limit = self.limit_for(host)
+                bucket = TokenBucket(limit["rate"], limit.get("burst", 1), limit.get("jitter", 0.0))
+                self.buckets[host] = bucket
+            return bucket
+
+    def wait(self, url):
+        """Blocks until a request to this URL's host is allowed. Returns seconds waited."""
+        delay = self.bucket_for(url).reserve()
+        if delay > 0:
+            metrics.count("rate_limit.wait_seconds", delay)
+            time.sleep(delay)
+        return delay
+
+
+class AdaptiveRateLimiter:
+    """Paces calls to a single API and adapts the pace to how the API responds.
+
+    Starts at `rate` calls/sec. Every success nudges the rate up (additively,
+    up to `max_rate`); every rate-limit error cuts it (multiplicatively, down
+    to `min_rate`) and can pause all callers for the server's retry-after.
+    """
+
+    def __init__(self, rate, min_rate, max_rate, increase=0.1, backoff=0.5):
+        self.rate = float(rate)
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate)
+        self.increase = float(increase)
+        self.backoff = float(backoff)
+        self.next_time = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Blocks until the caller's slot comes up. Returns seconds waited."""
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_time)
+            self.next_time = start + 1.0 / self.rate
+        delay = start - now
+        if delay > 0:
+            metrics.count("rate_limit.api_wait_seconds", delay)
+            time.sleep(delay)
+        return delay
+
+    def success(self):
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def throttled(self, retry_after=None):
+        """Records a rate-limit error: slow down, and pause everyone if told to."""
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate * self.backoff)
+            pause = retry_after if retry_after else 1.0 / self.rate
+            self.next_time = max(self.next_time, time.monotonic() + pause)
@@ -0,0 +1,185 @@
+# relevance.py
+"""
+Local relevance pre-filter for Stage 2.
+Ranks the jobs that survived keyword scoring and dedupe by BM25-weighted
+similarity to the candidate profile (plus titles Gemini scored highly in
+earlier runs), minus similarity to titles it rejected. Only the top of the
+ranking is sent to Gemini, so API cost follows the number of plausible jobs
+rather than raw scrape volume. Runs offline on NumPy.
+"""
+
+import math
+import re
+from collections import Counter
+import numpy as np
+import config
+from eval_cache import EvaluationCache
+from gemini_filter import CANDIDATE_PROFILE, PROMPT_VERSION
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of",
+    "on", "or", "our", "she", "the", "to", "we", "with", "you", "your", "will", "this", "that",
+    "who", "what", "her", "their", "role", "job", "team", "work", "looking",
+}
+BM25_K1 = 1.5
+BM25_B = 0.75
+CHUNK_SIZE = 4096   # Rows of the document matrix built at a time
+
+
+def tokenize(text):
+    """Lowercase word unigrams plus bigrams ("public relations", "internal communications")."""
+    words = [w for w in TOKEN_RE.findall((text or "").lower()) if len(w) > 1 and w not in STOPWORDS]
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+def job_text(job):
+    # The title is the strongest signal, so it counts twice
+    title = job.get("title", "")
+    return f"{title} {title} {job.get('company', '')} {job.get('description', '')}"
+
+
+def split_profile(profile):
+    """Splits the profile into what the candidate wants and the "NOT looking for" lines."""
+    wanted, unwanted = [], []
+    for line in profile.splitlines():
+        if "not looking for" in line.lower():
+            unwanted.append(re.sub(r"(?i).*not looking for:?", "", line))
+        else:
+            wanted.append(line)
+    return "\n".join(wanted), "\n".join(unwanted)
+
+
+def past_labels(cache=None, version=PROMPT_VERSION):
+    """Titles from earlier Gemini evaluations for one prompt version (= profile): (liked, rejected)."""
+    if cache is None:
+        if not config.AI_CACHE_ENABLED:
+            return [], []
+        cache = EvaluationCache()
+    with cache.lock:
+        entries = list(cache.entries.values())
+    liked, rejected = [], []
+    for entry in entries:
+        # Entries written before versions were stored all belong to the default profile
+        if entry.get("version", PROMPT_VERSION) != version:
+            continue
+        score = (entry.get("result") or {}).get("score")
+        if not isinstance(score, (int, float)):
+            continue
+        if score >= config.RELEVANCE_POSITIVE_SCORE:
+            liked.append(entry.get("title", ""))
+        elif score <= config.RELEVANCE_NEGATIVE_SCORE:
+            rejected.append(entry.get("title", ""))
+    return liked, rejected
+
+
+class RelevanceRanker:
+    """Scores jobs against a positive and a negative query.
+
+    relevance = cos(job, wanted) - NEGATIVE_WEIGHT * cos(job, unwanted)
+
+    Job vectors use BM25 term weights (saturating term frequency, length
+    normalised); query vectors use log-TF * IDF. IDF is computed over the jobs
+    being ranked plus the query documents.
+    """
+
+    def __init__(self, profile=None, liked=(), rejected=(), negative_weight=None):
+        wanted, unwanted = split_profile(profile if profile is not None else CANDIDATE_PROFILE)
+        self.positive_docs = [tokenize(wanted)] + [tokenize(title) for title in liked]
+        self.negative_docs = [tokenize(unwanted)] + [tokenize(title) for title in rejected]
+        self.negative_docs = [doc for doc in self.negative_docs if doc]
+        self.negative_weight = config.RELEVANCE_NEGATIVE_WEIGHT if negative_weight is None else negative_weight
+
+    def score(self, jobs):
+        """Relevance of each job, as a NumPy array in input order."""
+        docs = [tokenize(job_text(job)) for job in jobs]
+        if not docs:
+            return np.zeros(0)
+        corpus = docs + self.positive_docs + self.negative_docs
+        df = Counter(term for doc in corpus for term in set(doc))
+        n = len(corpus)
+        idf = {term: math.log(1 + (n - count + 0.5) / (count + 0.5)) for term, count in df.items()}
+
+        positive = Counter(term for doc in self.positive_docs for term in doc)
+        negative = Counter(term for doc in self.negative_docs for term in doc)
+        vocab = {term: i for i, term in enumerate(sorted(set(positive) | set(negative)))}
+
+        def query_vector(counts):
+            q = np.zeros(len(vocab))
+            for term, tf in counts.items():
+                q[vocab[term]] = (1 + math.log(tf)) * idf.get(term, 0.0)
+            norm = np.linalg.norm(q)
+            return q / norm if norm else q
+
+        q_pos = query_vector(positive)
+        q_neg = query_vector(negative)
+
+        avg_len = sum(len(doc) for doc in docs) / len(docs) or 1.0
+        scores = np.zeros(len(docs))
+        for start in range(0, len(docs), CHUNK_SIZE):
+            chunk = docs[start:start + CHUNK_SIZE]
+            matrix = np.zeros((len(chunk), len(vocab)), dtype=np.float32)
+            norms = np.zeros(len(chunk))
+            for row, doc in enumerate(chunk):
+                length_norm = BM25_K1 * (1 - BM25_B + BM25_B * len(doc) / avg_len)
+                total = 0.0
+                for term, tf in Counter(doc).items():
+                    weight = idf[term] * tf * (BM25_K1 + 1) / (tf + length_norm)
+                    total += weight * weight
+                    column = vocab.get(term)
+                    if column is not None:
+                        matrix[row, column] = weight
+                norms[row] = math.sqrt(total) or 1.0
+            similarity = (matrix @ q_pos) / norms
+            if self.negative_docs:
+                similarity -= self.negative_weight * (matrix @ q_neg) / norms
+            scores[start:start + len(chunk)] = similarity
+        return scores
+
+    def select(self, jobs, top_k=None, min_score=None):
+        """Returns (kept, dropped). kept is in rank order; every job gets job["relevance"].
+
+        Jobs below min_score are rejects, marked seen like Gemini's. Jobs
+        that only missed the top_k cut are tagged job["prefilter_dropped"] and
+        stay unseen, so they are ranked again next run (see main.deliver_profile).
+        """
+        top_k = config.RELEVANCE_TOP_K if top_k is None else top_k
+        min_score = config.RELEVANCE_MIN_SCORE if min_score is None else min_score
+        scores = self.score(jobs)
+        kept, dropped = [], []
+        for i in np.argsort(-scores, kind="stable"):
+            job = jobs[i]
+            job["relevance"] = round(float(scores[i]), 4)
+            if job["relevance"] >= min_score and (not top_k or len(kept) < top_k):
+                kept.append(job)
+            else:
+                if job["relevance"] >= min_score:
+                    job["prefilter_dropped"] = True  # Top-k overflow
+                dropped.append(job)
+        return kept, dropped
+
+
+def prefilter(jobs, cache=None, gemini_filter=None):
+    """Stage 2 gate: keeps the most relevant jobs for Gemini and reports the rest.
+
+    gemini_filter, when given, supplies the profile text and the prompt
+    version whose past evaluations count as liked/rejected examples.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return jobs
+    profile, version = CANDIDATE_PROFILE, PROMPT_VERSION
+    if gemini_filter is not None:
+        profile, version = gemini_filter.profile_text, gemini_filter.prompt_version
+        cache = gemini_filter.cache if cache is None else cache
+    liked, rejected = past_labels(cache, version)
+    kept, dropped = RelevanceRanker(profile, liked=liked, rejected=rejected).select(jobs)
+    label = f" ({gemini_filter.profile_name})" if gemini_filter is not None and gemini_filter.profile_name else ""
+    print(f"\n🔎 Relevance pre-filter{label}: {len(kept)} of {len(jobs)} jobs go to Gemini "
+          f"(top {config.RELEVANCE_TOP_K or 'all'}, min {config.RELEVANCE_MIN_SCORE}; "
+          f"{len(liked)} liked / {len(rejected)} rejected past titles)")
+    for job in dropped[:5]:
+        print(f"  [DROP] {job['relevance']:.3f} {job['title']} @ {job.get('company', 'Unknown')}")
+    if len(dropped) > 5:
+        print(f"  ... and {len(dropped) - 5} more")
+    return kept
@@ -0,0 +1,88 @@
+# replay.py
+"""
+Re-parses and re-scores an archived run with the current config.py, without
+any network I/O. Use it to see what a change to TIER_1_KEYWORDS,
+NEGATIVE_KEYWORDS or MIN_SCORE_THRESHOLD would have matched.
+
+Usage:
+    python replay.py                         # newest archived run
+    python replay.py --run 20261018T170000Z
+    python replay.py --list
+    python replay.py --top 30 --json matches.json
+    python replay.py --thresholds 30 40 50 60  # matches per threshold, one batch re-score
+    python replay.py --explain 5                # keyword breakdown of the top 5
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections import Counter
+from aggregator import JobAggregator
+from response_archive import ReplayArchive, list_runs
+import config
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score an archived run offline.")
+    parser.add_argument("--run", help="run id to replay (default: newest)")
+    parser.add_argument("--list", action="store_true", help="list archived runs and exit")
+    parser.add_argument("--top", type=int, default=20, help="matches to print")
+    parser.add_argument("--json", help="write every match to this file (handy for diffing)")
+    parser.add_argument("--thresholds", type=int, nargs="+", help="count postings passing each threshold")
+    parser.add_argument("--explain", type=int, default=0, help="explain the scores of the top N postings")
+    args = parser.parse_args()
+
+    if args.list:
+        runs = list_runs()
+        if not runs:
+            print(f"No archived runs in {config.ARCHIVE_DIR}")
+        for run_id in runs:
+            with open(f"{config.ARCHIVE_DIR}/{run_id}/index.jsonl", encoding="utf-8") as f:
+                print(f"  {run_id}  {sum(1 for _ in f)} responses")
+        return 0
+
+    try:
+        replay = ReplayArchive(args.run)
+    except FileNotFoundError as e:
+        print(f"[ERROR] {e}")
+        return 1
+
+    print(f"Replaying run {replay.run_id} ({len(replay.entries)} archived requests)...")
+    start = time.perf_counter()
+    aggregator = JobAggregator(replay=replay, record_scoring=True)
+    jobs = aggregator.get_jobs()
+    elapsed = time.perf_counter() - start
+
+    print("\n" + "-" * 60)
+    print(f"[OK] {len(jobs)} matches (MIN_SCORE_THRESHOLD={config.MIN_SCORE_THRESHOLD}) in {elapsed:.2f}s")
+    print(f"     {replay.hits} responses replayed, {replay.misses} requests not in the archive")
+    for source, count in Counter(job["source"] for job in jobs).most_common():
+        print(f"     {count:4}  {source}")
+
+    print(f"\nTop {min(args.top, len(jobs))}:")
+    for job in jobs[:args.top]:
+        print(f"  [{job['score']:3}] {job['title']} @ {job['company']}")
+
+    if args.thresholds or args.explain:
+        # Every parsed posting, matched or not, re-scored in one vectorised pass
+        start = time.perf_counter()
+        scores = aggregator.rescore()
+        elapsed = time.perf_counter() - start
+        postings = aggregator.scored_postings
+        print(f"\nBatch re-score of {len(postings)} postings: {elapsed * 1000:.1f}ms")
+        for threshold in args.thresholds or []:
+            print(f"  score >= {threshold:3}: {len(scores.passing(threshold))} postings")
+        for i in scores.passing(config.MIN_SCORE_THRESHOLD)[:args.explain]:
+            print(f"\n  {postings[i]['title']} ({postings[i]['source']})")
+            print("    " + json.dumps(scores.explain(i), ensure_ascii=False))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(jobs, f, indent=1)
+        print(f"\nMatches written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
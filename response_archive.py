@@ -0,0 +1,197 @@
+# response_archive.py
+"""
+Compressed on-disk archive of every board/feed response, and replay from it.
+
+Each run gets its own directory:
+
+    archive/<run_id>/index.jsonl     one JSON line per response
+    archive/<run_id>/<key>.gz        gzip-compressed response body
+
+run_id is the UTC start time (e.g. 20261018T170000Z). Index lines record the
+source (as labelled in the run report), method, URL, status, content type and
+the body file. ReplayArchive answers GET/POST calls from the archive with
+zero network I/O, so keyword or threshold changes can be re-scored in seconds
+(see replay.py). JobAggregator sends no validators while archiving, so every
+board in a run has a full body.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+import requests
+from requests.structures import CaseInsensitiveDict
+import config
+from instrumentation import metrics
+
+
+def normalize_url(url):
+    """The URL as requests would send it, so recorded and replayed keys agree."""
+    try:
+        return requests.Request("GET", url).prepare().url
+    except requests.exceptions.RequestException:
+        return url
+
+
+def request_key(method, url, body=None):
+    """Identifies a request: method, normalised URL and (for POSTs) the body."""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    digest = hashlib.sha1(f"{method.upper()} {normalize_url(url)}\n".encode("utf-8"))
+    digest.update(body or b"")
+    return digest.hexdigest()
+
+
+def new_run_id():
+    return datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def list_runs(root=None):
+    """Archived run ids, oldest first."""
+    root = root or config.ARCHIVE_DIR
+    if not os.path.isdir(root):
+        return []
+    return sorted(
+        name for name in os.listdir(root)
+        if os.path.isfile(os.path.join(root, name, "index.jsonl"))
+    )
+
+
+class ResponseArchive:
+    """Records responses for one run. Safe to call from many threads."""
+
+    def __init__(self, root=None, run_id=None):
+        self.root = root or config.ARCHIVE_DIR
+        self.run_id = run_id or new_run_id()
+        self.path = os.path.join(self.root, self.run_id)
+        os.makedirs(self.path, exist_ok=True)
+        self.lock = threading.Lock()
+        self.count = 0
+
+    def record(self, method, url, body, response):
+        """Stores one response body and its index line."""
+        key = request_key(method, url, body)
+        file_name = f"{key}.gz"
+        content = response.content or b""
+        with gzip.open(os.path.join(self.path, file_name), "wb") as f:
+            f.write(content)
+        entry = {
+            "source": metrics.current_source(),
+            "method": method.upper(),
+            "url": url,
+            "key": key,
+            "status": response.status_code,
+            "content_type": response.headers.get("Content-Type", ""),
+            "file": file_name,
+            "bytes": len(content),
+        }
+        with self.lock:
+            with open(os.path.join(self.path, "index.jsonl"), "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+            self.count += 1
+
+    def requests_hook(self, response, *args, **kwargs):
+        """requests/cloudscraper response hook (records the original request, before redirects)."""
+        request = response.history[0].request if response.history else response.request
+        self.record(request.method, request.url, request.body, response)
+        return response
+
+    def prune(self, keep_runs=None):
+        """Deletes all but the newest keep_runs runs. Returns the number removed."""
+        keep_runs = config.ARCHIVE_KEEP_RUNS if keep_runs is None else keep_runs
+        runs = list_runs(self.root)
+        stale = runs[:-keep_runs] if keep_runs > 0 else runs
+        for run_id in stale:
+            if run_id != self.run_id:
+                shutil.rmtree(os.path.join(self.root, run_id), ignore_errors=True)
+        return len(stale)
+
+
+class ArchivedResponse:
+    """The parts of a requests/curl_cffi response the fetchers use."""
+
+    def __init__(self, url, status_code, content, content_type=""):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = CaseInsensitiveDict({"Content-Type": content_type} if content_type else {})
+        self.cookies = {}
+        self.history = []
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.exceptions.HTTPError(f"{self.status_code} replayed for url: {self.url}", response=self)
+
+
+class ReplayArchive:
+    """Serves GET/POST calls from an archived run instead of the network.
+
+    A 304 (or a request the run didn't make) falls back to the newest earlier
+    run that stored a 200 for the same request, so boards skipped as
+    unchanged still have a body to re-parse. Unknown requests answer 404.
+    """
+
+    def __init__(self, run_id=None, root=None):
+        self.root = root or config.ARCHIVE_DIR
+        runs = list_runs(self.root)
+        if not runs:
+            raise FileNotFoundError(f"No archived runs in {self.root}")
+        if run_id is None:
+            run_id = runs[-1]
+        if run_id not in runs:
+            raise FileNotFoundError(f"Run {run_id} not found in {self.root}")
+        self.run_id = run_id
+        self.entries = {}   # key -> (run_id, index entry); newest usable run wins
+        for run in runs[:runs.index(run_id) + 1]:
+            with open(os.path.join(self.root, run, "index.jsonl"), encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if run == run_id or entry.get("status") == 200:
+                        if entry.get("status") == 304 and entry["key"] in self.entries:
+                            continue  # Keep the earlier body
+                        self.entries[entry["key"]] = (run, entry)
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def request(self, method, url, data=None):
+        found = self.entries.get(request_key(method, url, data))
+        with self.lock:
+            if found is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if found is None:
+            metrics.count("archive.misses")
+            return ArchivedResponse(url, 404, b"", "text/plain")
+        run, entry = found
+        metrics.count("archive.replayed")
+        with gzip.open(os.path.join(self.root, run, entry["file"]), "rb") as f:
+            content = f.read()
+        return ArchivedResponse(url, entry["status"], content, entry.get("content_type", ""))
+
+    # Same call shapes as requests / curl_cffi sessions
+    def get(self, url, **kwargs):
+        return self.request("GET", url)
+
+    def post(self, url, data=None, **kwargs):
+        if data is None and "json" in kwargs:
+            data = json.dumps(kwargs["json"])
+        return self.request("POST", url, data)
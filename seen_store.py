@@ -0,0 +1,139 @@
+# seen_store.py
+"""
+Append-only store of job URLs we have already processed.
+
+The file is plain text, one record per line:
+
+    <first_seen>\t<last_seen>\t<url>
+
+with ISO dates. New URLs (and occasional last-seen refreshes) are appended,
+so the daily commit only adds a few lines instead of rewriting the whole
+list. When a URL appears more than once the last line wins. An in-memory
+dict gives O(1) membership checks. Compaction rewrites the file sorted by URL
+and drops stale entries.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+import config
+
+
+def today():
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+class SeenStore:
+    def __init__(self, path=None, legacy_path=None):
+        self.path = path or config.SEEN_STORE_FILE
+        # "" = nothing to import (stores other than the default one)
+        self.legacy_path = config.LEGACY_SEEN_FILE if legacy_path is None else legacy_path
+        self.index = {}       # url -> [first_seen, last_seen]
+        self.line_count = 0   # lines in the file, including superseded ones
+        self.lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            self._import_legacy()
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) != 3:
+                    continue  # Skip a torn or hand-edited line rather than fail the run
+                first_seen, last_seen, url = parts
+                self.line_count += 1
+                if url in self.index:
+                    # Keep the original first-seen date when a refresh line comes later
+                    first_seen = min(first_seen, self.index[url][0])
+                self.index[url] = [first_seen, last_seen]
+
+    def _import_legacy(self):
+        """One-time migration from the old flat seen_jobs.json list."""
+        if not self.legacy_path or not os.path.exists(self.legacy_path):
+            return
+        try:
+            with open(self.legacy_path, 'r') as f:
+                urls = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            return
+        date = today()
+        for url in urls:
+            self.index[url] = [date, date]
+        self._rewrite()
+        print(f"Imported {len(self.index)} seen jobs from {self.legacy_path} into {self.path}")
+
+    def __contains__(self, url):
+        return url in self.index
+
+    def __len__(self):
+        return len(self.index)
+
+    def urls(self):
+        return list(self.index)
+
+    def _append(self, urls):
+        lines = []
+        for url in sorted(urls):
+            first_seen, last_seen = self.index[url]
+            lines.append(f"{first_seen}\t{last_seen}\t{url}\n")
+        if not lines:
+            return
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.writelines(lines)
+        self.line_count += len(lines)
+
+    def add(self, urls):
+        """Records URLs as seen today. Unknown URLs are appended; known ones are touched."""
+        date = today()
+        with self.lock:
+            new_urls = set()
+            for url in urls:
+                if url and url not in self.index:
+                    self.index[url] = [date, date]
+                    new_urls.add(url)
+            self._append(new_urls)
+        self.touch(urls)
+
+    def touch(self, urls):
+        """Refreshes last_seen for known URLs.
+
+        To keep the log small a refresh is only written when the stored
+        last-seen date is older than config.SEEN_TOUCH_INTERVAL_DAYS.
+        """
+        date = today()
+        cutoff = (datetime.now(timezone.utc).date() - timedelta(days=config.SEEN_TOUCH_INTERVAL_DAYS)).isoformat()
+        with self.lock:
+            touched = set()
+            for url in urls:
+                entry = self.index.get(url)
+                if entry and entry[1] <= cutoff:
+                    entry[1] = date
+                    touched.add(url)
+            self._append(touched)
+
+    def prune(self, max_age_days=None):
+        """Forgets URLs not seen for max_age_days and compacts the file. Returns the count removed."""
+        if max_age_days is None:
+            max_age_days = config.SEEN_MAX_AGE_DAYS
+        cutoff = (datetime.now(timezone.utc).date() - timedelta(days=max_age_days)).isoformat()
+        with self.lock:
+            stale = [url for url, (_, last_seen) in self.index.items() if last_seen < cutoff]
+            for url in stale:
+                del self.index[url]
+            # Rewrite when something was dropped or the log is mostly superseded lines
+            if stale or self.line_count > 2 * len(self.index) + 100:
+                self._rewrite()
+        return len(stale)
+
+    def _rewrite(self):
+        """Writes one line per URL, sorted, replacing the file atomically."""
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for url in sorted(self.index):
+                first_seen, last_seen = self.index[url]
+                f.write(f"{first_seen}\t{last_seen}\t{url}\n")
+        os.replace(tmp_path, self.path)
+        self.line_count = len(self.index)
@@ -1,56 +1,206 @@
 import requests
 import os
+import random
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import config
+import http_client
+from rate_limiter import TokenBucket
+from instrumentation import metrics
+from profiles import parse_chat_ids
 
-def post_to_telegram(jobs):
-    token = os.environ.get("TELEGRAM_TOKEN")
-    chat_id = os.environ.get("TELEGRAM_CHAT_ID")
+DIGEST_SEPARATOR = "\n\n" + "─" * 12 + "\n\n"
 
-    if not token or not chat_id:
-        print("Error: Telegram credentials not found in environment variables.")
-        return
+def format_job(job):
+    """Builds the Markdown message for one job."""
+    # New format with AI analysis
+    ai_score = job.get('ai_score', job.get('score', 0))
+    ai_reasoning = job.get('ai_reasoning', 'No AI analysis available')
+    ai_highlights = job.get('ai_highlights', [])
+    requirements = job.get('ai_requirements', [])
+    
+    # Build requirements section
+    if requirements:
+        req_text = "\n".join([f"  • {req}" for req in requirements[:4]])
+    elif ai_highlights:
+        req_text = "\n".join([f"  • {h}" for h in ai_highlights[:4]])
+    else:
+        req_text = "  • See full listing for details"
+    
+    # Match rating display (stars)
+    stars = "⭐" * min(ai_score, 10) if ai_score else "N/A"
+    
+    return (
+        f"💼 *{job['title']}*\n"
+        f"🏢 {job['company']}\n\n"
+        f"🤖 *AI Analysis:*\n_{ai_reasoning}_\n\n"
+        f"📍 *Location:* {job.get('location', 'Remote')}\n\n"
+        f"📋 *Key Points:*\n{req_text}\n\n"
+        f"🎯 *Match Rating:* {ai_score}/10 {stars}\n\n"
+        f"🔗 [Apply Here]({job['url']})"
+    )
+
+def fit_message(text, limit):
+    """Shortens a job message to `limit` characters by dropping whole blocks.
+
+    A plain cut can end inside a Markdown entity (`*...*`, `[...](...)`), and
+    Telegram rejects the whole message with a 400. Blocks (separated by blank
+    lines) are kept from the top while they fit, and the Apply link is kept.
+    """
+    if len(text) <= limit:
+        return text
+    blocks = text.split("\n\n")
+    head, link = blocks[:-1], blocks[-1]
+    kept = []
+    for block in head:
+        if len("\n\n".join(kept + [block, "…", link])) > limit:
+            break
+        kept.append(block)
+    shortened = "\n\n".join(kept + ["…", link])
+    return shortened if len(shortened) <= limit else "…"
+
+def build_digest(jobs, limit=None):
+    """Packs job messages into as few messages as fit under the size limit.
+
+    Returns a list of (text, jobs_in_message). A single job longer than the
+    limit gets a message of its own, shortened to fit (see fit_message).
+    """
+    limit = limit or config.TELEGRAM_MAX_MESSAGE_CHARS
+    messages = []
+    text, included = "", []
+    for job in jobs:
+        part = fit_message(format_job(job), limit)
+        if included and len(text) + len(DIGEST_SEPARATOR) + len(part) <= limit:
+            text += DIGEST_SEPARATOR + part
+            included.append(job)
+            continue
+        if included:
+            messages.append((text, included))
+        text, included = part, [job]
+    if included:
+        messages.append((text, included))
+    return messages
+
+def describe_error(error):
+    """Short error text that doesn't include the request URL (it contains the bot token)."""
+    response = getattr(error, "response", None)
+    if response is not None:
+        return f"HTTP {response.status_code}"
+    return type(error).__name__
+
+
+class TelegramSender:
+    """Sends messages through one keep-alive session while respecting Telegram's limits.
+
+    A global token bucket caps the bot's total message rate and one bucket per
+    chat caps the rate to each recipient. 429 responses are retried after the
+    `retry_after` Telegram asks for; 5xx and network errors are retried with
+    exponential backoff and jitter.
+    """
 
-    print(f"Posting {len(jobs)} jobs to Telegram...")
-
-    for i, job in enumerate(jobs):
-        # New format with AI analysis
-        ai_score = job.get('ai_score', job.get('score', 0))
-        ai_reasoning = job.get('ai_reasoning', 'No AI analysis available')
-        ai_highlights = job.get('ai_highlights', [])
-        requirements = job.get('ai_requirements', [])
-        
-        # Build requirements section
-        if requirements:
-            req_text = "\n".join([f"  • {req}" for req in requirements[:4]])
-        elif ai_highlights:
-            req_text = "\n".join([f"  • {h}" for h in ai_highlights[:4]])
-        else:
-            req_text = "  • See full listing for details"
-        
-        # Match rating display (stars)
-        stars = "⭐" * min(ai_score, 10) if ai_score else "N/A"
-        
-        message = (
-            f"💼 *{job['title']}*\n"
-            f"🏢 {job['company']}\n\n"
-            f"🤖 *AI Analysis:*\n_{ai_reasoning}_\n\n"
-            f"📍 *Location:* {job.get('location', 'Remote')}\n\n"
-            f"📋 *Key Points:*\n{req_text}\n\n"
-            f"🎯 *Match Rating:* {ai_score}/10 {stars}\n\n"
-            f"🔗 [Apply Here]({job['url']})"
-        )
-
-        url = f"https://api.telegram.org/bot{token}/sendMessage"
+    def __init__(self, token):
+        self.url = f"{config.TELEGRAM_API_BASE}/bot{token}/sendMessage"
+        self.session = http_client.api_session()
+        self.global_bucket = TokenBucket(config.TELEGRAM_GLOBAL_RATE, burst=config.TELEGRAM_GLOBAL_RATE)
+        self.chat_buckets = {}
+        self.lock = threading.Lock()
+
+    def _wait(self, chat_id):
+        with self.lock:
+            bucket = self.chat_buckets.get(chat_id)
+            if bucket is None:
+                bucket = self.chat_buckets[chat_id] = TokenBucket(config.TELEGRAM_CHAT_RATE)
+        # Reserve the chat slot first, then the global one, so a slow chat
+        # doesn't hold global tokens while it waits
+        delay = bucket.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        delay = self.global_bucket.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    def send(self, chat_id, text):
+        """Sends one message. Returns True on success; raises RequestException when retries run out."""
         payload = {
             "chat_id": chat_id,
-            "text": message,
+            "text": text,
             "parse_mode": "Markdown",
             "disable_web_page_preview": True
         }
+        for attempt in range(config.TELEGRAM_MAX_RETRIES + 1):
+            self._wait(chat_id)
+            retry_after = None
+            try:
+                response = self.session.post(self.url, json=payload, timeout=config.HTTP_TIMEOUT)
+                if response.status_code == 429:
+                    try:
+                        retry_after = response.json().get("parameters", {}).get("retry_after")
+                    except ValueError:
+                        retry_after = None
+                    if retry_after is None:
+                        retry_after = response.headers.get("Retry-After")
+                elif response.status_code < 500:
+                    # 2xx is done; other 4xx (bad markup, wrong chat id) won't improve on retry
+                    response.raise_for_status()
+                    return True
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                status = getattr(e.response, "status_code", None)
+                if status is not None and status < 500 and status != 429:
+                    raise
+                if attempt == config.TELEGRAM_MAX_RETRIES:
+                    raise
+                if retry_after is not None:
+                    delay = float(retry_after)
+                else:
+                    delay = config.TELEGRAM_BACKOFF_BASE * (2 ** attempt)
+                delay += random.uniform(0, config.TELEGRAM_BACKOFF_BASE)
+                metrics.count("telegram.retries")
+                print(f"  [RETRY] Telegram chat {chat_id}: {describe_error(e)} - waiting {delay:.1f}s")
+                time.sleep(delay)
+        return False
+
+    def deliver(self, chat_id, messages):
+        """Sends (text, jobs) messages to one chat in order. Returns the number sent."""
+        sent = 0
+        for i, (text, jobs) in enumerate(messages):
+            label = ", ".join(f"{job['title']} @ {job['company']}" for job in jobs)
+            try:
+                self.send(chat_id, text)
+                sent += 1
+                metrics.count("telegram.sent")
+                print(f"  [{chat_id}] [{i+1}/{len(messages)}] Posted: {label}")
+            except requests.exceptions.RequestException as e:
+                metrics.count("telegram.failed")
+                print(f"  [{chat_id}] [{i+1}/{len(messages)}] Failed to send: {describe_error(e)}")
+        return sent
+
+
+def post_to_telegram(jobs, digest=None, chat_ids=None):
+    """Posts jobs to chat_ids (default: the TELEGRAM_CHAT_ID list)."""
+    token = os.environ.get("TELEGRAM_TOKEN")
+    if chat_ids is None:
+        chat_ids = parse_chat_ids(os.environ.get("TELEGRAM_CHAT_ID"))
+
+    if not token or not chat_ids:
+        print("Error: Telegram credentials not found in environment variables.")
+        return
+
+    if digest is None:
+        digest = config.TELEGRAM_DIGEST_MODE
+    if digest:
+        messages = build_digest(jobs)
+    else:
+        messages = [(fit_message(format_job(job), config.TELEGRAM_MAX_MESSAGE_CHARS), [job]) for job in jobs]
+
+    print(f"Posting {len(jobs)} jobs to Telegram "
+          f"({len(messages)} messages x {len(chat_ids)} chats)...")
 
-        try:
-            response = requests.post(url, json=payload)
-            response.raise_for_status()
-            print(f"  [{i+1}/{len(jobs)}] Posted: {job['title']} @ {job['company']}")
-        except requests.exceptions.RequestException as e:
-            print(f"  [{i+1}/{len(jobs)}] Failed to send: {e}")
+    sender = TelegramSender(token)
+    # Chats are independent, so they are served concurrently; messages to
+    # any one chat stay in order.
+    workers = max(1, min(config.TELEGRAM_FANOUT_WORKERS, len(chat_ids)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda chat_id: sender.deliver(chat_id, messages), chat_ids))
@@ -0,0 +1,44 @@
+import condense
+from condense import Condenser, estimate_tokens
+
+DESCRIPTION = (
+    "About the Role: You will lead publicity for our streaming slate. "
+    "Responsibilities: Manage press for our wellness and lifestyle brands. "
+    "Pitch commuter and travel media on new launches. "
+    "Requirements: 5+ years of entertainment publicity experience. "
+    "Familiarity with dental and health trade press is a plus. "
+    "Benefits: Medical, dental and vision insurance. "
+    "We are an equal opportunity employer and consider all applicants without regard to race."
+)
+
+
+def test_benefit_words_are_kept_in_job_sections():
+    sections = Condenser().sections(DESCRIPTION)
+    assert any("wellness" in s for s in sections["responsibilities"])
+    assert any("commuter" in s for s in sections["responsibilities"])
+    assert any("dental" in s for s in sections["requirements"])
+    assert not any("equal opportunity" in s for part in sections.values() for s in part)
+
+
+def test_benefit_words_are_dropped_elsewhere():
+    condenser = Condenser()
+    assert condenser.is_boilerplate("Enjoy generous PTO and a commuter stipend.")
+    assert not condenser.is_boilerplate("Enjoy generous PTO and a commuter stipend.", "responsibilities")
+    assert condenser.is_boilerplate("We are an equal opportunity employer.", "requirements")
+
+
+def test_labels_count_against_the_budget():
+    condenser = Condenser()
+    for budget in (10, 20, 30, 60):
+        assert estimate_tokens(condenser.condense(DESCRIPTION, budget=budget)) <= budget
+
+
+def test_settings_key_follows_config(monkeypatch):
+    before = condense.settings_key()
+    monkeypatch.setattr(condense.config, "CONDENSE_TOKEN_BUDGET", 123)
+    assert condense.settings_key() != before
+
+
+def test_inline_headings_with_apostrophes_are_split():
+    sentences = condense.split_sentences("We make films: What You'll Do Lead press for our slate.")
+    assert sentences == ["We make films:", "What You'll Do Lead press for our slate."]
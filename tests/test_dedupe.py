@@ -0,0 +1,50 @@
+import dedupe
+from dedupe import StreamingDeduper, dedupe_jobs
+
+SHARED_DESCRIPTION = (
+    "Lead publicity campaigns for our theatrical slate, pitch national and trade press, "
+    "manage junket logistics and talent schedules, and write press materials with the team."
+)
+
+
+def job(url, location, source="Disney (Direct)", description="", company="Disney"):
+    return {
+        "title": "Manager, Publicity",
+        "company": company,
+        "location": location,
+        "url": url,
+        "source": source,
+        "description": description,
+        "score": 10,
+    }
+
+
+def test_same_board_two_cities_are_kept_apart():
+    burbank = job("https://disney.wd5.myworkdayjobs.com/job/Burbank/Manager--Publicity_R1", "Burbank, CA")
+    new_york = job("https://disney.wd5.myworkdayjobs.com/job/New-York/Manager--Publicity_R2", "New York, NY")
+    assert len(dedupe_jobs([dict(burbank), dict(new_york)])) == 2
+    deduper = StreamingDeduper()
+    assert len(list(deduper.stream([burbank, new_york]))) == 2
+    assert "duplicate_urls" not in burbank
+
+
+def test_same_board_shared_description_is_kept_apart():
+    a = job("https://boards.greenhouse.io/acme/jobs/1", "Los Angeles, CA", "Acme (Direct)", SHARED_DESCRIPTION, "Acme")
+    b = job("https://boards.greenhouse.io/acme/jobs/2", "New York, NY", "Acme (Direct)", SHARED_DESCRIPTION, "Acme")
+    assert len(dedupe_jobs([a, b])) == 2
+
+
+def test_cross_source_needs_location_or_description():
+    direct = job("https://disney.wd5.myworkdayjobs.com/job/Burbank/Manager--Publicity_R1", "Burbank, CA")
+    muse_elsewhere = job("https://www.themuse.com/jobs/disney/manager-publicity", "New York, NY", "The Muse")
+    muse_same = job("https://www.themuse.com/jobs/disney/manager-publicity-1", "Burbank, California", "The Muse")
+    assert not dedupe._same_posting(direct, muse_elsewhere, None, None)
+    assert dedupe._same_posting(direct, muse_same, None, None)
+
+
+def test_cross_source_copy_is_merged():
+    direct = job("https://boards.greenhouse.io/acme/jobs/1", "Remote", "Acme (Direct)", SHARED_DESCRIPTION, "Acme")
+    copy = job("https://remoteok.com/remote-jobs/1", "Remote", "RemoteOK", SHARED_DESCRIPTION, "Unknown")
+    unique = list(StreamingDeduper().stream([copy, direct]))
+    assert unique == [direct]
+    assert direct["duplicate_urls"] == [copy["url"]]
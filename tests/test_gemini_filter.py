@@ -0,0 +1,50 @@
+import json
+import config
+from google.api_core import exceptions as google_exceptions
+from gemini_filter import GeminiJobFilter
+
+JOBS = [
+    {"title": "Publicist", "company": "Acme", "description": "Lead press.", "url": "https://acme.test/1"},
+    {"title": "Blocked", "company": "Acme", "description": "Blocked posting.", "url": "https://acme.test/2"},
+]
+RESULT = {"score": 8, "recommendation": "SEND", "reasoning": "Good fit", "highlights": [], "requirements": []}
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeModel:
+    def __init__(self, error):
+        self.error = error
+
+    def generate_content(self, prompt, **kwargs):
+        if "### JOB ID" in prompt or "Blocked" in prompt:
+            raise self.error
+        return FakeResponse(json.dumps(RESULT))
+
+
+def run(monkeypatch, error):
+    monkeypatch.setattr(config, "AI_CACHE_ENABLED", False)
+    monkeypatch.setattr(config, "GEMINI_MAX_RETRIES", 0)
+    monkeypatch.setattr(config, "GEMINI_BATCH_SIZE", 2)
+    jobs = [dict(job) for job in JOBS]
+    gemini = GeminiJobFilter(api_key="test")
+    gemini.model = FakeModel(error)
+    gemini.limiter.wait = lambda: None
+    passed = gemini.filter_jobs(jobs, min_score=7)
+    return jobs, passed
+
+
+def test_permanent_failure_is_not_retried_next_run(monkeypatch):
+    jobs, passed = run(monkeypatch, google_exceptions.InvalidArgument("prompt blocked"))
+    # The batch falls back to one call per job, so only the blocked posting fails
+    assert [job["url"] for job in passed] == [JOBS[0]["url"]]
+    assert not any(job.get("ai_failed") for job in jobs)
+
+
+def test_transient_failure_is_retried_next_run(monkeypatch):
+    jobs, passed = run(monkeypatch, google_exceptions.ServiceUnavailable("overloaded"))
+    assert passed == []
+    assert all(job.get("ai_failed") for job in jobs)
@@ -0,0 +1,67 @@
+import json
+import config
+import http_client
+from aggregator import JobAggregator
+
+BOARD = "https://boards.greenhouse.io/acme"
+POSTINGS = {"jobs": [{
+    "id": 1,
+    "title": "Director of Public Relations",
+    "location": {"name": "Los Angeles, CA"},
+    "content": "Lead public relations and media relations for our entertainment brands.",
+    "absolute_url": "https://boards.greenhouse.io/acme/jobs/1",
+}]}
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None):
+        self.status_code = status_code
+        self.headers = {"ETag": '"v1"'} if status_code == 200 else {}
+        self.text = json.dumps(body) if body is not None else ""
+        self.content = self.text.encode("utf-8")
+
+    def json(self):
+        return json.loads(self.text)
+
+
+def fake_get(url, headers=None, **kwargs):
+    if (headers or {}).get("If-None-Match") == '"v1"':
+        return FakeResponse(304)
+    return FakeResponse(200, POSTINGS)
+
+
+def run(monkeypatch):
+    """One scrape of the board; returns (aggregator, jobs)."""
+    aggregator = JobAggregator()
+    aggregator.rate_limiter.wait = lambda url: None
+    monkeypatch.setattr(aggregator, "source_tasks", lambda: [lambda: aggregator.fetch_greenhouse(BOARD, "Acme")])
+    return aggregator, aggregator.get_jobs(concurrent=False)
+
+
+def setup(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "HTTP_CACHE_ENABLED", True)
+    monkeypatch.setattr(config, "HTTP_CACHE_FILE", str(tmp_path / "http_cache.json"))
+    monkeypatch.setattr(http_client, "get", fake_get)
+
+
+def test_delivered_board_answers_304_next_run(monkeypatch, tmp_path):
+    setup(monkeypatch, tmp_path)
+    aggregator, jobs = run(monkeypatch)
+    assert len(jobs) == 1
+    aggregator.save_http_cache()
+    assert run(monkeypatch)[1] == []
+
+
+def test_failed_job_comes_back_after_a_304_run(monkeypatch, tmp_path):
+    setup(monkeypatch, tmp_path)
+    aggregator, jobs = run(monkeypatch)
+    jobs[0]["ai_failed"] = True
+    aggregator.save_http_cache([jobs[0]])
+    # The board is fetched in full again, so the job is evaluated this time
+    assert [job["url"] for job in run(monkeypatch)[1]] == [POSTINGS["jobs"][0]["absolute_url"]]
+
+
+def test_validators_are_not_saved_before_delivery(monkeypatch, tmp_path):
+    setup(monkeypatch, tmp_path)
+    run(monkeypatch)
+    assert not (tmp_path / "http_cache.json").exists()
@@ -0,0 +1,49 @@
+import config
+import http_client
+from aggregator import JobAggregator
+
+API_URL = "https://api.lever.co/v0/postings/acme"
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None):
+        self.status_code = status_code
+        self.body = body
+        self.headers = {}
+
+    def json(self):
+        if isinstance(self.body, Exception):
+            raise self.body
+        return self.body
+
+
+def aggregator():
+    agg = JobAggregator()
+    agg.rate_limiter.wait = lambda url: None
+    return agg
+
+
+def test_salary_range_with_bad_values_falls_back_to_text():
+    agg = aggregator()
+    assert agg.lever_salary({"salaryRange": {"min": 90000, "max": 120000, "interval": "per-year-salary"}}, "") \
+        == "$90,000 - $120,000 per year salary"
+    assert agg.lever_salary({"salaryRange": {"min": "n/a", "max": None, "interval": None}}, "") \
+        == agg.extract_salary(" ")
+    assert agg.lever_salary({"salaryRange": "competitive"}, "") == agg.extract_salary(" ")
+
+
+def test_failed_later_page_keeps_earlier_pages(monkeypatch):
+    monkeypatch.setattr(config, "LEVER_PAGE_SIZE", 2)
+    page = [{"id": 1}, {"id": 2}]
+    monkeypatch.setattr(http_client, "get", lambda url, **kwargs: (
+        FakeResponse(200, page) if "skip=0" in url else FakeResponse(200, ValueError("bad JSON"))))
+    status, postings = aggregator().fetch_lever_postings(API_URL)
+    assert (status, postings) == (200, page)
+
+
+def test_pages_are_capped(monkeypatch):
+    monkeypatch.setattr(config, "LEVER_PAGE_SIZE", 1)
+    monkeypatch.setattr(config, "LEVER_MAX_PAGES", 3)
+    monkeypatch.setattr(http_client, "get", lambda url, **kwargs: FakeResponse(200, [{"url": url}]))
+    status, postings = aggregator().fetch_lever_postings(API_URL)
+    assert len(postings) == 3
@@ -0,0 +1,18 @@
+from relevance import RelevanceRanker
+
+PROFILE = "Public relations and publicity leader for film and entertainment.\nNOT looking for: software engineering"
+
+
+def job(title):
+    return {"title": title, "company": "Acme", "description": ""}
+
+
+def test_only_top_k_overflow_stays_unseen():
+    jobs = [job("Film Publicity Director"), job("Entertainment Public Relations Manager"), job("Software Engineer")]
+    kept, dropped = RelevanceRanker(PROFILE).select(jobs, top_k=1, min_score=0.01)
+    assert len(kept) == 1
+    overflow = [j for j in dropped if j["relevance"] >= 0.01]
+    rejects = [j for j in dropped if j["relevance"] < 0.01]
+    assert overflow and rejects
+    assert all(j.get("prefilter_dropped") for j in overflow)
+    assert not any(j.get("prefilter_dropped") for j in rejects)
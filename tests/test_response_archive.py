@@ -0,0 +1,33 @@
+import config
+import http_client
+from aggregator import JobAggregator
+from response_archive import ResponseArchive
+
+URL = "https://boards-api.greenhouse.io/v1/boards/acme/jobs?content=true"
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {"ETag": '"v1"'}
+    content = b"{}"
+
+
+def test_archived_runs_send_no_validators(monkeypatch, tmp_path):
+    monkeypatch.setattr(config, "HTTP_CACHE_ENABLED", True)
+    monkeypatch.setattr(config, "HTTP_CACHE_FILE", str(tmp_path / "http_cache.json"))
+    sent = []
+    monkeypatch.setattr(http_client, "get", lambda url, headers=None, **kwargs: sent.append(headers) or FakeResponse())
+
+    plain = JobAggregator()
+    plain.http_cache.store(URL, FakeResponse())
+    plain.conditional_get(URL)
+    assert sent[-1].get("If-None-Match") == '"v1"'
+
+    archived = JobAggregator(archive=ResponseArchive(root=str(tmp_path / "archive")))
+    try:
+        archived.http_cache.store(URL, FakeResponse())
+        archived.conditional_get(URL)
+        # A 304 would leave the archive without a body to replay
+        assert "If-None-Match" not in sent[-1]
+    finally:
+        http_client.set_archive(None)
@@ -0,0 +1,37 @@
+from telegram_poster import build_digest, fit_message, format_job
+from profiles import Profile, parse_chat_ids
+
+
+def job(n, reasoning="Strong fit."):
+    return {
+        "title": f"Publicist {n}", "company": "Acme", "url": f"https://example.com/jobs/{n}",
+        "location": "Los Angeles, CA", "ai_score": 8, "ai_reasoning": reasoning,
+        "ai_requirements": ["5+ years of publicity", "Film press contacts"],
+    }
+
+
+def balanced(text):
+    """Markdown entities Telegram would reject if left open."""
+    return text.count("*") % 2 == 0 and text.count("_") % 2 == 0 and text.count("[") == text.count("](")
+
+
+def test_long_job_is_shortened_at_block_boundaries():
+    text = format_job(job(1, reasoning="word " * 400))
+    limit = len(text) // 2
+    shortened = fit_message(text, limit)
+    assert len(shortened) <= limit
+    assert balanced(shortened)
+    assert shortened.endswith("(https://example.com/jobs/1)")
+
+
+def test_digest_messages_stay_under_the_limit():
+    jobs = [job(1, reasoning="word " * 400), job(2), job(3)]
+    for text, _ in build_digest(jobs, limit=900):
+        assert len(text) <= 900
+        assert balanced(text)
+
+
+def test_chat_ids_share_one_parser(monkeypatch):
+    assert parse_chat_ids(" 123, -456 ,,") == ["123", "-456"]
+    monkeypatch.setenv("CHAT_TEST", "1,2")
+    assert Profile("p", telegram_chat_env="CHAT_TEST").chat_ids() == ["1", "2"]
@@ -0,0 +1,57 @@
+import json
+import config
+import http_client
+from aggregator import JobAggregator
+
+API_URL = "https://acme.wd5.myworkdayjobs.com/wday/cxs/acme/careers/jobs"
+
+
+class FakeResponse:
+    status_code = 200
+    content = b""
+
+    def __init__(self, body):
+        self.body = body
+
+    def json(self):
+        return self.body
+
+
+class FakeSession:
+    """Careers-page warm-up: no network, no cookies."""
+    cookies = {}
+
+    def get(self, url, **kwargs):
+        return FakeResponse({})
+
+
+def fake_post(url, data=None, **kwargs):
+    payload = json.loads(data)
+    offset = payload["offset"]
+    if offset == config.WORKDAY_PAGE_SIZE:
+        raise TimeoutError("page timed out")
+    if payload.get("searchText") == "broken":
+        raise ValueError("bad JSON")
+    postings = [{"title": f"Publicist {payload.get('searchText')} {offset}", "externalPath": f"/job/{payload.get('searchText')}/{offset}"}]
+    return FakeResponse({"total": config.WORKDAY_PAGE_SIZE * 3, "jobPostings": postings})
+
+
+def test_failed_page_keeps_the_other_pages(monkeypatch):
+    monkeypatch.setattr(http_client, "post", fake_post)
+    aggregator = JobAggregator()
+    aggregator.rate_limiter.wait = lambda url: None
+    postings = aggregator.fetch_workday_postings(API_URL, "pr")
+    offsets = [posting["externalPath"].rsplit("/", 1)[1] for posting in postings]
+    assert offsets == ["0", str(config.WORKDAY_PAGE_SIZE * 2)]
+
+
+def test_failed_search_keeps_the_other_searches(monkeypatch):
+    monkeypatch.setattr(http_client, "post", fake_post)
+    monkeypatch.setattr(http_client, "browser_session", FakeSession)
+    monkeypatch.setattr(http_client, "get", lambda url, **kwargs: FakeResponse({}))
+    aggregator = JobAggregator()
+    aggregator.rate_limiter.wait = lambda url: None
+    seen = []
+    monkeypatch.setattr(aggregator, "score_job", lambda title, text, boost=0: (seen.append(title) or 100, "N/A"))
+    aggregator.fetch_workday(API_URL, "Acme", "https://acme.wd5.myworkdayjobs.com", ["broken", "pr"])
+    assert seen == ["Publicist pr 0", f"Publicist pr {config.WORKDAY_PAGE_SIZE * 2}"]